@@ -1,6 +1,6 @@
 import os, threading, time, uuid, json, re
-from json import load
 from utils.config_loader import CONFIG_MANAGER
+from utils.process_registry import normalize_process_name
 from utils.project_metadata import get_project_version
 from utils.notifications import notify_event
 from utils.runtime_paths import pyproject_file
@@ -10,13 +10,7 @@ class APIState:
     def __init__(self, process_handler, logger):
         self.logger = logger
         self.process_handler = process_handler
-        self.status_file_path = "/healthcheck/running_processes.json"
-        os.makedirs(os.path.dirname(self.status_file_path), exist_ok=True)
-        self._status_cache = {}
-        self._status_mtime = None
-        self.service_status = self._load_status_from_file()
-        self._status_cache = self.service_status
-        self._status_mtime = self._get_status_mtime()
+        self.process_registry = process_handler.process_registry
         self.shutdown_in_progress = set()
         self._update_cache = {}
         self._update_cache_lock = threading.Lock()
@@ -34,7 +28,7 @@ class APIState:
         self._symlink_job_cache_lock = threading.Lock()
 
     def _normalize_process_name(self, value):
-        return str(value or "").replace(" ", "").replace("/ ", "/").strip().lower()
+        return normalize_process_name(value)
 
     def _load_update_notices(self):
         try:
@@ -528,49 +522,18 @@ class APIState:
             )
             return dict(candidates[0])
 
-    def _get_status_mtime(self):
-        try:
-            return os.path.getmtime(self.status_file_path)
-        except FileNotFoundError:
-            return None
+    def _running_snapshot(self):
+        return self.process_registry.snapshot()[1]
 
-    def _load_status_from_file(self):
-        try:
-            with open(self.status_file_path, "r") as f:
-                data = load(f)
-                return data
-        except FileNotFoundError:
-            self.logger.debug(
-                f"Status file {self.status_file_path} not found. Initializing empty status."
-            )
-            with open(self.status_file_path, "w") as f:
-                f.write("{}")
-            return {}
-        except Exception as e:
-            self.logger.error(f"Error loading status file: {e}")
-            return {}
-
-    def _refresh_status_cache(self):
-        mtime = self._get_status_mtime()
-        if mtime is not None and mtime == self._status_mtime:
-            return self._status_cache
-        data = self._load_status_from_file()
-        self._status_cache = data
-        self._status_mtime = self._get_status_mtime()
-        return data
+    def _lookup_running(self, process_name):
+        return self.process_registry.lookup(process_name)
 
     def get_status(self, process_name):
-        running_processes = self._refresh_status_cache()
-
-        def normalize(name):
-            return name.replace(" ", "").replace("/ ", "/").strip().lower()
-
-        normalized_input = normalize(process_name)
+        normalized_input = self._normalize_process_name(process_name)
         if normalized_input == "dumbapi" or normalized_input == "dmbapi":
             return "running"
-        for stored_name in running_processes:
-            if normalized_input == normalize(stored_name):
-                return "running"
+        if self._lookup_running(process_name) is not None:
+            return "running"
         if normalized_input in {"plexdbrepair", "dbrepair"}:
             plex_cfg = CONFIG_MANAGER.get("plex", {}) or {}
             if plex_cfg.get("dbrepair", {}).get("enabled"):
@@ -578,18 +541,10 @@ class APIState:
         return "stopped"
 
     def get_running_processes(self):
-        running_processes = self._refresh_status_cache()
-        if isinstance(running_processes, dict):
-            return list(running_processes.keys())
-        return []
+        return self.process_registry.names()
 
     def get_status_details(self, process_name, include_health=False):
-        running_processes = self._refresh_status_cache()
-
-        def normalize(name):
-            return name.replace(" ", "").replace("/ ", "/").strip().lower()
-
-        normalized_input = normalize(process_name)
+        normalized_input = self._normalize_process_name(process_name)
         status = "stopped"
         matched_name = None
         pid = None
@@ -603,12 +558,10 @@ class APIState:
             if plex_cfg.get("dbrepair", {}).get("enabled"):
                 status = "idle"
         else:
-            for stored_name, stored_pid in running_processes.items():
-                if normalized_input == normalize(stored_name):
-                    status = "running"
-                    matched_name = stored_name
-                    pid = stored_pid
-                    break
+            match = self._lookup_running(process_name)
+            if match is not None:
+                status = "running"
+                matched_name, pid = match
 
         if not include_health:
             return {"status": status}
@@ -627,9 +580,7 @@ class APIState:
         }
 
     def get_running_status_snapshot(self, include_health=False):
-        running_processes = self._refresh_status_cache()
-        if not isinstance(running_processes, dict):
-            return []
+        running_processes = self._running_snapshot()
         if not include_health:
             return list(running_processes.keys())
         snapshot = []
@@ -680,4 +631,4 @@ class APIState:
         }
 
     def debug_state(self):
-        self.logger.info(f"Current APIState: {self.service_status}")
+        self.logger.info(f"Current APIState: {self._running_snapshot()}")
@@ -0,0 +1,338 @@
+import asyncio
+import json
+import os
+
+from api.routers.logs import (
+    _bounded_log_start,
+    _log_file_id,
+    _read_complete_chunk_from_handle,
+)
+from utils.inotify import (
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_DELETE,
+    IN_MODIFY,
+    IN_MOVED_FROM,
+    IN_MOVED_TO,
+    IN_Q_OVERFLOW,
+    Inotify,
+)
+from utils.logger import redact_sensitive_log_data
+
+_WATCH_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+)
+# inotify does not see writes made through some network and FUSE mounts, so
+# followed files are also re-checked on a slow timer. Without inotify the
+# timer is the only trigger and runs faster.
+_POLL_INTERVAL_SEC = 5.0
+_FALLBACK_POLL_INTERVAL_SEC = 1.0
+_MAX_CHUNK_BYTES = 1024 * 1024
+_START_SCAN_BYTES = 64 * 1024
+
+
+class _LogFollower:
+    """Open handle and read cursor for one followed log file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.directory = os.path.dirname(path)
+        self.name = os.path.basename(path)
+        self.subscribers = {}
+        # Viewers between lookup and registration; keeps the follower alive.
+        self.joining = 0
+        self.lock = asyncio.Lock()
+        self.pending = False
+        self.file_id = None
+        self.cursor = 0
+        self._file = None
+
+    def open(self, at_end=True):
+        try:
+            f = open(self.path, "rb")
+        except OSError:
+            self._file = None
+            self.file_id = None
+            self.cursor = 0
+            return
+        stat = os.fstat(f.fileno())
+        self._file = f
+        self.file_id = _log_file_id(stat)
+        self.cursor = _last_line_end(f, stat.st_size) if at_end else 0
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def catch_up(self, cursor=None, file_id=None, tail_bytes=131072):
+        """Return the chunk a new viewer needs to reach the shared cursor."""
+        if self._file is None:
+            return _chunk_message(b"", 0, 0, None, reset=True)
+        if cursor is None or file_id != self.file_id:
+            start, reset = max(0, self.cursor - tail_bytes), True
+        else:
+            start, reset = _bounded_log_start(self.cursor, cursor, tail_bytes)
+        data, end = _read_complete_chunk_from_handle(self._file, start, self.cursor)
+        size = os.fstat(self._file.fileno()).st_size
+        return _chunk_message(data, end, size, self.file_id, reset=reset)
+
+    def read_new(self):
+        """Return chunk messages for lines completed since the last read.
+
+        Rotation is detected by comparing the path's current ``_log_file_id``
+        with the open handle: the old generation is drained to its last
+        complete line before the new file is followed from its start.
+        """
+        try:
+            current_id = _log_file_id(os.stat(self.path))
+        except OSError:
+            current_id = None
+        if self._file is None:
+            if current_id is None:
+                return []
+            self.open(at_end=False)
+            return self._drain(rotated=True)
+
+        rotated = False
+        if os.fstat(self._file.fileno()).st_size < self.cursor:
+            # Truncated in place (copytruncate): follow from the start again.
+            self.cursor = 0
+            rotated = True
+        messages = self._drain(rotated=rotated)
+        if current_id is not None and current_id != self.file_id:
+            self.close()
+            self.open(at_end=False)
+            messages.extend(self._drain(rotated=True))
+        return messages
+
+    def _drain(self, rotated=False):
+        messages = []
+        if self._file is None:
+            return messages
+        size = os.fstat(self._file.fileno()).st_size
+        while self.cursor < size:
+            limit = min(size, self.cursor + _MAX_CHUNK_BYTES)
+            data, end = _read_complete_chunk_from_handle(self._file, self.cursor, limit)
+            if end == self.cursor and limit < size:
+                # A single line longer than the chunk cap; read it whole.
+                data, end = _read_complete_chunk_from_handle(
+                    self._file, self.cursor, size
+                )
+            if end == self.cursor:
+                break
+            self.cursor = end
+            messages.append(
+                _chunk_message(data, end, size, self.file_id, rotated=rotated)
+            )
+            rotated = False
+        if rotated:
+            messages.append(
+                _chunk_message(b"", self.cursor, size, self.file_id, rotated=True)
+            )
+        return messages
+
+
+class LogFollowerHub:
+    """Share one watcher and one read per followed log file across viewers.
+
+    Viewers subscribe with an async ``send(message) -> bool`` callable. New
+    complete lines are read once, redacted and encoded once, then pushed to
+    every viewer of that file.
+    """
+
+    def __init__(self, poll_interval=_POLL_INTERVAL_SEC):
+        self.poll_interval = poll_interval
+        self._followers = {}
+        self._lock = asyncio.Lock()
+        self._inotify = None
+        self._inotify_failed = False
+        self._watches = {}
+        self._watch_dirs = {}
+        self._poll_task = None
+        self._tasks = set()
+
+    async def subscribe(
+        self, path, key, send, cursor=None, file_id=None, tail_bytes=131072
+    ):
+        """Follow ``path`` for ``key`` after sending it a catch-up chunk.
+
+        Returns ``False`` when the catch-up message could not be delivered.
+        """
+        path = os.path.abspath(str(path))
+        async with self._lock:
+            follower = self._followers.get(path)
+            if follower is None:
+                follower = _LogFollower(path)
+                await asyncio.to_thread(follower.open)
+                self._followers[path] = follower
+                self._watch(follower)
+            follower.joining += 1
+        subscribed = False
+        try:
+            async with follower.lock:
+                await self._refresh(follower)
+                message = await asyncio.to_thread(
+                    follower.catch_up, cursor, file_id, tail_bytes
+                )
+                if await send(json.dumps(message)):
+                    follower.subscribers[key] = send
+                    subscribed = True
+        finally:
+            async with self._lock:
+                follower.joining -= 1
+            if not subscribed:
+                await self._release_if_idle(path, follower)
+        if subscribed:
+            self._ensure_poller()
+        return subscribed
+
+    async def unsubscribe(self, path, key):
+        path = os.path.abspath(str(path))
+        async with self._lock:
+            follower = self._followers.get(path)
+            if follower is None:
+                return
+            follower.subscribers.pop(key, None)
+        await self._release_if_idle(path, follower)
+
+    async def _release_if_idle(self, path, follower):
+        async with self._lock:
+            if (
+                follower.subscribers
+                or follower.joining
+                or self._followers.get(path) is not follower
+            ):
+                return
+            del self._followers[path]
+            self._unwatch(follower)
+        async with follower.lock:
+            follower.close()
+
+    def status(self):
+        return {
+            "files": len(self._followers),
+            "viewers": sum(len(f.subscribers) for f in self._followers.values()),
+            "inotify": self._inotify is not None,
+        }
+
+    async def _refresh(self, follower):
+        follower.pending = False
+        messages = await asyncio.to_thread(follower.read_new)
+        for message in messages:
+            if not follower.subscribers:
+                return
+            encoded = json.dumps(message)
+            keys = list(follower.subscribers)
+            results = await asyncio.gather(
+                *(follower.subscribers[key](encoded) for key in keys)
+            )
+            for key, sent in zip(keys, results):
+                if not sent:
+                    follower.subscribers.pop(key, None)
+
+    async def _refresh_locked(self, follower):
+        async with follower.lock:
+            if self._followers.get(follower.path) is follower:
+                await self._refresh(follower)
+
+    def _schedule(self, followers):
+        for follower in followers:
+            if follower.pending:
+                continue
+            follower.pending = True
+            task = asyncio.get_running_loop().create_task(
+                self._refresh_locked(follower)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _ensure_poller(self):
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.get_running_loop().create_task(self._poll())
+
+    async def _poll(self):
+        while self._followers:
+            interval = (
+                self.poll_interval
+                if self._inotify is not None
+                else min(self.poll_interval, _FALLBACK_POLL_INTERVAL_SEC)
+            )
+            await asyncio.sleep(interval)
+            self._schedule(list(self._followers.values()))
+
+    def _watch(self, follower):
+        inotify = self._get_inotify()
+        if inotify is None:
+            return
+        watch = self._watches.get(follower.directory)
+        if watch is None:
+            try:
+                wd = inotify.add_watch(follower.directory, _WATCH_MASK)
+            except OSError:
+                return
+            watch = self._watches[follower.directory] = [wd, 0]
+            self._watch_dirs[wd] = follower.directory
+        watch[1] += 1
+
+    def _unwatch(self, follower):
+        watch = self._watches.get(follower.directory)
+        if watch is None:
+            return
+        watch[1] -= 1
+        if watch[1] > 0:
+            return
+        del self._watches[follower.directory]
+        self._watch_dirs.pop(watch[0], None)
+        self._inotify.rm_watch(watch[0])
+        if not self._watches:
+            asyncio.get_running_loop().remove_reader(self._inotify.fileno())
+            self._inotify.close()
+            self._inotify = None
+
+    def _get_inotify(self):
+        if self._inotify is None and not self._inotify_failed:
+            try:
+                inotify = Inotify()
+            except OSError:
+                self._inotify_failed = True
+                return None
+            asyncio.get_running_loop().add_reader(
+                inotify.fileno(), self._on_inotify_events
+            )
+            self._inotify = inotify
+        return self._inotify
+
+    def _on_inotify_events(self):
+        if self._inotify is None:
+            return
+        dirty = set()
+        for wd, mask, name in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW:
+                dirty.update(self._followers.values())
+                continue
+            directory = self._watch_dirs.get(wd)
+            for follower in self._followers.values():
+                if follower.directory == directory and follower.name == name:
+                    dirty.add(follower)
+        self._schedule(dirty)
+
+
+def _last_line_end(f, size):
+    start = max(0, size - _START_SCAN_BYTES)
+    f.seek(start)
+    data = f.read(size - start)
+    newline = data.rfind(b"\n")
+    return start + newline + 1 if newline >= 0 else start
+
+
+def _chunk_message(data, cursor, size, file_id, reset=False, rotated=False):
+    return {
+        "type": "chunk",
+        "size": size,
+        "cursor": cursor,
+        "chunk": redact_sensitive_log_data(data.decode("utf-8", "replace")),
+        "reset": reset,
+        "rotated": rotated,
+        "file_id": file_id,
+    }
@@ -3,9 +3,10 @@ from pathlib import Path
 from pydantic import BaseModel
 from typing import Optional
 from utils.dependencies import get_logger, resolve_path, get_optional_current_user
+from utils.log_index import get_log_index
 from utils.logger import redact_sensitive_log_data
 from utils.config_loader import CONFIG_MANAGER
-import os, re, asyncio
+import os, asyncio
 
 logs_router = APIRouter()
 
@@ -103,22 +104,15 @@ def find_log_file(process_name: str, logger):
 def filter_dumb_log(log_path, logger):
     logger.debug(f"Filtering DUMB log for latest startup from {log_path}")
     try:
-        with open(log_path, "r") as log_file:
-            lines = log_file.readlines()
-
-        for i in range(len(lines) - 1, -1, -1):
-            if i + 2 < len(lines):
-                try:
-                    if re.match(r"^.* - INFO - ", lines[i]) and re.match(
-                        r"^\s*DDDDDDDDDDDDD", lines[i + 2]
-                    ):
-                        logger.debug(f"Found latest DUMB startup banner at line {i}")
-                        return "".join(lines[i:])
-                except Exception as e:
-                    logger.warning(f"Error matching log lines at index {i}: {e}")
-
-        logger.warning("No DUMB startup banner found; returning full log")
-        return "".join(lines)
+        index = get_log_index(log_path)
+        banner = index.latest_banner()
+        with open(log_path, "rb") as log_file:
+            if banner and _log_file_id(os.fstat(log_file.fileno())) == index.file_id:
+                logger.debug(f"Found latest DUMB startup banner at line {banner[0]}")
+                log_file.seek(banner[1])
+            else:
+                logger.warning("No DUMB startup banner found; returning full log")
+            return log_file.read().decode("utf-8", "replace")
 
     except Exception as e:
         logger.error(f"Error filtering DUMB log file: {e}")
@@ -270,3 +264,63 @@ async def get_log_file(
         result["log"] = result.get("chunk", "")
 
     return result
+
+
+@logs_router.get("/lines")
+async def get_log_lines(
+    process_name: str = Query(..., description="The process name"),
+    start_line: int | None = Query(
+        None,
+        ge=0,
+        description="First line to return; defaults to the last page",
+    ),
+    count: int = Query(500, ge=1, le=5000, description="Maximum lines to return"),
+    level: str | None = Query(
+        None,
+        max_length=16,
+        description="Only return lines logged at this level, e.g. ERROR",
+    ),
+    latest_startup: bool = Query(
+        False, description="Start at the latest DUMB startup banner"
+    ),
+    logger=Depends(get_logger),
+    current_user: str = Depends(get_optional_current_user),
+):
+    """Page through a log by line number using its sidecar line index."""
+
+    def work():
+        log_path = find_log_file(process_name, logger)
+        if not log_path or not log_path.exists():
+            return {
+                "process_name": process_name,
+                "lines": [],
+                "start_line": 0,
+                "next_line": None,
+                "size": 0,
+                "line_count": 0,
+                "level_counts": {},
+                "banners": [],
+                "file_id": None,
+            }
+        index = get_log_index(log_path)
+        summary = index.summary()
+        first = start_line
+        banner = index.latest_banner() if latest_startup else None
+        if first is None and banner:
+            first = banner[0]
+        if first is None:
+            first = 0 if level else max(0, summary["line_count"] - count)
+        normalized_level = level.strip().upper() if level else None
+        lines = index.read_lines(first, count, level=normalized_level)
+        return {
+            "process_name": process_name,
+            "lines": [
+                {"line": number, "text": redact_sensitive_log_data(text)}
+                for number, text in lines
+            ],
+            "start_line": first,
+            "next_line": lines[-1][0] + 1 if len(lines) == count else None,
+            **summary,
+        }
+
+    return await asyncio.get_running_loop().run_in_executor(None, work)
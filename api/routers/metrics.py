@@ -9,7 +9,7 @@ from utils.dependencies import (
     get_process_handler,
 )
 from utils.config_loader import CONFIG_MANAGER
-from utils.metrics_history_reader import prepare_history_series
+from utils.metrics_history_store import normalize_series_fields
 from utils.metrics_postgres import (
     MetricsPostgresActivationError,
     activate_metrics_postgresql,
@@ -76,13 +76,22 @@ async def get_database_health(
         )
         if not process_name or service_id:
             collector.database_health.invalidate(service_id)
-    result = collector.database_health.snapshot(
+    return await run_in_threadpool(
+        collector.database_health.snapshot,
         CONFIG_MANAGER.config,
         details=True,
         refresh_if_stale=True,
         process_name=process_name,
+        wait_for_refresh=refresh,
     )
-    return result
+
+
+@metrics_router.get("/health-probes")
+async def get_health_probe_latency(
+    process_handler=Depends(get_process_handler),
+    current_user: str = Depends(get_optional_current_user),
+):
+    return process_handler.service_health_monitor.latency_snapshot()
 
 
 @metrics_router.get("/plex-status")
@@ -129,28 +138,27 @@ async def get_metrics_history_series(
     limit: int = Query(default=5000),
     bucket_seconds: int | None = Query(default=None),
     max_points: int = Query(default=600),
+    fields: str | None = Query(default=None),
     history_manager=Depends(get_metrics_history_manager),
     current_user: str = Depends(get_optional_current_user),
 ):
     if since is None and not full:
         since = time.time() - (6 * 60 * 60)
 
-    items, truncated = await run_in_threadpool(
-        history_manager.read,
-        since=since,
-        full=full,
-        limit=limit,
-        default_hours=6,
-    )
+    if fields:
+        try:
+            fields = normalize_series_fields(fields)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from None
     items, series, truncated, stats, bucket_seconds = await run_in_threadpool(
-        prepare_history_series,
-        items,
-        truncated=truncated,
+        history_manager.read_history_series,
         since=since,
         full=full,
+        limit=limit,
         default_hours=6,
         bucket_seconds=bucket_seconds,
         max_points=max_points,
+        fields=fields,
     )
     timestamps = [item.get("timestamp") for item in items]
     return {
@@ -1,8 +1,18 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from utils.dependencies import get_websocket_manager, get_websocket_current_user
+from fastapi.concurrency import run_in_threadpool
+from api.connection_manager import ConnectionManager
+from api.log_follower import LogFollowerHub
+from api.routers.logs import find_log_file
+from utils.dependencies import (
+    get_logger,
+    get_websocket_manager,
+    get_websocket_current_user,
+)
 import json
 
 websocket_router = APIRouter()
+_follow_manager = ConnectionManager()
+_log_followers = LogFollowerHub()
 
 
 @websocket_router.websocket("/logs")
@@ -13,21 +23,89 @@ async def websocket_logs(
 ):
     await websocket_manager.connect(websocket)
     try:
-        while True:
-            data = await websocket.receive_text()
-            if data == "ping":
-                if not await websocket_manager.send(websocket, "pong"):
-                    break
-                continue
-            if data and data[0] == "{":
-                try:
-                    payload = json.loads(data)
-                except json.JSONDecodeError:
-                    continue
-                if payload.get("type") == "ping":
-                    if not await websocket_manager.send(websocket, "pong"):
-                        break
+        await _receive_pings(websocket, websocket_manager)
     except WebSocketDisconnect:
         pass
     finally:
         await websocket_manager.disconnect(websocket)
+
+
+@websocket_router.websocket("/logs/follow")
+async def websocket_follow_log(
+    websocket: WebSocket,
+    logger=Depends(get_logger),
+    current_user: str = Depends(get_websocket_current_user),
+):
+    """Push new complete lines of a service log file as they are written.
+
+    Query parameters mirror ``GET /logs``: ``process_name``, and optionally
+    ``cursor``/``file_id`` from a previous response plus ``tail_bytes``. The
+    first message catches the viewer up; later ``chunk`` messages append.
+    """
+    process_name = websocket.query_params.get("process_name") or ""
+    cursor = _parse_int(websocket.query_params.get("cursor"))
+    file_id = (websocket.query_params.get("file_id") or "")[:128] or None
+    tail_bytes = _parse_int(websocket.query_params.get("tail_bytes"), 131072)
+    tail_bytes = max(1024, min(tail_bytes, 8_388_608))
+
+    await _follow_manager.connect(websocket)
+    log_path = None
+    try:
+        if process_name:
+            log_path = await run_in_threadpool(find_log_file, process_name, logger)
+        if not log_path or not log_path.exists():
+            log_path = None
+            await _follow_manager.send(
+                websocket,
+                json.dumps(
+                    {
+                        "type": "error",
+                        "process_name": process_name,
+                        "detail": "Log file not found",
+                    }
+                ),
+            )
+            await websocket.close()
+            return
+        if not await _log_followers.subscribe(
+            log_path,
+            websocket,
+            lambda message: _follow_manager.send(websocket, message),
+            cursor=cursor,
+            file_id=file_id,
+            tail_bytes=tail_bytes,
+        ):
+            return
+        await _receive_pings(websocket, _follow_manager)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if log_path is not None:
+            await _log_followers.unsubscribe(log_path, websocket)
+        await _follow_manager.disconnect(websocket)
+
+
+async def _receive_pings(websocket, manager):
+    while True:
+        data = await websocket.receive_text()
+        if data == "ping":
+            if not await manager.send(websocket, "pong"):
+                break
+            continue
+        if data and data[0] == "{":
+            try:
+                payload = json.loads(data)
+            except json.JSONDecodeError:
+                continue
+            if payload.get("type") == "ping":
+                if not await manager.send(websocket, "pong"):
+                    break
+
+
+def _parse_int(value, default=None):
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
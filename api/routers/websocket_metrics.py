@@ -9,13 +9,17 @@ from utils.dependencies import (
     get_metrics_manager,
     get_websocket_current_user,
 )
-from utils.metrics_history_reader import prepare_history_series
+from utils.metrics_delta import MetricsDeltaStream
+from utils.metrics_history_store import normalize_series_fields
+from utils.metrics_series_cache import MetricsSeriesCache
 
 websocket_metrics_router = APIRouter()
 _publisher_task = None
 _publisher_lock = asyncio.Lock()
 _publisher_interval = 2.0
 _latest_snapshot = None
+_series_cache = MetricsSeriesCache()
+_delta_stream = MetricsDeltaStream()
 
 
 @websocket_metrics_router.websocket("/metrics")
@@ -41,26 +45,22 @@ async def websocket_metrics(
     history_bucket = _parse_int(websocket.query_params.get("history_bucket"))
     history_points = _parse_int(websocket.query_params.get("history_points"), 600)
     bootstrap = _parse_bool(websocket.query_params.get("bootstrap", "false"))
+    history_fields = _parse_fields(websocket.query_params.get("history_fields"))
+    protocol = websocket.query_params.get("protocol", "snapshot").strip().lower()
 
     await metrics_manager.connect(websocket)
     try:
         if bootstrap:
-            items, truncated = await run_in_threadpool(
-                history_manager.read,
-                since=history_since,
-                full=history_full,
-                limit=history_limit,
-                default_hours=6,
-            )
             items, series, truncated, stats, bucket_seconds = await run_in_threadpool(
-                prepare_history_series,
-                items,
-                truncated=truncated,
+                _series_cache.get,
+                history_manager.read_history_series,
                 since=history_since,
                 full=history_full,
+                limit=history_limit,
                 default_hours=6,
                 bucket_seconds=history_bucket,
                 max_points=history_points,
+                fields=history_fields,
             )
             if not await metrics_manager.send(
                 websocket,
@@ -92,12 +92,27 @@ async def websocket_metrics(
             ):
                 return
 
+        if protocol == "delta":
+            error = _delta_stream.subscribe(
+                websocket,
+                websocket.query_params.get("sections"),
+                websocket.query_params.get("processes"),
+            )
+            if error:
+                await metrics_manager.send(websocket, error)
+                await websocket.close()
+                return
         await _ensure_publisher(collector, metrics_manager, interval)
         while True:
-            await websocket.receive_text()
+            error = _delta_stream.handle_message(
+                websocket, await websocket.receive_text()
+            )
+            if error and not await metrics_manager.send(websocket, error):
+                return
     except WebSocketDisconnect:
         pass
     finally:
+        _delta_stream.remove(websocket)
         await metrics_manager.disconnect(websocket)
 
 
@@ -117,6 +132,15 @@ def _parse_int(value, default=None):
         return default
 
 
+def _parse_fields(value):
+    if not value:
+        return None
+    try:
+        return normalize_series_fields(value)
+    except ValueError:
+        return None
+
+
 def _parse_float(value, default=None):
     if value is None:
         return default
@@ -147,9 +171,8 @@ async def _publisher_loop(collector, metrics_manager):
                 continue
             snapshot = await asyncio.to_thread(collector.snapshot)
             _latest_snapshot = snapshot
-            await metrics_manager.broadcast(
-                json.dumps({"type": "snapshot", "data": snapshot})
-            )
+            _series_cache.extend(snapshot)
+            await _delta_stream.publish(snapshot, metrics_manager)
         except Exception:
             await asyncio.sleep(_publisher_interval)
             continue
@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, WebSocket
 from starlette.websockets import WebSocketDisconnect
+from api.status_publisher import StatusPublisher
 from utils.dependencies import (
     get_api_state,
     get_status_manager,
     get_websocket_current_user,
 )
-import asyncio, json
 
 websocket_status_router = APIRouter()
+_publisher = StatusPublisher()
 
 
 @websocket_status_router.websocket("/status")
@@ -17,37 +18,22 @@ async def websocket_status(
     status_manager=Depends(get_status_manager),
     current_user: str = Depends(get_websocket_current_user),
 ):
-    interval = 2.0
-    if "interval" in websocket.query_params:
-        try:
-            interval = float(websocket.query_params["interval"])
-            interval = max(0.5, min(interval, 10.0))
-        except ValueError:
-            interval = 2.0
-
+    # ``?interval=`` is still accepted from older clients but ignored: updates
+    # are pushed on process and health events rather than polled per client.
     include_health = _parse_bool(websocket.query_params.get("health"))
 
-    await status_manager.connect(websocket)
+    manager = await _publisher.subscribe(
+        websocket, api_state, status_manager, include_health
+    )
     try:
         while True:
-            if include_health:
-                snapshot = api_state.get_running_status_snapshot(include_health=True)
-                payload = {"type": "status", "processes": snapshot}
-            else:
-                running = api_state.get_running_processes()
-                payload = {"type": "status", "running": running}
-            if not await status_manager.send(websocket, json.dumps(payload)):
+            message = await websocket.receive()
+            if message.get("type") == "websocket.disconnect":
                 break
-            try:
-                message = await asyncio.wait_for(websocket.receive(), timeout=interval)
-                if message.get("type") == "websocket.disconnect":
-                    break
-            except asyncio.TimeoutError:
-                pass
-    except WebSocketDisconnect:
+    except (WebSocketDisconnect, RuntimeError):
         pass
     finally:
-        await status_manager.disconnect(websocket)
+        await manager.disconnect(websocket)
 
 
 def _parse_bool(value):
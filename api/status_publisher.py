@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+from api.connection_manager import ConnectionManager
+
+HEARTBEAT_SECONDS = 30.0
+COALESCE_SECONDS = 0.25
+
+
+class StatusPublisher:
+    """One shared status feed for every ``/status`` websocket.
+
+    ``ProcessHandler`` reports process start/stop and health transitions
+    through ``notify``; the publisher then recomputes each requested view
+    once and broadcasts it. Health transitions are seen whenever a service
+    is probed, so services without an auto-restart health policy (which are
+    only probed when this view is rendered) may take up to one heartbeat to
+    show a change.
+    Clients that ask for health share ``health_manager``; the rest share the
+    router's status manager.
+    """
+
+    def __init__(
+        self,
+        heartbeat_seconds=HEARTBEAT_SECONDS,
+        coalesce_seconds=COALESCE_SECONDS,
+    ):
+        self.heartbeat_seconds = max(0.1, float(heartbeat_seconds))
+        self.coalesce_seconds = max(0.0, float(coalesce_seconds))
+        self.health_manager = ConnectionManager()
+        self.latest = {}
+        self._task = None
+        self._loop = None
+        self._changed = None
+        self._listening_to = None
+
+    async def subscribe(self, websocket, api_state, status_manager, include_health):
+        """Accept ``websocket`` and send it the current view; return its manager."""
+        manager = self.health_manager if include_health else status_manager
+        await manager.connect(websocket)
+        self._ensure_running(api_state, status_manager)
+        payload = self.latest.get(include_health)
+        if payload is None:
+            payload = await self._render(api_state, include_health)
+            self.latest[include_health] = payload
+        await manager.send(websocket, payload)
+        return manager
+
+    def notify(self, process_name=None, event=None):
+        """Thread-safe wakeup used as a ``ProcessHandler`` status listener."""
+        loop, changed = self._loop, self._changed
+        if loop is None or changed is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(changed.set)
+        except RuntimeError:
+            pass
+
+    async def publish(self, api_state, status_manager):
+        for include_health, manager in (
+            (False, status_manager),
+            (True, self.health_manager),
+        ):
+            if not manager.active_connections:
+                self.latest.pop(include_health, None)
+                continue
+            payload = await self._render(api_state, include_health)
+            self.latest[include_health] = payload
+            await manager.broadcast(payload)
+
+    def _ensure_running(self, api_state, status_manager):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._changed = asyncio.Event()
+            self._task = None
+        process_handler = getattr(api_state, "process_handler", None)
+        if process_handler is not None and self._listening_to is not process_handler:
+            process_handler.add_status_listener(self.notify)
+            self._listening_to = process_handler
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(api_state, status_manager))
+
+    async def _run(self, api_state, status_manager):
+        while True:
+            try:
+                await asyncio.wait_for(self._changed.wait(), self.heartbeat_seconds)
+                await asyncio.sleep(self.coalesce_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._changed.clear()
+            try:
+                await self.publish(api_state, status_manager)
+            except Exception:
+                await asyncio.sleep(self.coalesce_seconds)
+
+    @staticmethod
+    async def _render(api_state, include_health):
+        if include_health:
+            snapshot = await asyncio.to_thread(
+                api_state.get_running_status_snapshot, include_health=True
+            )
+            return json.dumps({"type": "status", "processes": snapshot})
+        running = await asyncio.to_thread(api_state.get_running_processes)
+        return json.dumps({"type": "status", "running": running})
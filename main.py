@@ -10,9 +10,12 @@ from utils.dependencies import initialize_dependencies
 from utils.core_services import get_core_services, has_core_service
 from utils.dependency_map import build_conditional_dependency_map
 from utils.startup import (
+    run_dependency_startup,
     run_migration_aware_preinstall,
     start_control_plane_before_preinstall,
+    startup_critical_path,
 )
+from utils.wait_for_url import readiness_generation, wait_for_readiness_change
 from utils.notifications import notify_event
 from utils.plex_dbrepair import start_plex_dbrepair_worker
 from utils.ffprobe_monitor import start_ffprobe_monitor
@@ -25,7 +28,6 @@ from utils.metrics_postgres import ensure_metrics_postgres_config
 from utils.port_probe import is_port_available as _is_port_available
 from utils.runtime_paths import healthcheck_script
 from utils.traefik_setup import synchronize_traefik_web_port
-from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import subprocess, threading, time, os, json, urllib.parse, sys
 
 
@@ -884,53 +886,65 @@ def _build_dependency_map(config_manager) -> dict[str, set[str]]:
 def _start_processes_with_dependencies(
     process_handler, updater, config_manager, keys: list[str], dependency_map
 ) -> dict[str, str]:
-    enabled = {
-        key: _service_has_enabled_instance(config_manager.get(key, {})) for key in keys
-    }
-    pending = {key for key in keys if enabled.get(key)}
-    deps = {
-        key: {d for d in dependency_map.get(key, set()) if enabled.get(d)}
-        for key in pending
-    }
+    enabled_keys = [
+        key
+        for key in keys
+        if _service_has_enabled_instance(config_manager.get(key, {}))
+    ]
 
     def _start_key(key: str) -> bool:
         cfg = config_manager.get(key, {})
         return start_configured_process(cfg, updater, key)
 
-    in_progress = {}
-    completed = set()
-    failures = {}
-    with ThreadPoolExecutor() as executor:
-        while pending or in_progress:
-            if process_handler.shutting_down:
-                for future in list(in_progress):
-                    future.cancel()
-                return failures
-            ready = [key for key in list(pending) if deps.get(key, set()) <= completed]
-            for key in ready:
-                if process_handler.shutting_down:
-                    break
-                pending.remove(key)
-                in_progress[executor.submit(_start_key, key)] = key
+    def _key_readiness(key: str) -> str:
+        states = {
+            process_handler.get_service_readiness(name, fresh=True).get("state")
+            for name in _process_names_for_key(config_manager, key)
+        }
+        if "failed" in states:
+            return "failed"
+        return "ready" if states <= {"ready"} else "starting"
+
+    startup_cfg = (config_manager.get("dumb", {}) or {}).get("startup", {}) or {}
+    failures, timeline = run_dependency_startup(
+        enabled_keys,
+        dependency_map,
+        _start_key,
+        _key_readiness,
+        shutting_down=lambda: process_handler.shutting_down,
+        ready_timeout=float(startup_cfg.get("dependency_ready_timeout_seconds", 120)),
+        readiness_generation=readiness_generation,
+        wait_for_readiness=wait_for_readiness_change,
+    )
+    for key, error in failures.items():
+        logger.error("Failed while starting %s: %s", key, error)
+    critical_path = startup_critical_path(timeline)
+    process_handler.set_startup_critical_path(critical_path)
+    if critical_path:
+        logger.info(
+            "Startup critical path: %s",
+            " -> ".join(
+                f"{step['key']} (launch {step['launch_seconds']:.1f}s, "
+                f"ready {step['ready_seconds']:.1f}s)"
+                for step in critical_path
+            ),
+        )
+    return failures
 
-            if not in_progress:
-                raise RuntimeError(
-                    f"Dependency resolution stalled. Remaining: {sorted(pending)}"
-                )
 
-            done, _ = wait(in_progress.keys(), return_when=FIRST_COMPLETED)
-            for future in done:
-                key = in_progress.pop(future)
-                try:
-                    if not future.result():
-                        failures[key] = (
-                            "One or more configured processes failed to start."
-                        )
-                except Exception as e:
-                    logger.error("Failed while starting %s: %s", key, e)
-                    failures[key] = str(e)
-                completed.add(key)
-    return failures
+def _process_names_for_key(config_manager, key):
+    cfg = config_manager.get(key, {}) or {}
+    if "instances" in cfg and isinstance(cfg.get("instances"), dict):
+        return [
+            instance["process_name"]
+            for instance in cfg["instances"].values()
+            if isinstance(instance, dict)
+            and instance.get("enabled")
+            and instance.get("process_name")
+        ]
+    if cfg.get("enabled") and cfg.get("process_name"):
+        return [cfg["process_name"]]
+    return []
 
 
 def _collect_expected_process_names(config_manager, keys):
@@ -941,17 +955,7 @@ def _collect_expected_process_names(config_manager, keys):
         if cfg.get("enabled") and cfg.get("process_name"):
             names.append(cfg["process_name"])
     for key in keys:
-        cfg = config_manager.get(key, {}) or {}
-        if "instances" in cfg and isinstance(cfg.get("instances"), dict):
-            for instance in cfg["instances"].values():
-                if (
-                    isinstance(instance, dict)
-                    and instance.get("enabled")
-                    and instance.get("process_name")
-                ):
-                    names.append(instance["process_name"])
-        elif cfg.get("enabled") and cfg.get("process_name"):
-            names.append(cfg["process_name"])
+        names.extend(_process_names_for_key(config_manager, key))
     return names
 
 
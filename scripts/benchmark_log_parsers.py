@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from utils.logger import SubprocessLogger  # noqa: E402
+
+SAMPLES = {
+    "rclone": [
+        "2026/10/17 10:00:00 DEBUG : movies/Film (2020)/Film.mkv: vfs cache: "
+        "checking remote fingerprint",
+        "2026/10/17 10:00:00 INFO  : vfs cache: cleaned: objects 120 (was 121)",
+        "2026/10/17 10:00:01 ERROR : IO error: couldn't open file",
+    ],
+    "Zurg": [
+        "2026-10-17T10:00:00Z INFO [zurg] Fetching torrents from Real-Debrid",
+        "2026-10-17T10:00:00Z DEBUG [manager] Repair worker idle",
+        "2026-10-17T10:00:01Z WARN [zurg] Rate limited, retrying",
+    ],
+    "Traefik": [
+        "2026-10-17T10:00:00Z INF Configuration loaded from flags. module=github",
+        '2026-10-17T10:00:00Z ERR error="service not found" entryPointName=web',
+        'level=info msg="Starting provider *file.Provider"',
+    ],
+    "PostgreSQL": [
+        "2026-10-17 10:00:00.000 UTC [42] LOG:  checkpoint starting: time",
+        '2026-10-17 10:00:00.000 UTC [42] FATAL:  role "x" does not exist',
+    ],
+    "Zilean": [
+        "[10:00:00] | INFO | Zilean.Scraper.Features.Ingestion | Processed 10",
+    ],
+    "CLI Debrid": [
+        "2026-10-17 10:00:00 - Checking wanted items",
+    ],
+}
+
+
+def benchmark(process_name: str, lines: list[str], total: int) -> float:
+    parse = SubprocessLogger.parse_log_level_and_message
+    batch = (lines * (total // len(lines) + 1))[:total]
+    started = time.perf_counter()
+    for line in batch:
+        parse(line, process_name)
+    elapsed = time.perf_counter() - started
+    return total / elapsed if elapsed > 0 else float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure SubprocessLogger parse throughput per service format."
+    )
+    parser.add_argument("--lines", type=int, default=200_000)
+    args = parser.parse_args()
+    for process_name, lines in SAMPLES.items():
+        rate = benchmark(process_name, lines, max(1, args.lines))
+        print(f"{process_name:<12} {rate:>14,.0f} lines/sec")
+
+
+if __name__ == "__main__":
+    main()
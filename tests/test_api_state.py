@@ -71,7 +71,7 @@ class APIStateHelperTests(unittest.TestCase):
 
     def test_get_status_details_checks_dumb_api_current_process_health(self):
         state = self._state()
-        state._refresh_status_cache = lambda: {}
+        state._running_snapshot = lambda: {}
         state.process_handler = types.SimpleNamespace(
             get_restart_stats=lambda process_name: {"process_name": process_name},
             get_process_health=lambda process_name, pid: {
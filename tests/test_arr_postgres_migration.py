@@ -1,16 +1,22 @@
 import hashlib
+import io
 import json
 import os
+import socket
 import sqlite3
 import subprocess
+import sys
 import tempfile
 import threading
+import time
 import unittest
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from utils import arr_postgres_digest
 from utils.arr_postgres_migration import (
     ACTIVE_NAMESPACE_MIGRATION_BLOCKER,
     ArrPostgresMigrationError,
@@ -27,6 +33,9 @@ from utils.arr_postgres_migration import (
     _backup_sqlite,
     _converted_import_batches,
     _convert_value,
+    _copy_sqlite_table,
+    import_sqlite_to_postgres,
+    _copy_text_value,
     _clear_infinidysk_rollback_authorization,
     _infinidysk_namespace_migration_resolved,
     _infinidysk_postgres_source_selection,
@@ -40,6 +49,7 @@ from utils.arr_postgres_migration import (
     _stop_infinidysk_if_running,
     _stop_tracked_infinidysk_process,
     _validate_full_row_digests,
+    _validate_primary_key_digests,
     _wait_for_schema_helper,
     _wait_for_schema,
     build_arr_postgres_preflight,
@@ -949,6 +959,122 @@ class ArrPostgresMigrationTests(unittest.TestCase):
         self.assertEqual([len(batch) for batch in batches], [1, 1, 1])
         self.assertEqual(batches[-1], [(b"c" * 200,)])
 
+    def test_copy_text_values_escape_postgres_text_format(self):
+        self.assertEqual(_copy_text_value(None), "\\N")
+        self.assertEqual(_copy_text_value(True), "t")
+        self.assertEqual(_copy_text_value(b"\x00\xff"), "\\\\x00ff")
+        self.assertEqual(_copy_text_value("a\tb\nc\\d"), "a\\tb\\nc\\\\d")
+        self.assertEqual(
+            _copy_text_value(_convert_value(1_700_000_000_000, "timestamp")),
+            "2023-11-14T22:13:20+00:00",
+        )
+
+    def test_import_stops_remaining_tables_after_first_copy_failure(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sqlite_path = Path(temp_dir, "app.db")
+            source = sqlite3.connect(sqlite_path)
+            for table in ("Broken", "Long", "Queued"):
+                source.execute(f'CREATE TABLE "{table}" ("Id" INTEGER PRIMARY KEY)')
+            source.commit()
+            source.close()
+
+            target = MagicMock()
+            events = []
+            started = []
+
+            def copy_table(*args, **kwargs):
+                table = args[3]
+                events.append("copy")
+                started.append(table)
+                if table == "Broken":
+                    time.sleep(0.05)
+                    raise ArrPostgresMigrationError("bad row in Broken")
+                for _ in range(200):
+                    kwargs["on_rows"](1)
+                    time.sleep(0.01)
+                return 200
+
+            target.commit.side_effect = lambda: events.append("commit")
+            with (
+                patch(
+                    "utils.arr_postgres_migration._prepare_target_for_import",
+                    return_value=["Broken", "Long", "Queued"],
+                ),
+                patch("utils.arr_postgres_migration._pg_connect", return_value=target),
+                patch(
+                    "utils.arr_postgres_migration._postgres_table_columns",
+                    return_value={"Id": {"is_generated": "NEVER"}},
+                ),
+                patch(
+                    "utils.arr_postgres_migration._copy_sqlite_table",
+                    side_effect=copy_table,
+                ),
+                self.assertRaisesRegex(ArrPostgresMigrationError, "bad row in Broken"),
+            ):
+                import_sqlite_to_postgres(sqlite_path, {}, "dumb_app", workers=2)
+
+        self.assertEqual(events[0], "commit")
+        self.assertNotIn("Queued", started)
+
+    def test_copy_sqlite_table_streams_converted_rows_through_copy(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sqlite_path = Path(temp_dir, "app.db")
+            source = sqlite3.connect(sqlite_path)
+            source.execute(
+                'CREATE TABLE "Items" ("Id" INTEGER, "Enabled" INTEGER, "Name" TEXT)'
+            )
+            source.executemany(
+                'INSERT INTO "Items" VALUES (?, ?, ?)',
+                [(1, 1, "one"), (2, 0, None), (3, 1, "tab\there")],
+            )
+            source.commit()
+            source.close()
+
+            received = []
+
+            def copy_expert(statement, stream):
+                while True:
+                    chunk = stream.read(7)
+                    if not chunk:
+                        break
+                    received.append(chunk)
+
+            cursor = MagicMock()
+            cursor.__enter__.return_value = cursor
+            cursor.copy_expert.side_effect = copy_expert
+            connection = Mock()
+            connection.cursor.return_value = cursor
+            batches = []
+
+            with patch(
+                "utils.arr_postgres_migration._pg_connect", return_value=connection
+            ):
+                copied = _copy_sqlite_table(
+                    sqlite_path,
+                    {},
+                    "dumb_app",
+                    "Items",
+                    ["Id", "Enabled", "Name"],
+                    {
+                        "Id": {"data_type": "integer"},
+                        "Enabled": {"data_type": "boolean"},
+                        "Name": {"data_type": "text"},
+                    },
+                    batch_size=2,
+                    max_batch_bytes=None,
+                    on_rows=batches.append,
+                )
+
+        self.assertEqual(copied, 3)
+        self.assertEqual(batches, [2, 1])
+        self.assertEqual(
+            b"".join(received),
+            b"1\tt\tone\n2\tf\t\\N\n3\tt\ttab\\there\n",
+        )
+        cursor.execute.assert_called_once_with("SET session_replication_role = replica")
+        connection.commit.assert_called_once_with()
+        connection.close.assert_called_once_with()
+
     def test_full_row_digest_detects_non_key_value_corruption(self):
         source = sqlite3.connect(":memory:")
         source.execute('CREATE TABLE "Items" ("Id" INTEGER PRIMARY KEY, "Value" TEXT)')
@@ -966,7 +1092,7 @@ class ArrPostgresMigrationTests(unittest.TestCase):
         try:
             with (
                 patch(
-                    "utils.arr_postgres_migration._postgres_table_columns",
+                    "utils.arr_postgres_digest._postgres_table_columns",
                     return_value=target_columns,
                 ),
                 self.assertRaisesRegex(
@@ -977,6 +1103,160 @@ class ArrPostgresMigrationTests(unittest.TestCase):
         finally:
             source.close()
 
+    def test_chunked_full_row_digest_reports_mismatched_key_range(self):
+        source = sqlite3.connect(":memory:")
+        source.execute('CREATE TABLE "Items" ("Id" INTEGER PRIMARY KEY, "Value" TEXT)')
+        source.executemany(
+            'INSERT INTO "Items" VALUES (?, ?)',
+            [(key, f"value-{key}") for key in range(1, 8)],
+        )
+        target_rows = [
+            [(1, "value-1"), (2, "value-2"), (3, "value-3")],
+            [(4, "value-4"), (5, "corrupt"), (6, "value-6")],
+            [(7, "value-7")],
+        ]
+        cursors = []
+        for rows in target_rows:
+            cursor = MagicMock()
+            cursor.__enter__.return_value = cursor
+            cursor.__iter__.return_value = iter(rows)
+            cursors.append(cursor)
+        target = Mock()
+        target.cursor.side_effect = cursors
+        target_columns = {
+            "Id": {"data_type": "integer"},
+            "Value": {"data_type": "text"},
+        }
+        try:
+            with (
+                patch(
+                    "utils.arr_postgres_digest._postgres_table_columns",
+                    return_value=target_columns,
+                ),
+                self.assertRaises(ArrPostgresMigrationError) as raised,
+            ):
+                _validate_full_row_digests(source, target, ["Items"], chunk_rows=3)
+        finally:
+            source.close()
+
+        self.assertIn("4 <= Id < 7", str(raised.exception))
+        self.assertNotIn("Id >= 7", str(raised.exception))
+        self.assertEqual(
+            [entry.args[1] for entry in cursors[1].execute.call_args_list], [[4, 7]]
+        )
+
+    def _digest_source(self, temp_dir):
+        sqlite_path = Path(temp_dir, "app.db")
+        source = sqlite3.connect(sqlite_path)
+        for table in ("Alpha", "Beta"):
+            source.execute(f'CREATE TABLE "{table}" ("Id" INTEGER PRIMARY KEY)')
+            source.executemany(f'INSERT INTO "{table}" VALUES (?)', [(1,), (2,)])
+        source.commit()
+        return sqlite_path, source
+
+    def test_primary_key_digests_run_tables_on_worker_connections(self):
+        commands = []
+
+        def run_worker(command, input, **kwargs):
+            commands.append(command)
+            stdout = io.StringIO()
+            arr_postgres_digest.main(io.StringIO(input), stdout)
+            return subprocess.CompletedProcess(command, 0, stdout.getvalue(), "")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sqlite_path, source = self._digest_source(temp_dir)
+            opened = []
+
+            def target_cursor(name=None):
+                cursor = MagicMock()
+                cursor.__enter__.return_value = cursor
+                cursor.fetchall.return_value = [("Id",)]
+                cursor.__iter__.return_value = iter([(1,), (2,)])
+                return cursor
+
+            def pg_connect(postgres_config, database):
+                target = Mock()
+                target.cursor.side_effect = target_cursor
+                opened.append((postgres_config, database, target))
+                return target
+
+            try:
+                with (
+                    patch(
+                        "utils.arr_postgres_migration.subprocess.run",
+                        side_effect=run_worker,
+                    ),
+                    patch(
+                        "utils.arr_postgres_digest._pg_connect",
+                        side_effect=pg_connect,
+                    ),
+                    patch(
+                        "utils.arr_postgres_digest._postgres_table_columns",
+                        return_value={"Id": {"data_type": "integer"}},
+                    ),
+                ):
+                    digests = _validate_primary_key_digests(
+                        source,
+                        Mock(),
+                        ["Alpha", "Beta"],
+                        connection_args=(str(sqlite_path), {"port": 5432}, "app"),
+                    )
+            finally:
+                source.close()
+
+        self.assertEqual(list(digests), ["Alpha", "Beta"])
+        self.assertEqual(digests["Alpha"]["count"], 2)
+        self.assertEqual(
+            commands, [[sys.executable, "-m", "utils.arr_postgres_digest"]] * 2
+        )
+        self.assertEqual(len(opened), 2)
+        for postgres_config, database, target in opened:
+            self.assertEqual((postgres_config, database), ({"port": 5432}, "app"))
+            target.close.assert_called_once_with()
+
+    def test_digest_worker_module_loads_no_dumb_modules(self):
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, utils.arr_postgres_digest; "
+                "print(sorted(name for name in sys.modules "
+                "if name.split('.')[0] in {'utils', 'api', 'main'}))",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).resolve().parents[1],
+            check=True,
+        )
+
+        self.assertEqual(
+            completed.stdout.strip(), "['utils', 'utils.arr_postgres_digest']"
+        )
+
+    def test_digest_validation_reports_errors_from_real_worker_processes(self):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            closed_port = probe.getsockname()[1]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sqlite_path, source = self._digest_source(temp_dir)
+            try:
+                with self.assertRaisesRegex(
+                    ArrPostgresMigrationError, "OperationalError"
+                ):
+                    _validate_primary_key_digests(
+                        source,
+                        Mock(),
+                        ["Alpha", "Beta"],
+                        connection_args=(
+                            str(sqlite_path),
+                            {"host": "127.0.0.1", "port": closed_port},
+                            "app",
+                        ),
+                        workers=2,
+                    )
+            finally:
+                source.close()
+
     def test_infinidysk_schema_helper_uses_isolated_loopback_migration_mode(self):
         process_handler = Mock()
         process_handler.start_process.return_value = (True, None)
@@ -4,6 +4,7 @@ import sys
 import tempfile
 import types
 import unittest
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -27,7 +28,7 @@ finally:
     else:
         sys.modules["utils.dependencies"] = _previous_dependencies
 
-from utils.auth_config import AuthConfigManager
+from utils.auth_config import AuthConfigManager, AuthStateCache
 from utils.authelia_settings import (
     authelia_environment,
     bootstrap_user,
@@ -153,6 +154,81 @@ class AuthProviderConfigTests(unittest.TestCase):
                 self.assertIn("HTTPS FQDN", raised.exception.detail)
 
 
+class AuthStateCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name, "users.json")
+        self.path.write_text(
+            json.dumps({"enabled": True, "users": [], "jwt_secret": "secret"}),
+            encoding="utf-8",
+        )
+        self.now = 0.0
+        self.state = AuthStateCache(recheck_seconds=5, clock=lambda: self.now)
+        self.environment = patch.dict(
+            os.environ, {"DUMB_AUTH_CONFIG_PATH": str(self.path)}
+        )
+        self.environment.start()
+
+    def tearDown(self):
+        self.environment.stop()
+        self.directory.cleanup()
+
+    @staticmethod
+    def _payload(sub="alice", minutes=5):
+        return types.SimpleNamespace(
+            sub=sub, exp=datetime.now(timezone.utc) + timedelta(minutes=minutes)
+        )
+
+    def test_manager_is_shared_until_file_changes_after_recheck_interval(self):
+        manager = self.state.manager()
+        self.assertIs(self.state.manager(), manager)
+
+        self.path.write_text(
+            json.dumps({"enabled": False, "users": [], "jwt_secret": "rotated"}),
+            encoding="utf-8",
+        )
+        with patch("utils.auth_config.os.stat") as stat:
+            self.assertIs(self.state.manager(), manager)
+        stat.assert_not_called()
+
+        self.now = 6.0
+        reloaded = self.state.manager()
+        self.assertIsNot(reloaded, manager)
+        self.assertFalse(reloaded.is_auth_enabled())
+
+    def test_save_invalidates_shared_manager_immediately(self):
+        manager = self.state.manager()
+        with patch("utils.auth_config.AUTH_STATE", self.state):
+            AuthConfigManager(str(self.path)).disable_auth()
+
+        reloaded = self.state.manager()
+        self.assertIsNot(reloaded, manager)
+        self.assertFalse(reloaded.is_auth_enabled())
+
+    def test_token_cache_expires_and_is_cleared_on_reload(self):
+        self.state.manager()
+        self.state.remember_token("live", self._payload())
+        self.state.remember_token("stale", self._payload(minutes=-1))
+
+        self.assertEqual(self.state.cached_principal("live"), "alice")
+        self.assertIsNone(self.state.cached_principal("stale"))
+
+        self.state.invalidate()
+        self.state.manager()
+        self.assertIsNone(self.state.cached_principal("live"))
+
+    def test_token_cache_evicts_least_recently_used(self):
+        state = AuthStateCache(token_cache_size=2)
+        state.remember_token("a", self._payload("a"))
+        state.remember_token("b", self._payload("b"))
+        state.cached_principal("a")
+        state.remember_token("c", self._payload("c"))
+
+        self.assertEqual(state.cached_principal("a"), "a")
+        self.assertIsNone(state.cached_principal("b"))
+        self.assertEqual(state.cached_principal("c"), "c")
+
+
 class ManagedAutheliaConfigTests(unittest.TestCase):
     def test_initial_environment_does_not_enable_oidc_without_clients(self):
         with tempfile.TemporaryDirectory() as directory:
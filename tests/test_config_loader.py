@@ -0,0 +1,99 @@
+import importlib
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+
+def _real_config_manager_class():
+    previous = sys.modules.pop("utils.config_loader", None)
+    try:
+        return importlib.import_module("utils.config_loader").ConfigManager
+    finally:
+        if previous is not None:
+            sys.modules["utils.config_loader"] = previous
+
+
+class ConfigManagerProcessIndexTests(unittest.TestCase):
+    def setUp(self):
+        ConfigManager = _real_config_manager_class()
+        self.manager = ConfigManager.__new__(ConfigManager)
+        self.manager.version = 0
+        self.manager._process_index = None
+        self.manager._process_index_lock = threading.Lock()
+        self.manager.config = {
+            "zurg": {
+                "instances": {
+                    "Default": {"process_name": "Zurg w/ rclone"},
+                    "Second": {"process_name": "Zurg Second"},
+                }
+            },
+            "riven_backend": {"process_name": "Riven Backend"},
+            "dumb": {"frontend": {"process_name": "DUMB Frontend"}},
+        }
+
+    def test_lookups_match_previous_scan_semantics(self):
+        manager = self.manager
+
+        self.assertEqual(
+            manager.find_key_for_process("Zurg w/ rclone"), ("zurg", "Default")
+        )
+        self.assertEqual(
+            manager.find_key_for_process("Riven Backend"), ("riven_backend", None)
+        )
+        self.assertEqual(
+            manager.find_key_for_process("DUMB Frontend"), ("dumb_frontend", None)
+        )
+        self.assertEqual(manager.find_key_for_process("riven backend"), (None, None))
+        key, instance, section = manager.find_process("riven backend", normalized=True)
+        self.assertEqual((key, instance), ("riven_backend", None))
+        self.assertIs(section, manager.config["riven_backend"])
+
+    def test_index_is_reused_until_the_config_changes(self):
+        manager = self.manager
+        manager.find_key_for_process("Riven Backend")
+        version = manager.version
+        index = manager._process_index
+
+        manager.find_key_for_process("Zurg Second")
+        self.assertIs(manager._process_index, index)
+
+        manager.config["riven_backend"]["process_name"] = "Riven"
+        self.assertEqual(manager.find_key_for_process("Riven Backend"), (None, None))
+        self.assertEqual(manager.find_key_for_process("Riven"), ("riven_backend", None))
+        self.assertGreater(manager.version, version)
+
+        manager.config = {"plex": {"process_name": "Plex Media Server"}}
+        self.assertEqual(
+            manager.find_key_for_process("Plex Media Server"), ("plex", None)
+        )
+        self.assertEqual(manager.find_key_for_process("Riven"), (None, None))
+
+    def test_misses_are_cached_until_the_version_changes(self):
+        manager = self.manager
+        build = manager._build_process_index
+        with patch.object(manager, "_build_process_index", side_effect=build) as spy:
+            for _ in range(100):
+                self.assertIsNone(manager.find_process("Missing"))
+            self.assertLessEqual(spy.call_count, 2)
+
+            manager.set("plex", "process_name", "Missing")
+            self.assertEqual(manager.find_key_for_process("Missing"), ("plex", None))
+
+    def test_reload_bumps_version(self):
+        manager = self.manager
+        version = manager.version
+        with (
+            patch.object(manager, "_load_config", return_value={}, create=True),
+            patch.object(
+                manager, "_canonicalize_runtime_config", side_effect=lambda c: c
+            ),
+            patch.object(manager, "_merge_with_env", side_effect=lambda c: c),
+        ):
+            manager.reload()
+
+        self.assertGreater(manager.version, version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import json
 import sqlite3
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -75,7 +76,9 @@ class DatabaseHealthCollectorTests(unittest.TestCase):
             log_path.write_text("startup complete\n", encoding="utf-8")
             collector = DatabaseHealthCollector()
 
-            result = collector.snapshot(_config(temp_dir, str(log_path)))
+            result = collector.snapshot(
+                _config(temp_dir, str(log_path)), wait_for_refresh=True
+            )
             database = result["services"][0]["databases"][0]
 
             self.assertTrue(database["exists"])
@@ -112,19 +115,50 @@ class DatabaseHealthCollectorTests(unittest.TestCase):
                 "network": True,
             }
             with patch("utils.database_health._storage_for_path", return_value=storage):
-                first = collector.snapshot(config)["services"][0]
+                first = collector.snapshot(config, wait_for_refresh=True)["services"][0]
                 config["dumb"]["metrics"]["database_health"]["services"]["infinidysk"][
                     "ignore_network_storage"
                 ] = True
                 waiting = collector.snapshot(config, refresh_if_stale=False)[
                     "services"
                 ][0]
-                refreshed = collector.snapshot(config)["services"][0]
+                refreshed = collector.snapshot(config, wait_for_refresh=True)[
+                    "services"
+                ][0]
 
             self.assertEqual(first["score"], 35)
             self.assertEqual(waiting["pressure"], "collecting")
             self.assertEqual(refreshed["score"], 0)
 
+    def test_snapshot_returns_last_result_while_slow_collection_runs(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            Path(temp_dir, "db.sqlite").touch()
+            log_path = Path(temp_dir) / "nzbdav.log"
+            log_path.touch()
+            now = [100.0]
+            collector = DatabaseHealthCollector(clock=lambda: now[0])
+            config = _config(temp_dir, str(log_path))
+            first = collector.snapshot(config, wait_for_refresh=True)["services"][0]
+            release = threading.Event()
+            original_collect = collector._collect_service
+
+            def slow_collect(*args, **kwargs):
+                release.wait(timeout=5)
+                return original_collect(*args, **kwargs)
+
+            collector._collect_service = slow_collect
+            now[0] = 130.0
+            try:
+                stale = collector.snapshot(config)["services"][0]
+            finally:
+                release.set()
+
+            self.assertGreaterEqual(first["collection_ms"], 0)
+            self.assertEqual(first["age_sec"], 0)
+            self.assertEqual(stale["collected_at"], 100.0)
+            self.assertEqual(stale["age_sec"], 30.0)
+            self.assertTrue(stale["refreshing"])
+
     def test_enhanced_mode_uses_bounded_read_only_sqlite_probe(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             db_path = Path(temp_dir) / "db.sqlite"
@@ -138,7 +172,7 @@ class DatabaseHealthCollectorTests(unittest.TestCase):
             collector = DatabaseHealthCollector()
 
             result = collector.snapshot(
-                _config(temp_dir, str(log_path), mode="enhanced")
+                _config(temp_dir, str(log_path), mode="enhanced"), wait_for_refresh=True
             )
             database = result["services"][0]["databases"][0]
 
@@ -156,13 +190,13 @@ class DatabaseHealthCollectorTests(unittest.TestCase):
             collector = DatabaseHealthCollector(clock=lambda: now[0])
             config = _config(temp_dir, str(log_path))
 
-            first = collector.snapshot(config)["services"][0]
+            first = collector.snapshot(config, wait_for_refresh=True)["services"][0]
             now[0] = 116.0
-            second = collector.snapshot(config)["services"][0]
+            second = collector.snapshot(config, wait_for_refresh=True)["services"][0]
             with log_path.open("a", encoding="utf-8") as handle:
                 handle.write("SQLITE_BUSY busy timeout\n")
             now[0] = 132.0
-            third = collector.snapshot(config)["services"][0]
+            third = collector.snapshot(config, wait_for_refresh=True)["services"][0]
 
             self.assertEqual(first["log_signals"]["locked"], 1)
             self.assertEqual(second["log_signals"]["locked"], 1)
@@ -170,6 +204,54 @@ class DatabaseHealthCollectorTests(unittest.TestCase):
             self.assertGreaterEqual(third["log_signals"]["busy"], 1)
             self.assertIn(third["pressure"], {"high", "critical"})
 
+    def test_log_cursor_persists_and_follows_rotation(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "service.log"
+            state_path = Path(temp_dir) / "state" / "cursors.json"
+            log_path.write_text("database is locked\npartial SQLITE_BU", "utf-8")
+            now = [1000.0]
+
+            def collector():
+                return DatabaseHealthCollector(
+                    clock=lambda: now[0], log_state_path=str(state_path)
+                )
+
+            first = collector()._collect_log_signals(str(log_path), 16384)
+            with log_path.open("a", encoding="utf-8") as handle:
+                handle.write("SY\n")
+            now[0] = 1060.0
+            resumed = collector()._collect_log_signals(str(log_path), 16384)
+            log_path.unlink()
+            log_path.write_text("deadlock detected\n", "utf-8")
+            now[0] = 1120.0
+            rotated = collector()._collect_log_signals(str(log_path), 16384)
+
+            self.assertEqual((first["locked"], first["busy"]), (1, 0))
+            self.assertEqual(first["scanned_through"], len("database is locked\n"))
+            self.assertEqual((resumed["locked"], resumed["busy"]), (1, 1))
+            self.assertEqual(resumed["scanned_bytes"], len("partial SQLITE_BUSY\n"))
+            self.assertEqual(rotated["deadlock"], 1)
+            self.assertEqual(rotated["locked"], 1)
+            self.assertEqual(rotated["scanned_through"], len("deadlock detected\n"))
+
+    def test_log_signal_counts_roll_out_of_their_windows(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "service.log"
+            log_path.write_text("database is locked\n", "utf-8")
+            now = [0.0]
+            collector = DatabaseHealthCollector(clock=lambda: now[0])
+
+            collector._collect_log_signals(str(log_path), 16384)
+            now[0] = 7200.0
+            later = collector._collect_log_signals(str(log_path), 16384)
+            now[0] = 90000.0
+            expired = collector._collect_log_signals(str(log_path), 16384)
+
+            self.assertEqual(later["locked"], 0)
+            self.assertEqual(later["windows"]["24h"]["locked"], 1)
+            self.assertEqual(later["scanned_bytes"], 0)
+            self.assertEqual(expired["windows"]["24h"]["locked"], 0)
+
     def test_history_snapshot_omits_paths_and_storage_details(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             Path(temp_dir, "db.sqlite").touch()
@@ -177,7 +259,9 @@ class DatabaseHealthCollectorTests(unittest.TestCase):
             log_path.touch()
             collector = DatabaseHealthCollector()
 
-            result = collector.snapshot(_config(temp_dir, str(log_path)), details=False)
+            result = collector.snapshot(
+                _config(temp_dir, str(log_path)), details=False, wait_for_refresh=True
+            )
             service = result["services"][0]
 
             self.assertNotIn("recommendation", service)
@@ -197,9 +281,9 @@ class DatabaseHealthCollectorTests(unittest.TestCase):
                 "network": True,
             }
             with patch("utils.database_health._storage_for_path", return_value=storage):
-                service = collector.snapshot(_config(temp_dir, str(log_path)))[
-                    "services"
-                ][0]
+                service = collector.snapshot(
+                    _config(temp_dir, str(log_path)), wait_for_refresh=True
+                )["services"][0]
 
             self.assertGreaterEqual(service["score"], 20)
             self.assertIn("local storage", service["recommendation"])
@@ -390,7 +474,7 @@ class DatabaseHealthCollectorTests(unittest.TestCase):
                 },
             }
 
-            service = collector.snapshot(config)["services"][0]
+            service = collector.snapshot(config, wait_for_refresh=True)["services"][0]
             store = service["databases"][0]
 
             self.assertEqual(service["provider"], "zurg-state")
@@ -628,7 +712,7 @@ class DatabaseHealthCollectorTests(unittest.TestCase):
                 },
             )
 
-            service = collector.snapshot(config)["services"][0]
+            service = collector.snapshot(config, wait_for_refresh=True)["services"][0]
 
         self.assertEqual(service["provider"], "postgresql")
         self.assertEqual(
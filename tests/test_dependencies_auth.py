@@ -120,6 +120,7 @@ def _install_runtime_auth_stubs(auth_config, auth_module):
 
     auth_config_module = types.ModuleType("utils.auth_config")
     auth_config_module.AuthConfigManager = lambda: auth_config
+    auth_config_module.AUTH_STATE = _AuthState(auth_config)
     sys.modules["utils.auth_config"] = auth_config_module
     sys.modules["utils.auth"] = auth_module
 
@@ -145,6 +146,21 @@ class _AuthConfig:
         return bool(self.user and not self.user.disabled)
 
 
+class _AuthState:
+    def __init__(self, auth_config):
+        self.auth_config = auth_config
+        self.tokens = {}
+
+    def manager(self):
+        return self.auth_config
+
+    def cached_principal(self, token):
+        return self.tokens.get(token)
+
+    def remember_token(self, token, payload):
+        self.tokens[token] = payload.sub
+
+
 class _Payload:
     def __init__(self, sub="alice", token_type="access"):
         self.sub = sub
@@ -220,6 +236,27 @@ class DependencyAuthTests(unittest.TestCase):
             dependencies.get_optional_current_user(_Credentials("token")), "alice"
         )
 
+    def test_optional_current_user_reuses_verified_token(self):
+        decode_token = Mock(return_value=_Payload())
+        self.auth_module.decode_token = decode_token
+
+        first = dependencies.get_optional_current_user(_Credentials("token"))
+        second = dependencies.get_optional_current_user(_Credentials("token"))
+
+        self.assertEqual((first, second), ("alice", "alice"))
+        decode_token.assert_called_once_with("token")
+
+    def test_optional_current_user_does_not_cache_rejected_token(self):
+        self.auth_config.user = _User(disabled=True)
+
+        with self.assertRaises(self.fastapi.HTTPException):
+            dependencies.get_optional_current_user(_Credentials("token"))
+
+        self.assertEqual(
+            sys.modules["utils.auth_config"].AUTH_STATE.tokens,
+            {},
+        )
+
     def test_websocket_current_user_returns_none_when_auth_disabled(self):
         self.auth_config.enabled = False
 
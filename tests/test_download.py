@@ -50,12 +50,19 @@ class FakeResponse:
     def json(self):
         return self.json_data
 
+    def iter_content(self, chunk_size=1):
+        for offset in range(0, len(self.content), chunk_size):
+            yield self.content[offset : offset + chunk_size]
+
+    def close(self):
+        pass
+
 
 class _InstallCache:
-    def lookup_download(self, _url):
+    def lookup_download_path(self, _url):
         return None, {}
 
-    def store_download(self, _url, _content, **_metadata):
+    def store_download_file(self, _url, _path, _digest, **_metadata):
         return {}
 
     def invalidate_download(self, _url, _reason):
@@ -968,14 +975,17 @@ class DownloaderHelperTests(unittest.TestCase):
             "filename": "app.zip",
             "content_type": "application/zip",
             "etag": '"v1"',
+            "sha256": hashlib.sha256(zip_buffer.getvalue()).hexdigest(),
         }
         with tempfile.TemporaryDirectory() as temp_dir:
             target = Path(temp_dir) / "target"
+            cached = Path(temp_dir) / "cached-object"
+            cached.write_bytes(zip_buffer.getvalue())
             with (
                 patch.object(
                     download.INSTALL_CACHE,
-                    "lookup_download",
-                    return_value=(zip_buffer.getvalue(), metadata),
+                    "lookup_download_path",
+                    return_value=(cached, metadata),
                 ),
                 patch.object(self.downloader, "fetch_with_retries", return_value=None),
             ):
@@ -988,6 +998,61 @@ class DownloaderHelperTests(unittest.TestCase):
             self.assertTrue(success, error)
             self.assertEqual((target / "runtime.txt").read_text(), "cached")
 
+    def test_download_streams_to_cache_and_aborts_oversized_bodies(self):
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w") as archive:
+            archive.writestr("app/runtime.txt", "streamed")
+        content = zip_buffer.getvalue()
+        stored = []
+
+        def store_download_file(url, path, digest, **metadata):
+            stored.append((Path(path).read_bytes(), digest, metadata["filename"]))
+            return {}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / "target"
+            with (
+                patch.object(
+                    download.INSTALL_CACHE,
+                    "store_download_file",
+                    side_effect=store_download_file,
+                ),
+                patch.object(
+                    self.downloader,
+                    "fetch_with_retries",
+                    return_value=FakeResponse(
+                        200,
+                        {"Content-Disposition": "attachment; filename=app.zip"},
+                        content,
+                    ),
+                ) as fetch,
+            ):
+                success, error = self.downloader.download_and_extract(
+                    "https://example.test/app.zip", str(target), zip_folder_name="app"
+                )
+
+            self.assertTrue(success, error)
+            self.assertTrue(fetch.call_args.kwargs["stream"])
+            self.assertEqual(
+                stored, [(content, hashlib.sha256(content).hexdigest(), "app.zip")]
+            )
+            self.assertEqual((target / "runtime.txt").read_text(), "streamed")
+
+            download.CONFIG_MANAGER.values = {
+                "dumb": {"install_cache": {"max_download_size_mb": 0.0001}}
+            }
+            oversized = FakeResponse(200, {}, b"x" * 1024)
+            with patch.object(
+                self.downloader, "fetch_with_retries", return_value=oversized
+            ):
+                success, error = self.downloader.download_and_extract(
+                    "https://example.test/big.bin", str(Path(temp_dir) / "big")
+                )
+
+            self.assertFalse(success)
+            self.assertIn("size limit", error)
+            self.assertEqual(sorted(os.listdir(temp_dir)), ["target"])
+
     def test_handle_rate_limits_ignores_non_rate_limit_statuses(self):
         with patch.object(download.time, "sleep") as sleep:
             handled = self.downloader.handle_rate_limits(FakeResponse(500))
@@ -10,10 +10,12 @@ from utils.startup import (
     frontend_start_readiness,
     run_grouped_preinstall,
     run_migration_aware_preinstall,
+    run_dependency_startup,
     run_parallel_preinstall,
     start_control_plane_before_preinstall,
+    startup_critical_path,
 )
-from utils import startup
+from utils import startup, wait_for_url
 
 
 class FrontendStartupTests(unittest.TestCase):
@@ -198,5 +200,118 @@ class FrontendStartupTests(unittest.TestCase):
         self.assertEqual(attempted, [("infinidysk", "InfiniDysk")])
 
 
+class DependencyStartupTests(unittest.TestCase):
+    def test_dependent_starts_when_upstream_reports_ready(self):
+        ready_at = {}
+        started = {}
+        lock = threading.Lock()
+
+        def start_key(key):
+            with lock:
+                started[key] = time.monotonic()
+            if key == "fails":
+                raise RuntimeError("boom")
+            return True
+
+        def readiness(key):
+            ready_at.setdefault(key, time.monotonic() + 0.05)
+            return "ready" if time.monotonic() >= ready_at[key] else "starting"
+
+        failures, timeline = run_dependency_startup(
+            ["postgres", "prowlarr", "sonarr", "fails", "after_fail"],
+            {
+                "prowlarr": {"postgres"},
+                "sonarr": {"prowlarr", "postgres"},
+                "after_fail": {"fails"},
+            },
+            start_key,
+            readiness,
+            poll_interval=0.01,
+        )
+
+        self.assertEqual(failures, {"fails": "boom"})
+        self.assertGreaterEqual(started["prowlarr"], ready_at["postgres"])
+        self.assertGreaterEqual(started["sonarr"], ready_at["prowlarr"])
+        self.assertIn("after_fail", started)
+        self.assertEqual(timeline["sonarr"]["released_by"], "launched")
+        self.assertEqual(
+            [step["key"] for step in startup_critical_path(timeline)],
+            ["postgres", "prowlarr", "sonarr"],
+        )
+
+    def test_unready_upstream_is_released_after_timeout(self):
+        failures, timeline = run_dependency_startup(
+            ["zurg", "rclone"],
+            {"rclone": {"zurg"}},
+            lambda _key: True,
+            lambda _key: "starting",
+            ready_timeout=0.05,
+            poll_interval=0.01,
+        )
+
+        self.assertEqual(failures, {})
+        self.assertEqual(timeline["zurg"]["released_by"], "timeout")
+        self.assertIn("launched", timeline["rclone"])
+
+    def test_slow_readiness_probe_only_delays_its_own_dependents(self):
+        fast_dependent_started = threading.Event()
+
+        def start_key(key):
+            if key == "after_fast":
+                fast_dependent_started.set()
+            return True
+
+        def readiness(key):
+            if key == "slow":
+                fast_dependent_started.wait(5)
+            return "ready"
+
+        failures, timeline = run_dependency_startup(
+            ["slow", "fast", "after_slow", "after_fast"],
+            {"after_slow": {"slow"}, "after_fast": {"fast"}},
+            start_key,
+            readiness,
+        )
+
+        self.assertEqual(failures, {})
+        self.assertLess(timeline["after_fast"]["started"], timeline["slow"]["released"])
+        self.assertEqual(timeline["slow"]["released_by"], "ready")
+
+    def test_readiness_notification_wakes_the_watcher(self):
+        ready = set()
+
+        def start_key(key):
+            if key == "upstream":
+
+                def mark_ready():
+                    ready.add("upstream")
+                    wait_for_url.notify_readiness_changed()
+
+                threading.Timer(0.05, mark_ready).start()
+            return True
+
+        began = time.monotonic()
+        failures, timeline = run_dependency_startup(
+            ["upstream", "dependent"],
+            {"dependent": {"upstream"}},
+            start_key,
+            lambda key: "ready" if key in ready else "starting",
+            poll_interval=5,
+            max_poll_interval=5,
+            readiness_generation=wait_for_url.readiness_generation,
+            wait_for_readiness=wait_for_url.wait_for_readiness_change,
+        )
+
+        self.assertEqual(failures, {})
+        self.assertEqual(timeline["upstream"]["released_by"], "ready")
+        self.assertLess(time.monotonic() - began, 2)
+
+    def test_cycles_are_reported(self):
+        with self.assertRaises(RuntimeError):
+            run_dependency_startup(
+                ["a", "b"], {"a": {"b"}, "b": {"a"}}, lambda _key: True, str
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import json
 import errno
+import hashlib
 import os
 import tempfile
 import unittest
@@ -190,6 +191,64 @@ class InstallCacheTests(unittest.TestCase):
             self.assertFalse(object_path.exists())
             self.assertTrue(any(cache.quarantine.iterdir()))
 
+    def test_streamed_download_file_is_indexed_by_digest(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = InstallCache(Path(temp_dir, "cache"))
+            source = Path(temp_dir, "release.tar.gz")
+            source.write_bytes(b"streamed-content")
+            digest = hashlib.sha256(b"streamed-content").hexdigest()
+
+            metadata = cache.store_download_file(
+                "https://example.invalid/release.tar.gz",
+                source,
+                digest,
+                etag='"v2"',
+            )
+            object_path, restored = cache.lookup_download_path(
+                "https://example.invalid/release.tar.gz"
+            )
+
+            self.assertEqual(metadata["size"], len(b"streamed-content"))
+            self.assertEqual(object_path, cache._object_path(digest))
+            self.assertEqual(object_path.read_bytes(), b"streamed-content")
+            self.assertEqual(restored["etag"], '"v2"')
+
+            with self.assertRaises(OSError):
+                cache.store_download_file(
+                    "https://example.invalid/other", source, "0" * 64
+                )
+
+    def test_trusted_digest_index_skips_rehashing_unchanged_objects(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = InstallCache(Path(temp_dir, "cache"))
+            source = Path(temp_dir, "layer.tar.gz")
+            source.write_bytes(b"layer-content")
+            digest = hashlib.sha256(b"layer-content").hexdigest()
+            object_path = cache.store_content_file(source, digest)
+
+            with patch.object(
+                install_cache_module, "sha256_file", side_effect=AssertionError
+            ):
+                self.assertEqual(cache.lookup_content(digest), object_path)
+
+            object_path.write_bytes(b"tampered-bytes")
+            self.assertIsNone(cache.lookup_content(digest))
+            self.assertFalse(object_path.exists())
+
+            object_path = cache.store_content_file(source, digest)
+            with patch.object(
+                install_cache_module,
+                "_install_cache_config",
+                return_value={"object_reverify_hours": 0},
+            ):
+                with patch.object(
+                    install_cache_module,
+                    "sha256_file",
+                    wraps=install_cache_module.sha256_file,
+                ) as hashed:
+                    self.assertEqual(cache.lookup_content(digest), object_path)
+                hashed.assert_called_once_with(object_path)
+
     def test_artifact_restore_rejects_modified_files(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir)
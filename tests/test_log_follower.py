@@ -0,0 +1,147 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from api.log_follower import LogFollowerHub
+
+
+class _Viewer:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, message):
+        self.messages.append(json.loads(message))
+        return True
+
+    @property
+    def text(self):
+        return "".join(message["chunk"] for message in self.messages)
+
+
+async def _wait_for(predicate, timeout=3.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("timed out waiting for log follower")
+        await asyncio.sleep(0.02)
+
+
+class LogFollowerHubTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "service.log")
+        with open(self.path, "w") as f:
+            f.write("old line\npartial")
+        self.hub = LogFollowerHub(poll_interval=0.05)
+
+    async def asyncTearDown(self):
+        for path in list(self.hub._followers):
+            for key in list(self.hub._followers[path].subscribers):
+                await self.hub.unsubscribe(path, key)
+        self.temp_dir.cleanup()
+
+    def _append(self, text, path=None):
+        with open(path or self.path, "a") as f:
+            f.write(text)
+
+    async def test_viewers_share_one_follower_and_receive_new_lines(self):
+        first, second = _Viewer(), _Viewer()
+        # A long poll interval leaves inotify as the only prompt trigger.
+        self.hub.poll_interval = 60
+
+        await self.hub.subscribe(self.path, "first", first.send)
+        await self.hub.subscribe(self.path, "second", second.send, tail_bytes=4)
+        self._append(" done\nnew line\n")
+        await _wait_for(lambda: "new line" in first.text and "new line" in second.text)
+
+        self.assertEqual(self.hub.status()["files"], 1)
+        self.assertEqual(self.hub.status()["viewers"], 2)
+        self.assertTrue(self.hub.status()["inotify"])
+        self.assertEqual(first.messages[0]["chunk"], "old line\n")
+        self.assertTrue(first.messages[0]["reset"])
+        self.assertEqual(first.text, "old line\npartial done\nnew line\n")
+        self.assertEqual(second.text, "partial done\nnew line\n")
+        self.assertEqual(first.messages[-1]["cursor"], os.path.getsize(self.path))
+
+    async def test_resumed_viewer_only_receives_lines_after_its_cursor(self):
+        size = len(b"old line\n")
+        probe = _Viewer()
+        await self.hub.subscribe(self.path, "probe", probe.send)
+        file_id = probe.messages[0]["file_id"]
+        self._append("\nmore\n")
+        await _wait_for(lambda: "more" in probe.text)
+
+        viewer = _Viewer()
+        await self.hub.subscribe(
+            self.path, "viewer", viewer.send, cursor=size, file_id=file_id
+        )
+
+        self.assertFalse(viewer.messages[0]["reset"])
+        self.assertEqual(viewer.text, "partial\nmore\n")
+
+    async def test_rotation_drains_old_file_then_follows_replacement(self):
+        viewer = _Viewer()
+        await self.hub.subscribe(self.path, "viewer", viewer.send)
+        first_id = viewer.messages[0]["file_id"]
+
+        self._append(" end\n")
+        os.rename(self.path, self.path + ".1")
+        self._append("fresh\n")
+        await _wait_for(lambda: "fresh" in viewer.text)
+
+        self.assertEqual(viewer.text, "old line\npartial end\nfresh\n")
+        rotated = [message for message in viewer.messages if message["rotated"]]
+        self.assertTrue(rotated)
+        self.assertNotEqual(rotated[0]["file_id"], first_id)
+
+    async def test_polling_fallback_without_inotify(self):
+        self.hub._inotify_failed = True
+        viewer = _Viewer()
+        await self.hub.subscribe(self.path, "viewer", viewer.send)
+
+        self._append("\nvia poll\n")
+        await _wait_for(lambda: "via poll" in viewer.text)
+
+        self.assertFalse(self.hub.status()["inotify"])
+
+    async def test_last_viewer_leaving_releases_the_file(self):
+        viewer = _Viewer()
+        await self.hub.subscribe(self.path, "viewer", viewer.send)
+
+        await self.hub.unsubscribe(self.path, "viewer")
+
+        self.assertEqual(
+            self.hub.status(), {"files": 0, "viewers": 0, "inotify": False}
+        )
+
+    async def test_viewer_joining_while_last_viewer_leaves_keeps_the_file(self):
+        first = _Viewer()
+        await self.hub.subscribe(self.path, "first", first.send)
+        follower = self.hub._followers[self.path]
+        catch_up_started = asyncio.Event()
+        release_catch_up = asyncio.Event()
+        second = _Viewer()
+
+        async def slow_send(message):
+            catch_up_started.set()
+            await release_catch_up.wait()
+            return await second.send(message)
+
+        joining = asyncio.create_task(
+            self.hub.subscribe(self.path, "second", slow_send)
+        )
+        await catch_up_started.wait()
+        await self.hub.unsubscribe(self.path, "first")
+        release_catch_up.set()
+        self.assertTrue(await joining)
+
+        self.assertIs(self.hub._followers.get(self.path), follower)
+        self.assertIsNotNone(follower._file)
+        self._append("\nafter handoff\n")
+        await _wait_for(lambda: "after handoff" in second.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
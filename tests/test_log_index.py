@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from api.routers.logs import filter_dumb_log
+from utils import log_index
+from utils.log_index import (
+    LogLineIndex,
+    get_log_index,
+    line_level,
+    prune_orphan_sidecars,
+    sidecar_path,
+)
+
+_BANNER = "Oct 17, 2026 10:00:00 - INFO - Starting DUMB\n\n  DDDDDDDDDDDDD  UUUU\n"
+
+
+class LogLineIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "DUMB-test.log"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, text, mode="a"):
+        with open(self.path, mode) as f:
+            f.write(text)
+
+    def test_indexes_appended_lines_incrementally_and_persists(self):
+        self._write("".join(f"x - INFO - line {n}\n" for n in range(5)), "w")
+        index = LogLineIndex(self.path, stride=2).refresh()
+        self._write("x - ERROR - broke\nx - INFO - partial")
+        index.refresh()
+
+        self.assertEqual(index.line_count, 6)
+        self.assertEqual(index.level_counts, {"INFO": 5, "ERROR": 1})
+        self.assertEqual(len(index.checkpoints), 3)
+        self.assertEqual(
+            index.read_lines(3, 2), [(3, "x - INFO - line 3"), (4, "x - INFO - line 4")]
+        )
+        self.assertEqual(
+            index.read_lines(0, 10, level="ERROR"), [(5, "x - ERROR - broke")]
+        )
+        self.assertTrue(os.path.exists(sidecar_path(self.path)))
+
+        reloaded = LogLineIndex(self.path, stride=2)
+        self.assertEqual(reloaded.line_count, 6)
+        self._write(" done\n")
+        reloaded.refresh()
+        self.assertEqual(reloaded.read_lines(6, 1), [(6, "x - INFO - partial done")])
+
+    def test_banner_split_across_refreshes_is_detected(self):
+        self._write("x - INFO - before\n" + _BANNER[:60], "w")
+        index = LogLineIndex(self.path).refresh()
+        self.assertIsNone(index.latest_banner())
+
+        self._write(_BANNER[60:] + "x - INFO - after\n")
+        index.refresh()
+
+        line, offset = index.latest_banner()
+        self.assertEqual(line, 1)
+        self.assertEqual(offset, len("x - INFO - before\n"))
+
+    def test_rotation_rebuilds_the_index(self):
+        self._write("x - INFO - one\nx - INFO - two\n", "w")
+        index = LogLineIndex(self.path).refresh()
+        os.rename(self.path, str(self.path) + ".1")
+        self._write("x - WARN - fresh\n", "w")
+
+        index.refresh()
+
+        self.assertEqual(index.line_count, 1)
+        self.assertEqual(index.level_counts, {"WARNING": 1})
+
+    def test_prune_orphan_sidecars_keeps_live_logs(self):
+        self._write("x - INFO - live\n", "w")
+        LogLineIndex(self.path).refresh()
+        rotated = Path(self.temp_dir.name) / "DUMB-old.log"
+        rotated.write_text("x - INFO - old\n")
+        LogLineIndex(rotated).refresh()
+        rotated.unlink()
+        foreign = Path(self.temp_dir.name) / ".library.db.idx"
+        foreign.write_text('{"entries": []}')
+
+        removed = prune_orphan_sidecars(self.temp_dir.name)
+
+        self.assertEqual(removed, [".DUMB-old.log.idx"])
+        self.assertTrue(foreign.exists())
+        self.assertTrue(os.path.exists(sidecar_path(self.path)))
+        self.assertFalse(os.path.exists(sidecar_path(rotated)))
+
+    def test_get_log_index_evicts_least_recently_used_and_deleted_logs(self):
+        paths = []
+        for n in range(3):
+            path = Path(self.temp_dir.name) / f"DUMB-{n}.log"
+            path.write_text(f"x - INFO - {n}\n")
+            paths.append(str(path))
+
+        with (
+            patch.object(log_index, "_indexes", log_index.OrderedDict()),
+            patch.object(log_index, "MAX_CACHED_INDEXES", 2),
+        ):
+            get_log_index(paths[0])
+            get_log_index(paths[1])
+            get_log_index(paths[0])
+            get_log_index(paths[2])
+            self.assertEqual(list(log_index._indexes), [paths[0], paths[2]])
+
+            os.remove(paths[2])
+            get_log_index(paths[1])
+            self.assertEqual(list(log_index._indexes), [paths[0], paths[1]])
+
+    def test_line_level_normalizes_common_spellings(self):
+        self.assertEqual(line_level(b"2026-01-01 [WRN] WARN something"), "WARNING")
+        self.assertEqual(line_level(b"level=FATAL msg"), "CRITICAL")
+        self.assertIsNone(line_level(b"Information only"))
+
+    def test_filter_dumb_log_returns_from_latest_banner(self):
+        self._write("x - INFO - old\n" + _BANNER + "x - INFO - first run\n", "w")
+        self._write(_BANNER + "x - INFO - second run\n")
+
+        text = filter_dumb_log(self.path, Mock())
+
+        self.assertEqual(text, _BANNER + "x - INFO - second run\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
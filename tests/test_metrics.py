@@ -1,6 +1,8 @@
 import builtins
 import io
+import os
 import sys
+import tempfile
 import types
 import unittest
 from unittest.mock import patch
@@ -235,6 +237,179 @@ class MetricsCollectorHelperTests(unittest.TestCase):
         with patch.object(builtins, "open", fake_open_int):
             self.assertEqual(self.collector._read_cgroup_int("memory.current"), 42)
 
+    def test_collection_intervals_fall_back_to_defaults_and_clamp(self):
+        intervals = metrics._collection_intervals(
+            {"connections_sec": 2, "filesystems_sec": "bad", "external_sec": 9999}
+        )
+
+        self.assertEqual(intervals["system"], 0)
+        self.assertEqual(intervals["connections"], 2)
+        self.assertEqual(intervals["filesystems"], 30)
+        self.assertEqual(intervals["external"], 3600)
+        self.assertEqual(
+            metrics._collection_intervals(None), metrics.DEFAULT_COLLECTION_INTERVALS
+        )
+
+    def test_cached_sections_are_reused_until_family_interval_elapses(self):
+        loads = []
+
+        def load():
+            loads.append(1)
+            return len(loads)
+
+        with patch("utils.metrics.time.monotonic", return_value=100.0):
+            self.collector._begin_collection({"filesystems_sec": 30})
+            first = self.collector._cached_section("filesystems", ("/",), load)
+        with patch("utils.metrics.time.monotonic", return_value=120.0):
+            self.collector._begin_collection({"filesystems_sec": 30})
+            second = self.collector._cached_section("filesystems", ("/",), load)
+            ages = self.collector._collection_ages()
+        with patch("utils.metrics.time.monotonic", return_value=131.0):
+            self.collector._begin_collection({"filesystems_sec": 30})
+            third = self.collector._cached_section("filesystems", ("/",), load)
+
+        self.assertEqual((first, second, third), (1, 1, 2))
+        self.assertEqual(ages["filesystems"], {"interval_sec": 30, "age_sec": 20.0})
+        self.assertEqual(ages["system"], {"interval_sec": 0, "age_sec": 0.0})
+
+    def test_process_connections_are_cached_per_pid(self):
+        class FakeProc:
+            pid = 42
+            calls = 0
+
+            def cpu_percent(self, interval=None):
+                return 1.0
+
+            def memory_info(self):
+                return types.SimpleNamespace(rss=1, vms=2)
+
+            def num_threads(self):
+                return 3
+
+            def io_counters(self):
+                raise AttributeError
+
+            def net_connections(self, kind="inet"):
+                FakeProc.calls += 1
+                return [
+                    types.SimpleNamespace(
+                        status="LISTEN",
+                        laddr=types.SimpleNamespace(ip="0.0.0.0", port=8080),
+                        raddr=None,
+                    )
+                ]
+
+        self.collector._begin_collection(None)
+        with patch("utils.metrics._read_socket_table", return_value=None):
+            first = self.collector._collect_process_metrics(FakeProc())
+            second = self.collector._collect_process_metrics(FakeProc())
+
+        self.assertEqual(first["ports"], [8080])
+        self.assertEqual(second["ports"], [8080])
+        self.assertEqual(FakeProc.calls, 2)
+
+    def test_read_proc_stat_handles_command_names_with_parentheses(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "stat")
+            with open(path, "w") as f:
+                f.write(
+                    "12 (my (odd) proc) S 1 12 12 0 -1 0 0 0 0 0 70 30 0 0 20 0 "
+                    "4 0 5000 8192 3 18446744073709551615\n"
+                )
+
+            sample = metrics._read_proc_stat(path)
+
+        self.assertEqual(sample["name"], "my (odd) proc")
+        self.assertEqual(sample["cpu_ticks"], 100)
+        self.assertEqual(sample["threads"], 4)
+        self.assertEqual(sample["start_time"], 5000)
+        self.assertEqual(sample["vms"], 8192)
+        self.assertEqual(sample["rss"], 3 * metrics._PAGE_SIZE)
+
+    def test_external_processes_are_ranked_by_cpu_delta_before_enrichment(self):
+        def sample(name, ticks, start_time=1, rss=0):
+            return {
+                "name": name,
+                "cpu_ticks": ticks,
+                "threads": 1,
+                "start_time": start_time,
+                "vms": 0,
+                "rss": rss,
+            }
+
+        scans = [
+            {1: sample("idle", 0), 2: sample("busy", 0), 3: sample("managed", 0)},
+            {
+                1: sample("idle", 10, rss=5),
+                2: sample("busy", 100),
+                3: sample("managed", 500),
+                4: sample("new", 0, rss=10),
+            },
+        ]
+        enriched = []
+
+        def get_process(pid):
+            enriched.append(pid)
+            return None
+
+        with (
+            patch("utils.metrics._scan_proc_stats", side_effect=scans),
+            patch("utils.metrics._CLOCK_TICKS", 100),
+            patch("utils.metrics.time.monotonic", side_effect=[10.0, 12.0]),
+            patch.object(self.collector, "_get_process", side_effect=get_process),
+            patch.object(self.collector, "_detect_container_id", return_value=None),
+        ):
+            self.collector._collect_external_processes({3}, limit=2)
+            enriched.clear()
+            external = self.collector._collect_external_processes({3}, limit=2)
+
+        self.assertEqual([entry["name"] for entry in external], ["busy", "idle"])
+        self.assertEqual([entry["cpu_percent"] for entry in external], [50.0, 5.0])
+        self.assertEqual(enriched, [2, 1])
+
+    def test_socket_index_answers_port_and_connection_lookups(self):
+        header = "  sl  local_address rem_address   st tx_queue rx_queue\n"
+        with tempfile.TemporaryDirectory() as proc_root:
+            os.makedirs(os.path.join(proc_root, "net"))
+            os.makedirs(os.path.join(proc_root, "7", "fd"))
+            with open(os.path.join(proc_root, "net", "tcp"), "w") as f:
+                f.write(
+                    header
+                    + "0: 0100007F:1F90 00000000:0000 0A 0:0 00:0 0 0 0 101\n"
+                    + "1: 0100007F:1F90 0100007F:D431 01 0:0 00:0 0 0 0 102\n"
+                    + "2: 0100007F:0050 00000000:0000 0A 0:0 00:0 0 0 0 999\n"
+                )
+            with open(os.path.join(proc_root, "net", "tcp6"), "w") as f:
+                f.write(
+                    header + "0: 00000000000000000000000001000000:0050 "
+                    "00000000000000000000000000000000:0000 0A 0:0 00:0 0 0 0 103\n"
+                )
+            for fd, target in (
+                ("3", "socket:[101]"),
+                ("4", "socket:[102]"),
+                ("5", "socket:[103]"),
+                ("6", "pipe:[55]"),
+            ):
+                os.symlink(target, os.path.join(proc_root, "7", "fd", fd))
+
+            with patch("utils.metrics._PROC_ROOT", proc_root):
+                self.collector._begin_collection(None)
+                ports, connections = self.collector._collect_socket_metrics(
+                    types.SimpleNamespace(pid=7)
+                )
+
+        self.assertEqual(ports, [80, 8080])
+        self.assertEqual(
+            connections,
+            [
+                {
+                    "status": "ESTABLISHED",
+                    "laddr": ["127.0.0.1", 8080],
+                    "raddr": ["127.0.0.1", 54321],
+                }
+            ],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
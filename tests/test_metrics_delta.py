@@ -0,0 +1,172 @@
+import json
+import unittest
+
+from starlette.websockets import WebSocketState
+
+from api.connection_manager import ConnectionManager
+from utils.metrics_delta import (
+    MetricsDeltaStream,
+    apply_patch,
+    diff_snapshot,
+    filter_snapshot,
+    normalize_subscription,
+)
+
+
+def _snapshot(timestamp, cpu=10.0, external=None):
+    return {
+        "timestamp": timestamp,
+        "system": {"cpu_percent": cpu, "mem": {"percent": 40.0}},
+        "dumb_managed": [
+            {"name": "Zurg", "pid": 10, "cpu_percent": 1.0},
+            {"name": "Riven", "pid": 11, "cpu_percent": 2.0},
+        ],
+        "external": external or [],
+        "database_health": {"services": []},
+        "plex_status": None,
+    }
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.client_state = WebSocketState.CONNECTED
+        self.application_state = WebSocketState.CONNECTED
+        self.messages = []
+
+    async def accept(self):
+        return None
+
+    async def send_text(self, message):
+        self.messages.append(json.loads(message))
+
+
+class MetricsDeltaTests(unittest.TestCase):
+    def test_diff_round_trips_nested_changes(self):
+        previous = _snapshot(1, external=[{"name": "a/b", "cpu_percent": 1.0}])
+        current = _snapshot(2, cpu=55.0)
+        current["system"]["mem"].pop("percent")
+        current["system"]["load"] = [1, 2, 3]
+        current["database_health"] = {"services": [], "a~b/c": True}
+
+        ops = diff_snapshot(previous, current)
+
+        self.assertEqual(apply_patch(previous, ops), current)
+        self.assertIn(
+            {"op": "replace", "path": "/system/cpu_percent", "value": 55.0}, ops
+        )
+        self.assertIn({"op": "remove", "path": "/system/mem/percent"}, ops)
+        self.assertIn(
+            {"op": "add", "path": "/database_health/a~0b~1c", "value": True}, ops
+        )
+
+    def test_unchanged_snapshot_produces_no_ops(self):
+        self.assertEqual(diff_snapshot(_snapshot(1), _snapshot(1)), [])
+
+    def test_subscription_filters_sections_and_process_names(self):
+        sections, processes = normalize_subscription(
+            "dumb_managed,system", ["ZURG", " "]
+        )
+
+        view = filter_snapshot(_snapshot(1), sections, processes)
+
+        self.assertEqual(set(view), {"timestamp", "system", "dumb_managed"})
+        self.assertEqual([proc["name"] for proc in view["dumb_managed"]], ["Zurg"])
+        with self.assertRaises(ValueError):
+            normalize_subscription("system,unknown")
+
+
+class MetricsDeltaPublisherTests(unittest.IsolatedAsyncioTestCase):
+    async def test_publisher_sends_keyframes_then_shared_deltas(self):
+        manager = ConnectionManager()
+        stream = MetricsDeltaStream()
+        legacy = _FakeWebSocket()
+        first = _FakeWebSocket()
+        second = _FakeWebSocket()
+        for websocket in (legacy, first, second):
+            await manager.connect(websocket)
+        stream.subscribe(first, "system")
+        stream.subscribe(second, "system")
+
+        await stream.publish(_snapshot(1), manager)
+        await stream.publish(_snapshot(2, cpu=20.0), manager)
+
+        self.assertEqual([msg["type"] for msg in legacy.messages], ["snapshot"] * 2)
+        self.assertEqual([msg["type"] for msg in first.messages], ["keyframe", "delta"])
+        self.assertEqual(first.messages, second.messages)
+        self.assertEqual(set(first.messages[0]["data"]), {"timestamp", "system"})
+        delta = first.messages[1]
+        self.assertEqual((delta["seq"], delta["base"]), (2, 1))
+        self.assertEqual(
+            apply_patch(first.messages[0]["data"], delta["ops"]),
+            filter_snapshot(_snapshot(2, cpu=20.0), ("system",)),
+        )
+
+    async def test_resync_and_resubscribe_request_a_keyframe(self):
+        manager = ConnectionManager()
+        stream = MetricsDeltaStream()
+        websocket = _FakeWebSocket()
+        await manager.connect(websocket)
+        stream.subscribe(websocket)
+        await stream.publish(_snapshot(1), manager)
+
+        stream.handle_message(websocket, '{"type": "resync"}')
+        await stream.publish(_snapshot(2), manager)
+        stream.handle_message(
+            websocket,
+            json.dumps({"type": "subscribe", "processes": ["Riven"]}),
+        )
+        await stream.publish(_snapshot(3), manager)
+        stream.handle_message(websocket, "not json")
+        await stream.publish(_snapshot(4), manager)
+
+        self.assertEqual(
+            [msg["type"] for msg in websocket.messages],
+            ["keyframe", "keyframe", "keyframe", "delta"],
+        )
+        self.assertEqual(
+            [proc["name"] for proc in websocket.messages[2]["data"]["dumb_managed"]],
+            ["Riven"],
+        )
+        self.assertEqual(len(stream.groups), 1)
+
+    async def test_invalid_sections_are_rejected_with_an_error_frame(self):
+        manager = ConnectionManager()
+        stream = MetricsDeltaStream()
+        websocket = _FakeWebSocket()
+        await manager.connect(websocket)
+
+        error = stream.subscribe(websocket, "system,unknown")
+        self.assertEqual(
+            json.loads(error),
+            {"type": "error", "detail": "Unknown metrics section: unknown"},
+        )
+        self.assertNotIn(websocket, stream.clients)
+
+        self.assertIsNone(stream.subscribe(websocket, "system"))
+        error = stream.handle_message(
+            websocket, json.dumps({"type": "subscribe", "sections": ["bogus"]})
+        )
+        self.assertEqual(json.loads(error)["type"], "error")
+        self.assertEqual(stream.clients[websocket]["sections"], ("system",))
+
+    async def test_non_list_subscription_fields_are_rejected_with_an_error_frame(self):
+        stream = MetricsDeltaStream()
+        websocket = _FakeWebSocket()
+        stream.subscribe(websocket, "system")
+
+        for payload in (
+            {"type": "subscribe", "sections": 5},
+            {"type": "subscribe", "processes": 5},
+            {"type": "subscribe", "sections": {"system": True}},
+            {"type": "subscribe", "processes": ["Riven", 7]},
+        ):
+            with self.subTest(payload=payload):
+                error = stream.handle_message(websocket, json.dumps(payload))
+
+                self.assertEqual(json.loads(error)["type"], "error")
+                self.assertEqual(stream.clients[websocket]["sections"], ("system",))
+                self.assertIsNone(stream.clients[websocket]["processes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ from unittest.mock import Mock, patch
 from utils.metrics_history_store import (
     MetricsHistoryManager,
     SQLiteMetricsHistoryStore,
+    _used_bytes,
 )
 from utils.metrics_postgres import (
     activate_metrics_postgresql,
@@ -109,6 +110,9 @@ class _MemoryPostgresStore:
     def prune(self, retention_days=0, max_total_mb=0):
         return 0
 
+    def prune_rollups(self, retention):
+        return 0
+
     def read(self, since=None, limit=5000):
         items = [
             item for item in self.items if since is None or item["timestamp"] >= since
@@ -156,6 +160,208 @@ class MetricsHistoryStoreTests(unittest.TestCase):
 
             self.assertEqual([item["timestamp"] for item in items], [7.0, 8.0, 9.0])
 
+    def test_sqlite_series_reads_only_requested_typed_columns(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SQLiteMetricsHistoryStore(os.path.join(temp_dir, "metrics.sqlite"))
+            snapshot = _snapshot(1000)
+            snapshot["system"]["filesystems"] = [
+                {"path": "/mnt", "percent": 55.0, "inode": {"percent": 3.0}},
+                {"path": "/", "percent": 20.0, "inode": None},
+            ]
+            snapshot["system"]["network_interfaces"] = [
+                {"name": "eth0", "sent_bytes": 10, "recv_bytes": 20}
+            ]
+            store.write(snapshot)
+
+            with patch(
+                "utils.metrics_history_store._decode_snapshot",
+                side_effect=AssertionError("payload decoded"),
+            ):
+                cpu_only = store.read_series(fields="cpu,mem")
+                everything = store.read_series()
+
+            self.assertEqual(
+                cpu_only,
+                [
+                    {
+                        "timestamp": 1000.0,
+                        "system": {
+                            "cpu_percent": 12.5,
+                            "cpu_count": 8,
+                            "mem": {"percent": 42.0},
+                        },
+                    }
+                ],
+            )
+            system = everything[0]["system"]
+            self.assertEqual(
+                system["disk_io"], {"read_bytes": 1000, "write_bytes": 2000}
+            )
+            self.assertEqual(
+                system["filesystems"],
+                [
+                    {"path": "/mnt", "percent": 55.0, "inode": {"percent": 3.0}},
+                    {"path": "/", "percent": 20.0},
+                ],
+            )
+            self.assertEqual(
+                system["network_interfaces"],
+                [{"name": "eth0", "sent_bytes": 10, "recv_bytes": 20}],
+            )
+            with self.assertRaises(ValueError):
+                store.read_series(fields="cpu,processes")
+
+    def test_migration_backfills_series_for_legacy_payload_rows(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = MetricsHistoryManager(_ConfigManager(temp_dir))
+            manager._configure()
+            manager._sqlite.write_many([_snapshot(1000), _snapshot(1005)])
+            with manager._sqlite._connect() as connection:
+                connection.execute("DELETE FROM metrics_series")
+                connection.execute("DELETE FROM metrics_series_labels")
+
+            result = manager.migrate_legacy(force=True)
+            items, truncated = manager.read_series(full=True, fields=["cpu"])
+
+            self.assertEqual(result["series"]["samples"], 2)
+            self.assertTrue(result["series"]["completed"])
+            self.assertFalse(truncated)
+            self.assertEqual([item["timestamp"] for item in items], [1000.0, 1005.0])
+            self.assertEqual(manager.status()["sqlite"]["series_samples"], 2)
+
+    def test_sqlite_prune_removes_series_rows_with_payloads(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SQLiteMetricsHistoryStore(os.path.join(temp_dir, "metrics.sqlite"))
+            now = time.time()
+            store.write(_snapshot(now - 10 * 86400))
+            store.write(_snapshot(now))
+
+            store.prune(retention_days=7)
+
+            self.assertEqual(
+                [item["timestamp"] for item in store.read_series(fields="cpu")],
+                [now],
+            )
+
+    def test_sqlite_size_cap_counts_series_tables_and_page_overhead(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SQLiteMetricsHistoryStore(
+                os.path.join(temp_dir, "metrics.sqlite"), rollup_resolutions=()
+            )
+            store.write_many([_snapshot(1000 + index) for index in range(3000)])
+            with store._connect() as connection:
+                payload_bytes = connection.execute(
+                    "SELECT SUM(stored_size) FROM metrics_snapshots"
+                ).fetchone()[0]
+                series_rows = connection.execute(
+                    "SELECT COUNT(*) FROM metrics_series"
+                ).fetchone()[0]
+            self.assertEqual(series_rows, 3000)
+            cap_mb = payload_bytes * 1.1 / (1024 * 1024)
+
+            deleted = store.prune(max_total_mb=cap_mb)
+
+            self.assertGreater(deleted, 0)
+            with store._connect() as connection:
+                self.assertLessEqual(
+                    _used_bytes(connection),
+                    cap_mb * 1024 * 1024,
+                )
+                remaining = connection.execute(
+                    "SELECT MIN(timestamp) FROM metrics_series"
+                ).fetchone()[0]
+            self.assertEqual(remaining, 1000 + deleted)
+
+    def test_sqlite_rollups_aggregate_min_max_avg_and_ignore_replays(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SQLiteMetricsHistoryStore(os.path.join(temp_dir, "metrics.sqlite"))
+            first = _snapshot(600)
+            second = _snapshot(630)
+            second["system"]["cpu_percent"] = 50.0
+            store.write_many([first, second])
+            store.write_many([second])
+
+            items, extrema = store.read_rollups(60, fields="cpu")
+            with store._connect() as connection:
+                row = connection.execute(
+                    "SELECT sum_value / sample_count, sample_count "
+                    "FROM metrics_rollups WHERE resolution = 60 "
+                    "AND metric = 'cpu_percent'"
+                ).fetchone()
+
+            self.assertEqual([item["timestamp"] for item in items], [600.0])
+            self.assertEqual(items[0]["system"]["cpu_percent"], 50.0)
+            self.assertEqual(extrema["cpu"], {"min": 12.5, "max": 50.0})
+            self.assertEqual(row, (31.25, 2))
+
+    def test_rollup_tiers_have_independent_retention(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SQLiteMetricsHistoryStore(os.path.join(temp_dir, "metrics.sqlite"))
+            old = time.time() - 10 * 86400
+            store.write(_snapshot(old))
+
+            store.prune_rollups({60: 7, 3600: 90})
+
+            self.assertEqual(store.read_rollups(60, fields="cpu")[0], [])
+            self.assertEqual(len(store.read_rollups(3600, fields="cpu")[0]), 1)
+
+    def test_history_series_uses_coarsest_rollup_tier_for_long_ranges(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = MetricsHistoryManager(_ConfigManager(temp_dir))
+            manager._configure()
+            now = time.time()
+            manager._sqlite.write_many(
+                [_snapshot(now - offset) for offset in range(0, 7200, 600)]
+            )
+
+            with patch.object(
+                manager._sqlite, "read_rollups", wraps=manager._sqlite.read_rollups
+            ) as read_rollups:
+                items, series, _truncated, stats, bucket = manager.read_history_series(
+                    since=now - 30 * 86400, max_points=600, fields="cpu,mem"
+                )
+                manager.read_history_series(since=now - 3600, fields="cpu")
+
+            read_rollups.assert_called_once()
+            self.assertEqual(read_rollups.call_args.kwargs["resolution"], 3600)
+            self.assertGreaterEqual(bucket, 4320)
+            self.assertEqual(stats["cpu"], {"min": 12.5, "max": 12.5})
+            self.assertEqual(len(series["cpu"]), len(items))
+
+    def test_rollup_tier_is_skipped_when_retention_does_not_cover_range(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = _ConfigManager(temp_dir)
+            config.config["dumb"]["metrics"]["storage"]["rollups"] = {
+                "minute_retention_days": 7,
+                "five_minute_retention_days": 30,
+                "hour_retention_days": 10,
+            }
+            manager = MetricsHistoryManager(config)
+            now = time.time()
+
+            self.assertEqual(
+                manager._select_rollup_resolution(now - 26 * 86400, None, 600), 300
+            )
+            self.assertIsNone(
+                manager._select_rollup_resolution(now - 60 * 86400, None, 600)
+            )
+
+    def test_rollups_are_rebuilt_when_tiers_are_enabled(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = _ConfigManager(temp_dir)
+            config.config["dumb"]["metrics"]["storage"]["rollups"] = {"enabled": False}
+            manager = MetricsHistoryManager(config)
+            manager._configure()
+            manager._sqlite.write(_snapshot(1000))
+            self.assertEqual(manager.status()["sqlite"]["rollup_rows"], {})
+
+            config.config["dumb"]["metrics"]["storage"]["rollups"]["enabled"] = True
+            manager._configure()
+
+            self.assertEqual(
+                set(manager.status()["sqlite"]["rollup_rows"]), {"60", "300", "3600"}
+            )
+
     def test_retention_maintenance_is_throttled_and_reapplies_config_changes(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             config_manager = _ConfigManager(temp_dir)
@@ -193,6 +399,27 @@ class MetricsHistoryStoreTests(unittest.TestCase):
             self.assertEqual(second["samples"], 2)
             self.assertEqual(manager.status()["sqlite"]["samples"], 2)
 
+    def test_configure_backfills_series_once(self):
+        for migrate_jsonl in (True, False):
+            with (
+                self.subTest(migrate_jsonl=migrate_jsonl),
+                tempfile.TemporaryDirectory() as temp_dir,
+            ):
+                config = _ConfigManager(temp_dir)
+                config.config["dumb"]["metrics"]["storage"][
+                    "migrate_jsonl"
+                ] = migrate_jsonl
+                manager = MetricsHistoryManager(config)
+                with patch.object(
+                    MetricsHistoryManager,
+                    "_backfill_series",
+                    autospec=True,
+                    side_effect=MetricsHistoryManager._backfill_series,
+                ) as backfill:
+                    manager._configure()
+
+                self.assertEqual(backfill.call_count, 1)
+
     def test_failed_jsonl_batch_is_not_marked_complete_and_retries(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             manager = MetricsHistoryManager(_ConfigManager(temp_dir))
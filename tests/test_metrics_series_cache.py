@@ -0,0 +1,105 @@
+import time
+import unittest
+from unittest.mock import Mock
+
+from utils.metrics_history_reader import prepare_history_series
+from utils.metrics_series_cache import MetricsSeriesCache
+
+
+def _snapshot(timestamp, cpu=10.0, sent=0):
+    return {
+        "timestamp": float(timestamp),
+        "system": {
+            "cpu_percent": cpu,
+            "mem": {"percent": 40.0},
+            "net_io": {"sent_bytes": sent, "recv_bytes": 0},
+        },
+        "dumb_managed": [],
+        "external": [],
+    }
+
+
+def _loader(items):
+    def load(since=None, full=False, limit=5000, default_hours=6, **kwargs):
+        kwargs.pop("fields", None)
+        return prepare_history_series(
+            items,
+            since=since,
+            full=full,
+            default_hours=default_hours,
+            **kwargs,
+        )
+
+    return Mock(side_effect=load)
+
+
+class MetricsSeriesCacheTests(unittest.TestCase):
+    def test_bootstrap_is_served_from_cache_and_extended_by_snapshots(self):
+        now = time.time()
+        since = now - 3600
+        cache = MetricsSeriesCache()
+        loader = _loader([_snapshot(now - 600, cpu=20.0), _snapshot(now - 60)])
+        request = {"since": since, "max_points": 60}
+
+        first = cache.get(loader, **request)
+        cache.extend(_snapshot(now + 120, cpu=90.0, sent=1000))
+        second = cache.get(loader, since=since + 5, max_points=60)
+
+        loader.assert_called_once()
+        self.assertEqual(second[4], first[4])
+        self.assertEqual(second[0][-1]["timestamp"], now + 120)
+        self.assertEqual(second[1]["cpu"][-1], 90.0)
+        self.assertEqual(second[3]["cpu"], {"min": 10.0, "max": 90.0})
+        self.assertEqual(cache.status()["hits"], 1)
+
+    def test_snapshot_in_same_bucket_replaces_latest_item(self):
+        now = 1_800_000_000.0
+        cache = MetricsSeriesCache()
+        loader = _loader([_snapshot(now)])
+        cache.get(loader, since=time.time() - 3600, max_points=60)
+
+        cache.extend(_snapshot(now + 1, cpu=55.0))
+        entry = next(iter(cache._entries.values()))
+
+        self.assertEqual(len(entry["items"]), 1)
+        self.assertEqual(entry["items"][0]["system"]["cpu_percent"], 55.0)
+
+    def test_entries_are_evicted_lru_within_entry_and_byte_caps(self):
+        now = time.time()
+        cache = MetricsSeriesCache(max_entries=2)
+        loader = _loader([_snapshot(now)])
+        for hours in (1, 2, 3):
+            cache.get(loader, since=now - hours * 3600, max_points=60)
+
+        self.assertEqual([key[0] for key in cache._entries], [2 * 3600, 3 * 3600])
+
+        capped = MetricsSeriesCache(max_bytes=1)
+        capped.get(loader, since=now - 3600, max_points=60)
+        self.assertEqual(capped.status()["entries"], 0)
+
+    def test_full_truncated_and_stale_requests_reload(self):
+        now = time.time()
+        cache = MetricsSeriesCache(stale_after=0)
+        loader = _loader([_snapshot(now)])
+
+        cache.get(loader, full=True)
+        cache.get(loader, since=now - 3600, max_points=60)
+        cache.get(loader, since=now - 3600, max_points=60)
+
+        self.assertEqual(loader.call_count, 3)
+
+    def test_field_scoped_entries_store_projected_snapshots(self):
+        now = time.time()
+        cache = MetricsSeriesCache()
+        loader = _loader([_snapshot(now - 60)])
+        cache.get(loader, since=now - 3600, max_points=60, fields="cpu")
+
+        cache.extend(_snapshot(now + 60, cpu=33.0))
+        items = cache.get(loader, since=now - 3600, max_points=60, fields="cpu")[0]
+
+        self.assertEqual(items[-1]["system"]["cpu_percent"], 33.0)
+        self.assertIsNone(items[-1]["system"]["mem"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -593,6 +593,31 @@ class ProcessNotificationTests(unittest.TestCase):
         self.assertEqual(readiness["health_status"], "starting")
         self.assertIn("migrating", readiness["reason"])
 
+    @patch("utils.processes.record_service_readiness")
+    def test_readiness_is_recorded_by_the_probe_not_the_accessor(self, record):
+        handler = object.__new__(ProcessHandler)
+        handler.init_attributes(Mock())
+        process = Mock()
+        process.poll.return_value = None
+        handler.processes[1234] = {
+            "name": "Example",
+            "process_obj": process,
+            "start_time": 1,
+        }
+        handler._probe_process_health = Mock(
+            return_value={"status": "healthy", "healthy": True, "reason": None}
+        )
+
+        handler.get_process_health("Example", 1234)
+        record.assert_called_once_with("example", True)
+        record.reset_mock()
+        handler.get_process_health = Mock(
+            return_value={"status": "starting", "healthy": True, "reason": None}
+        )
+        handler.get_service_readiness("Example")
+
+        record.assert_not_called()
+
     def test_starting_health_does_not_count_as_auto_restart_failure(self):
         handler = object.__new__(ProcessHandler)
         handler.get_process_health = Mock(
@@ -740,6 +765,75 @@ class ProcessNotificationTests(unittest.TestCase):
 
         self.assertEqual(observed_grace_periods, [300])
 
+    def test_slow_health_probe_does_not_delay_other_services(self):
+        handler = object.__new__(ProcessHandler)
+        handler.init_attributes(Mock())
+        for name in ("Slow", "Fast"):
+            process = Mock(pid=100 if name == "Slow" else 200)
+            process.poll.return_value = None
+            handler.process_names[name] = process
+        handler.wait_for_startup_complete = Mock(return_value=True)
+        handler._get_auto_restart_config = Mock(return_value={"enabled": True})
+        handler._get_service_restart_policy = Mock(
+            return_value={"enabled": True, "healthcheck_interval": 30}
+        )
+        handler._is_restart_disabled = Mock(return_value=False)
+        handler._is_ready_for_healthcheck = Mock(return_value=True)
+        release_slow = threading.Event()
+        fast_checked = threading.Event()
+
+        def check(process_name, _pid):
+            if process_name == "Slow":
+                release_slow.wait(timeout=5)
+            else:
+                fast_checked.set()
+            return True, None
+
+        handler._check_process_health = check
+        try:
+            handler.start_auto_restart_monitor()
+            self.assertTrue(fast_checked.wait(timeout=2))
+            self.assertIsNone(
+                handler._get_restart_state("Slow")["last_healthcheck_time"]
+            )
+        finally:
+            handler.shutting_down = True
+            release_slow.set()
+            handler.auto_restart_thread.join(timeout=6)
+
+    def test_status_listeners_hear_health_transitions_once(self):
+        handler = object.__new__(ProcessHandler)
+        handler.init_attributes(Mock())
+        events = []
+        handler.add_status_listener(lambda name, event: events.append((name, event)))
+        policy = {"unhealthy_threshold": 3}
+
+        handler._record_healthcheck_result("Example", True, None, policy)
+        handler._record_healthcheck_result("Example", True, None, policy)
+        handler._record_healthcheck_result("Example", False, "down", policy)
+        handler._record_healthcheck_result("Example", False, "down", policy)
+
+        self.assertEqual(events, [("Example", "health"), ("Example", "health")])
+
+    def test_probe_path_reports_health_transitions_to_status_listeners(self):
+        handler = object.__new__(ProcessHandler)
+        handler.init_attributes(Mock())
+        events = []
+        handler.add_status_listener(lambda name, event: events.append((name, event)))
+        handler._probe_process_health = Mock(
+            side_effect=[
+                {"status": "starting", "healthy": True, "reason": None},
+                {"status": "starting", "healthy": True, "reason": None},
+                {"status": "healthy", "healthy": True, "reason": None},
+            ]
+        )
+
+        with patch("utils.processes.record_service_readiness"):
+            for _ in range(3):
+                handler.get_process_health("Example", 1234)
+
+        self.assertEqual(events, [("Example", "health")])
+
     def test_expected_service_monitoring_stays_paused_when_startup_is_degraded(self):
         handler = object.__new__(ProcessHandler)
         handler.init_attributes(Mock())
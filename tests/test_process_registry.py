@@ -0,0 +1,47 @@
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from utils.process_registry import ProcessRegistry
+
+
+class ProcessRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "healthcheck" / "running.json"
+        self.registry = ProcessRegistry(file_path=str(self.path))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_lookup_matches_normalized_names_and_seq_tracks_changes(self):
+        self.assertTrue(self.registry.replace({"Zurg w/ rclone": 10, "rclone": 11}))
+        self.assertFalse(self.registry.replace({"Zurg w/ rclone": 10, "rclone": 11}))
+
+        self.assertEqual(self.registry.seq, 1)
+        self.assertEqual(self.registry.lookup("zurgw/rclone"), ("Zurg w/ rclone", 10))
+        self.assertEqual(self.registry.lookup(" RCLONE "), ("rclone", 11))
+        self.assertIsNone(self.registry.lookup("riven"))
+
+        self.registry.replace({"rclone": 11})
+        self.assertEqual(self.registry.snapshot(), (2, {"rclone": 11}))
+        self.assertIsNone(self.registry.lookup("Zurg w/ rclone"))
+
+    def test_file_is_written_in_the_background_for_healthcheck(self):
+        self.registry.replace({"Riven": 42})
+
+        for _ in range(200):
+            if self.path.exists():
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(json.loads(self.path.read_text()), {"Riven": 42})
+        self.registry.replace({})
+        self.registry.flush()
+        self.assertEqual(json.loads(self.path.read_text()), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
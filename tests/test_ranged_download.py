@@ -0,0 +1,149 @@
+import hashlib
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from utils.ranged_download import (
+    DigestMismatch,
+    RangedDownloadError,
+    SegmentedDownload,
+    probe_range,
+    state_path,
+)
+
+_CONTENT = bytes(range(256)) * 40
+
+
+class _Response:
+    def __init__(self, status_code, body, headers=None, fail_after=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = dict(headers or {})
+        self.fail_after = fail_after
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        sent = 0
+        for offset in range(0, len(self.body), 100):
+            if self.fail_after is not None and sent >= self.fail_after:
+                raise OSError("connection reset")
+            chunk = self.body[offset : offset + 100]
+            sent += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class _RangeServer:
+    def __init__(self, content, etag='"v1"', fail_ranges=()):
+        self.content = content
+        self.etag = etag
+        self.fail_ranges = set(fail_ranges)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, start, end, validator=None):
+        with self.lock:
+            self.requests.append((start, end, validator))
+        if validator and validator != self.etag:
+            return _Response(200, self.content, {"ETag": self.etag})
+        end = min(end, len(self.content) - 1)
+        fail_after = 150 if (start, end) in self.fail_ranges else None
+        self.fail_ranges.discard((start, end))
+        return _Response(
+            206,
+            self.content[start : end + 1],
+            {
+                "Content-Range": f"bytes {start}-{end}/{len(self.content)}",
+                "ETag": self.etag,
+            },
+            fail_after=fail_after,
+        )
+
+    def probe(self, segment_bytes):
+        _unit, span = probe_range(segment_bytes).split("=")
+        start, end = (int(value) for value in span.split("-"))
+        return self.get(start, end)
+
+
+class SegmentedDownloadTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.part = Path(self.temp_dir.name) / "asset.part"
+        self.digest = hashlib.sha256(_CONTENT).hexdigest()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _download(self, server, **kwargs):
+        return SegmentedDownload(
+            server.get,
+            self.part,
+            identity="https://example.invalid/asset",
+            segment_bytes=1024,
+            connections=4,
+            **kwargs,
+        )
+
+    def test_fetches_segments_concurrently_and_verifies_digest(self):
+        server = _RangeServer(_CONTENT)
+        transfer = self._download(server, expected_sha256=f"sha256:{self.digest}")
+
+        digest = transfer.run(server.probe(1024))
+
+        self.assertEqual(digest, self.digest)
+        self.assertEqual(self.part.read_bytes(), _CONTENT)
+        self.assertFalse(state_path(self.part).exists())
+        self.assertEqual(
+            sorted(start for start, _end, _validator in server.requests),
+            [0, 1024, 2048, 3072, 4096, 5120, 6144, 7168, 8192, 9216],
+        )
+        self.assertTrue(
+            all(validator == '"v1"' for _s, _e, validator in server.requests[1:])
+        )
+
+    def test_failed_segment_resumes_from_recorded_progress(self):
+        server = _RangeServer(_CONTENT, fail_ranges={(2048, 3071)})
+        transfer = self._download(server, max_retries=1)
+        with self.assertRaises(RangedDownloadError):
+            transfer.run(server.probe(1024))
+        state = json.loads(state_path(self.part).read_text())
+        self.assertEqual(state["progress"]["2"], 200)
+
+        server.requests.clear()
+        resumed = self._download(server)
+        self.assertEqual(resumed.run(server.probe(1024)), self.digest)
+
+        self.assertGreaterEqual(resumed.resumed_bytes, 200)
+        self.assertIn((2248, 3071, '"v1"'), server.requests)
+        self.assertNotIn((2048, 3071, '"v1"'), server.requests)
+        self.assertEqual(self.part.read_bytes(), _CONTENT)
+
+    def test_changed_resource_discards_progress(self):
+        server = _RangeServer(_CONTENT, fail_ranges={(1024, 2047)})
+        with self.assertRaises(RangedDownloadError):
+            self._download(server, max_retries=1).run(server.probe(1024))
+
+        server.etag = '"v2"'
+        server.content = _CONTENT[::-1]
+        digest = self._download(server).run(server.probe(1024))
+
+        self.assertEqual(digest, hashlib.sha256(_CONTENT[::-1]).hexdigest())
+        self.assertEqual(self.part.read_bytes(), _CONTENT[::-1])
+
+    def test_server_without_ranges_streams_once_and_rejects_bad_digest(self):
+        server = _RangeServer(_CONTENT)
+        transfer = self._download(server, expected_sha256="0" * 64)
+
+        with self.assertRaises(DigestMismatch):
+            transfer.run(_Response(200, _CONTENT))
+
+        self.assertEqual(server.requests, [])
+        self.assertFalse(self.part.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
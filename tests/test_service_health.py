@@ -1,5 +1,8 @@
+import http.cookiejar
 import json
+import threading
 import unittest
+import urllib.request
 from unittest.mock import Mock, patch
 
 from utils.service_health import ServiceHealthMonitor
@@ -30,7 +33,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
     def setUp(self):
         self.monitor = ServiceHealthMonitor(cache_ttl_seconds=0)
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_nzbdav_plain_healthy_response(self, request):
         request.return_value = FakeResponse(body="Healthy")
 
@@ -47,7 +50,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertEqual(result["details"]["endpoint"], "/health")
         request.assert_called_once()
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_mediastorm_uses_application_health_endpoint(self, request):
         request.return_value = FakeResponse(body="OK")
 
@@ -65,7 +68,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         _, url = request.call_args.args
         self.assertEqual(url, "http://127.0.0.1:7777/health")
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_aiostreams_uses_database_aware_health_endpoint(self, request):
         request.return_value = FakeResponse(
             body=json.dumps({"success": True}),
@@ -82,7 +85,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         _, url = request.call_args.args
         self.assertEqual(url, "http://127.0.0.1:3006/api/v1/health")
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_aiostreams_unexpected_health_payload_is_degraded(self, request):
         request.return_value = FakeResponse(
             body=json.dumps({"status": "ok"}),
@@ -94,7 +97,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertEqual(result["status"], "degraded")
         self.assertEqual(result["details"]["validation"], "missing success")
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_nzbdav_migration_response_is_starting_not_unhealthy(self, request):
         request.return_value = FakeResponse(
             status_code=503,
@@ -114,7 +117,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertIn("migrating", result["reason"])
         self.assertEqual(result["details"]["http_status"], 503)
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_structured_degraded_health_preserves_component_statuses(self, request):
         request.return_value = FakeResponse(
             body=json.dumps(
@@ -146,7 +149,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
             ],
         )
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_unhealthy_application_response_is_restart_worthy(self, request):
         request.return_value = FakeResponse(
             status_code=503,
@@ -164,7 +167,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertFalse(result["healthy"])
         self.assertIn("Unhealthy", result["reason"])
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_unknown_reported_state_is_visible_as_degraded(self, request):
         request.return_value = FakeResponse(
             body=json.dumps({"status": "maintenance_window"}),
@@ -181,7 +184,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertTrue(result["healthy"])
         self.assertIn("maintenance_window", result["reason"])
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_missing_optional_endpoint_degrades_without_triggering_restart(
         self, request
     ):
@@ -197,7 +200,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertTrue(result["healthy"])
         self.assertFalse(result["details"]["supported"])
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_plex_identity_xml_marker_is_healthy(self, request):
         request.return_value = FakeResponse(
             body=(
@@ -218,7 +221,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertIsNone(result["reason"])
         self.assertNotIn("reported_status", result["details"])
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_plex_identity_without_marker_remains_degraded(self, request):
         request.return_value = FakeResponse(
             body="<html><body>Unexpected response</body></html>",
@@ -235,7 +238,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertTrue(result["healthy"])
         self.assertEqual(result["details"]["validation"], "identity marker missing")
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_pgadmin_ping_response_is_healthy(self, request):
         request.return_value = FakeResponse(body="PING")
 
@@ -250,7 +253,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertIsNone(result["reason"])
         self.assertEqual(result["details"]["reported_status"], "PING")
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_rclone_uses_local_rc_endpoint_and_post(self, request):
         request.return_value = FakeResponse(
             body=json.dumps({"version": "v1.74.4"}),
@@ -279,7 +282,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertEqual(url, "http://127.0.0.1:5572/core/version")
         self.assertEqual(request.call_args.args[0], "POST")
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_rclone_without_rc_server_has_no_application_probe(self, request):
         result = self.monitor.check(
             "rclone",
@@ -297,7 +300,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertIsNone(result)
         request.assert_not_called()
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_rclone_explicitly_disabled_rc_has_no_application_probe(self, request):
         disabled_commands = (
             ["rclone", "mount", "remote:", "/mnt/remote", "--rc=false"],
@@ -314,7 +317,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
 
         request.assert_not_called()
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_rclone_explicitly_enabled_rc_uses_application_probe(self, request):
         request.return_value = FakeResponse(
             body=json.dumps({"version": "v1.74.4"}),
@@ -339,7 +342,7 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertEqual(result["status"], "healthy")
         request.assert_called_once()
 
-    @patch("utils.service_health.requests.request")
+    @patch("utils.service_health.requests.Session.request")
     def test_probe_results_are_cached_per_process_identity(self, request):
         request.return_value = FakeResponse(body="Healthy")
         monitor = ServiceHealthMonitor(cache_ttl_seconds=60)
@@ -353,6 +356,28 @@ class ServiceHealthMonitorTests(unittest.TestCase):
         self.assertEqual(first["status"], third["status"])
         self.assertEqual(request.call_count, 2)
 
+    @patch("utils.service_health.subprocess.run")
+    @patch("utils.service_health.shutil.which", return_value="/usr/bin/pg_isready")
+    def test_fresh_checks_reprobe_cached_starting_results(self, _which, run):
+        run.side_effect = [
+            Mock(returncode=1, stdout="", stderr=""),
+            Mock(returncode=0, stdout="", stderr=""),
+            Mock(returncode=0, stdout="", stderr=""),
+        ]
+        monitor = ServiceHealthMonitor(cache_ttl_seconds=60)
+        config = {"port": 5432, "user": "DUMB"}
+
+        starting = monitor.check("postgres", "PostgreSQL", config)
+        cached = monitor.check("postgres", "PostgreSQL", config)
+        fresh = monitor.check("postgres", "PostgreSQL", config, fresh=True)
+        reused = monitor.check("postgres", "PostgreSQL", config, fresh=True)
+
+        self.assertEqual(
+            [result["status"] for result in (starting, cached, fresh, reused)],
+            ["starting", "starting", "healthy", "healthy"],
+        )
+        self.assertEqual(run.call_count, 2)
+
     @patch("utils.service_health.subprocess.run")
     @patch("utils.service_health.shutil.which", return_value="/usr/bin/pg_isready")
     def test_postgres_rejecting_connections_is_starting(self, _which, run):
@@ -396,6 +421,81 @@ class ServiceHealthMonitorTests(unittest.TestCase):
             )
         )
 
+    def test_latency_snapshot_reports_cumulative_buckets_per_probe(self):
+        monitor = ServiceHealthMonitor(cache_ttl_seconds=0)
+        monitor.record_latency("Sonarr", "http", 0.004)
+        monitor.record_latency("Sonarr", "http", 0.3)
+        monitor.record_latency("Sonarr", "port", 9)
+
+        snapshot = monitor.latency_snapshot()
+
+        http = snapshot["services"]["Sonarr"]["http"]
+        self.assertEqual(http["count"], 2)
+        self.assertEqual(http["max_ms"], 300.0)
+        self.assertEqual(http["buckets"][0], {"le_ms": 5, "count": 1})
+        self.assertEqual(http["buckets"][6], {"le_ms": 500, "count": 2})
+        port = snapshot["services"]["Sonarr"]["port"]
+        self.assertEqual(port["buckets"][-2]["count"], 0)
+        self.assertEqual(port["buckets"][-1], {"le_ms": None, "count": 1})
+
+    @patch("utils.service_health.requests.Session.request")
+    def test_http_probes_reuse_a_session_and_record_latency(self, request):
+        request.return_value = FakeResponse(body="OK")
+        monitor = ServiceHealthMonitor(cache_ttl_seconds=0)
+
+        monitor.check("mediastorm", "mediastorm", {"port": 7777})
+        first_session = monitor._session()
+        monitor.check("mediastorm", "mediastorm", {"port": 7777})
+
+        self.assertIs(monitor._session(), first_session)
+        self.assertEqual(request.call_count, 2)
+        histogram = monitor.latency_snapshot()["services"]["mediastorm"]["http"]
+        self.assertEqual(histogram["count"], 2)
+
+    def test_probing_threads_share_one_pooled_session(self):
+        monitor = ServiceHealthMonitor(pool_size=3)
+        sessions = []
+        threads = [
+            threading.Thread(target=lambda: sessions.append(monitor._session()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(session) for session in sessions}), 1)
+        adapter = sessions[0].get_adapter("http://127.0.0.1:8989/")
+        self.assertEqual(adapter._pool_maxsize, 3)
+
+        monitor.close()
+        self.assertIsNot(monitor._session(), sessions[0])
+        monitor.close()
+
+    def test_probe_session_does_not_store_cookies(self):
+        session = ServiceHealthMonitor()._session()
+        cookie = http.cookiejar.Cookie(
+            version=0,
+            name="session",
+            value="x",
+            port=None,
+            port_specified=False,
+            domain="127.0.0.1",
+            domain_specified=False,
+            domain_initial_dot=False,
+            path="/",
+            path_specified=False,
+            secure=False,
+            expires=None,
+            discard=True,
+            comment=None,
+            comment_url=None,
+            rest={},
+        )
+        request = urllib.request.Request("http://127.0.0.1:8989/")
+
+        self.assertFalse(session.cookies.get_policy().set_ok(cookie, request))
+
 
 if __name__ == "__main__":
     unittest.main()
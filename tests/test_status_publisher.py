@@ -0,0 +1,98 @@
+import asyncio
+import json
+import threading
+import unittest
+
+from starlette.websockets import WebSocketState
+
+from api.connection_manager import ConnectionManager
+from api.status_publisher import StatusPublisher
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.client_state = WebSocketState.CONNECTED
+        self.application_state = WebSocketState.CONNECTED
+        self.messages = []
+
+    async def accept(self):
+        return None
+
+    async def send_text(self, message):
+        self.messages.append(json.loads(message))
+
+
+class _FakeProcessHandler:
+    def __init__(self):
+        self.listeners = []
+
+    def add_status_listener(self, callback):
+        self.listeners.append(callback)
+
+
+class _FakeApiState:
+    def __init__(self):
+        self.process_handler = _FakeProcessHandler()
+        self.running = ["Zurg"]
+        self.snapshot_calls = 0
+        self.running_calls = 0
+
+    def get_running_processes(self):
+        self.running_calls += 1
+        return list(self.running)
+
+    def get_running_status_snapshot(self, include_health=False):
+        self.snapshot_calls += 1
+        return [{"process_name": name, "healthy": True} for name in self.running]
+
+
+class StatusPublisherTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.publisher = StatusPublisher(heartbeat_seconds=60, coalesce_seconds=0)
+        self.api_state = _FakeApiState()
+        self.status_manager = ConnectionManager()
+
+    async def asyncTearDown(self):
+        if self.publisher._task:
+            self.publisher._task.cancel()
+
+    async def test_health_view_is_computed_once_for_many_clients(self):
+        clients = [_FakeWebSocket() for _ in range(3)]
+        for client in clients:
+            await self.publisher.subscribe(
+                client, self.api_state, self.status_manager, True
+            )
+
+        self.assertEqual(self.api_state.snapshot_calls, 1)
+        await self.publisher.publish(self.api_state, self.status_manager)
+
+        self.assertEqual(self.api_state.snapshot_calls, 2)
+        self.assertEqual(self.api_state.running_calls, 0)
+        for client in clients:
+            self.assertEqual(len(client.messages), 2)
+            self.assertEqual(
+                client.messages[-1]["processes"][0]["process_name"], "Zurg"
+            )
+
+    async def test_process_event_from_another_thread_triggers_broadcast(self):
+        client = _FakeWebSocket()
+        await self.publisher.subscribe(
+            client, self.api_state, self.status_manager, False
+        )
+        self.assertEqual(client.messages, [{"type": "status", "running": ["Zurg"]}])
+        self.assertEqual(len(self.api_state.process_handler.listeners), 1)
+
+        self.api_state.running.append("rclone")
+        listener = self.api_state.process_handler.listeners[0]
+        threading.Thread(target=listener, args=("rclone", "processes")).start()
+        for _ in range(100):
+            if len(client.messages) > 1:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(client.messages[-1]["running"], ["Zurg", "rclone"])
+        self.assertEqual(self.api_state.snapshot_calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
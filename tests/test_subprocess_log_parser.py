@@ -0,0 +1,52 @@
+import unittest
+
+from utils.logger import SubprocessLogger
+
+_CASES = (
+    (
+        "rclone",
+        "2026/10/17 10:00:00 DEBUG : : vfs cache: cleaned",
+        ("DEBUG", "vfs cache: cleaned"),
+    ),
+    ("rclone", "2026/10/17 10:00:00 NOTICE: mount ready", ("NOTICE", "mount ready")),
+    ("Traefik", "24-01-01 12:00:00 no level", ("UNKNOWN", "no level")),
+    ("Sonarr", "[Warn] WARNING disk low", ("WARNING", "disk low")),
+    (
+        "Zurg",
+        "2026-10-17T10:00:00Z INFO [zurg] Fetching torrents",
+        ("INFO", "| Fetching | torrents"),
+    ),
+    ("Zurg w/ rclone", "WARN [zurg] slow", ("WARNING", "| slow |")),
+    ("Zurg", "no level", (None, "no level")),
+    (
+        "PostgreSQL",
+        "UTC [42] LOG:  checkpoint starting",
+        ("INFO", "checkpoint starting"),
+    ),
+    ("PostgreSQL", "UTC [42] FATAL:  role missing", ("CRITICAL", "role missing")),
+    (
+        "Zilean",
+        "[10:00:00] | INFO | Zilean.Scraper | Processed 10",
+        ("INFO", "Zilean.Scraper | Processed 10"),
+    ),
+    ("Zilean", "plain", (None, "plain")),
+    (
+        "CLI Debrid",
+        "2026-10-17 10:00:00 - Checking wanted items",
+        ("INFO", "Checking wanted items"),
+    ),
+)
+
+
+class SubprocessLogParserTests(unittest.TestCase):
+    def test_parses_each_registered_service_format(self):
+        for process_name, line, expected in _CASES:
+            with self.subTest(process_name=process_name, line=line):
+                self.assertEqual(
+                    SubprocessLogger.parse_log_level_and_message(line, process_name),
+                    expected,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
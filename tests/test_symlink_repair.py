@@ -28,7 +28,32 @@ global_logger = types.ModuleType("utils.global_logger")
 global_logger.logger = _Logger()
 sys.modules["utils.global_logger"] = global_logger
 
-from utils import symlink_repair
+from utils import symlink_inventory, symlink_repair
+
+_inventory_dir = None
+_inventory_env = None
+
+
+def setUpModule():
+    global _inventory_dir, _inventory_env
+    _inventory_dir = tempfile.TemporaryDirectory()
+    _inventory_env = mock.patch.dict(
+        os.environ,
+        {
+            symlink_inventory.SYMLINK_INVENTORY_PATH_ENV: os.path.join(
+                _inventory_dir.name, "inventory.db"
+            )
+        },
+    )
+    _inventory_env.start()
+
+
+def tearDownModule():
+    _inventory_env.stop()
+    for inventory in symlink_inventory._inventories.values():
+        inventory.close()
+    symlink_inventory._inventories.clear()
+    _inventory_dir.cleanup()
 
 
 class SymlinkRepairHelperTests(unittest.TestCase):
@@ -138,6 +163,27 @@ class SymlinkRepairHelperTests(unittest.TestCase):
             all(entry["target_exists"] is None for entry in manifest["entries"])
         )
 
+    def test_catalog_backup_and_restore_leave_persistent_inventory_closed(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir, "links")
+            root.mkdir()
+            (root / "remote.mkv").symlink_to("/mnt/remote/media.mkv")
+            manifest_path = Path(temp_dir, "snapshot.json")
+
+            with mock.patch.object(
+                symlink_repair,
+                "open_symlink_inventory",
+                side_effect=AssertionError("persistent inventory must not open"),
+            ):
+                symlink_repair.backup_symlink_manifest(
+                    [str(root)], str(manifest_path), check_targets=False
+                )
+                report = symlink_repair.restore_symlink_manifest(
+                    str(manifest_path), dry_run=True, restore_broken=True
+                )
+
+        self.assertEqual(report["skipped_unchanged"], 1)
+
     def test_preview_and_restore_symlink_manifest_handle_existing_paths(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             link = Path(temp_dir, "links", "movie.mkv")
@@ -176,5 +222,103 @@ class SymlinkRepairHelperTests(unittest.TestCase):
         self.assertEqual(second_preview["projected_skipped_unchanged"], 1)
 
 
+class SymlinkInventoryTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name, "links")
+        self.inventory = symlink_inventory.SymlinkInventory()
+
+    def tearDown(self):
+        self.inventory.close()
+        self.temp_dir.cleanup()
+
+    def _age(self, *paths):
+        past = 1_600_000_000
+        for path in paths:
+            os.utime(path, (past, past), follow_symlinks=False)
+
+    def test_refresh_only_rescans_directories_whose_mtime_changed(self):
+        show = self.root / "show"
+        show.mkdir(parents=True)
+        (show / "episode.mkv").symlink_to("/mnt/remote/episode.mkv")
+        (self.root / "movie.mkv").symlink_to("/mnt/remote/movie.mkv")
+        self._age(self.root, show)
+
+        first = self.inventory.refresh([str(self.root)])
+        second = self.inventory.refresh([str(self.root)])
+        (show / "episode.mkv").unlink()
+        (show / "episode.mkv").symlink_to("/mnt/other/episode.mkv")
+        third = self.inventory.refresh([str(self.root)])
+
+        self.assertEqual(first["rescanned_directories"], 2)
+        self.assertEqual(second["rescanned_directories"], 0)
+        self.assertEqual(third["rescanned_directories"], 1)
+        self.assertEqual(
+            self.inventory.links([str(self.root)]),
+            [
+                (str(self.root / "movie.mkv"), "/mnt/remote/movie.mkv"),
+                (str(show / "episode.mkv"), "/mnt/other/episode.mkv"),
+            ],
+        )
+
+    def test_refresh_forgets_removed_directories_and_missing_roots(self):
+        show = self.root / "show"
+        show.mkdir(parents=True)
+        (show / "episode.mkv").symlink_to("/mnt/remote/episode.mkv")
+        self.inventory.refresh([str(self.root)])
+
+        (show / "episode.mkv").unlink()
+        show.rmdir()
+        self.inventory.refresh([str(self.root)])
+        self.assertEqual(self.inventory.links([str(self.root)]), [])
+
+        (self.root / "movie.mkv").symlink_to("/mnt/remote/movie.mkv")
+        self.inventory.refresh([str(self.root)])
+        (self.root / "movie.mkv").unlink()
+        self.root.rmdir()
+        stats = self.inventory.refresh([str(self.root)])
+
+        self.assertEqual(stats["missing_roots"], [str(self.root)])
+        self.assertIsNone(self.inventory.lookup(str(self.root / "movie.mkv")))
+
+    def test_target_status_is_cached_until_target_changes(self):
+        self.root.mkdir()
+        link = self.root / "movie.mkv"
+        link.symlink_to("/mnt/remote/movie.mkv")
+        self.inventory.refresh([str(self.root)])
+        probe = mock.Mock(return_value=True)
+
+        first = self.inventory.target_exists(str(link), "/mnt/remote/movie.mkv", probe)
+        second = self.inventory.target_exists(str(link), "/mnt/remote/movie.mkv", probe)
+        self.inventory.target_exists(str(link), "/mnt/remote/other.mkv", probe)
+
+        self.assertTrue(first and second)
+        self.assertEqual(probe.call_count, 2)
+
+    def test_missing_target_status_expires_sooner_than_existing(self):
+        self.root.mkdir()
+        link = self.root / "movie.mkv"
+        link.symlink_to("/mnt/remote/movie.mkv")
+        self.inventory.refresh([str(self.root)])
+        probe = mock.Mock(side_effect=[False, True])
+
+        with mock.patch.object(symlink_inventory.time, "time", return_value=1000.0):
+            first = self.inventory.target_exists(
+                str(link), "/mnt/remote/movie.mkv", probe
+            )
+        stale = 1000.0 + symlink_inventory.TARGET_MISSING_MAX_AGE_SECONDS
+        with mock.patch.object(symlink_inventory.time, "time", return_value=stale):
+            second = self.inventory.target_exists(
+                str(link), "/mnt/remote/movie.mkv", probe
+            )
+            third = self.inventory.target_exists(
+                str(link), "/mnt/remote/movie.mkv", probe
+            )
+
+        self.assertFalse(first)
+        self.assertTrue(second and third)
+        self.assertEqual(probe.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
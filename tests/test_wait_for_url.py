@@ -1,4 +1,6 @@
 import sys
+import threading
+import time
 import types
 import unittest
 
@@ -161,6 +163,71 @@ class WaitForUrlHelperTests(unittest.TestCase):
         self.assertEqual(calls[0][1]["auth"], ("name", "secret"))
         self.assertEqual(calls[0][1]["timeout"], 10)
 
+    def test_wait_for_urls_probes_pending_entries_concurrently(self):
+        started = []
+        barrier = threading.Barrier(2, timeout=2)
+
+        def fake_request(method, url, **kwargs):
+            started.append(url)
+            barrier.wait()
+            return FakeResponse(200)
+
+        original_request = wait_for_url.requests.request
+        wait_for_url.requests.request = fake_request
+        try:
+            success, error = wait_for_url.wait_for_urls(
+                [{"url": "http://one/health"}, {"url": "http://two/health"}],
+                "Service",
+                FakeLogger(),
+                lambda: False,
+            )
+        finally:
+            wait_for_url.requests.request = original_request
+
+        self.assertTrue(success)
+        self.assertIsNone(error)
+        self.assertEqual(sorted(started), ["http://one/health", "http://two/health"])
+
+    def test_readiness_notification_cuts_backoff_short(self):
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(time.monotonic())
+            return FakeResponse(200 if len(calls) > 1 else 503)
+
+        original_request = wait_for_url.requests.request
+        original_backoff = wait_for_url._INITIAL_BACKOFF_SECONDS
+        wait_for_url.requests.request = fake_request
+        wait_for_url._INITIAL_BACKOFF_SECONDS = 30
+        waker = threading.Timer(0.2, wait_for_url.notify_readiness_changed)
+        waker.start()
+        try:
+            started = time.monotonic()
+            success, _error = wait_for_url.wait_for_urls(
+                {"url": "http://service/health"},
+                "Service",
+                FakeLogger(),
+                lambda: False,
+            )
+        finally:
+            waker.cancel()
+            wait_for_url.requests.request = original_request
+            wait_for_url._INITIAL_BACKOFF_SECONDS = original_backoff
+
+        self.assertTrue(success)
+        self.assertEqual(len(calls), 2)
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_record_service_readiness_notifies_on_transition_only(self):
+        generation = wait_for_url.readiness_generation()
+        wait_for_url.record_service_readiness("svc-test", True)
+        wait_for_url.record_service_readiness("svc-test", True)
+        self.assertEqual(wait_for_url.readiness_generation(), generation + 1)
+
+        wait_for_url.record_service_readiness("svc-test", False)
+        wait_for_url.record_service_readiness("svc-test", True)
+        self.assertEqual(wait_for_url.readiness_generation(), generation + 2)
+
     def test_response_ready_accepts_2xx_and_webdav_207(self):
         self.assertTrue(wait_for_url._response_is_ready(FakeResponse(200), "GET"))
         self.assertTrue(wait_for_url._response_is_ready(FakeResponse(204), "GET"))
@@ -0,0 +1,487 @@
+"""Row-digest validation for the SQLite-to-PostgreSQL migration workflow.
+
+Digesting every imported value is CPU-bound Python, so the migration validates
+tables in worker processes started as ``python -m utils.arr_postgres_digest``.
+This module therefore imports only the standard library and psycopg2: a worker
+never loads DUMB's configuration, logger or API modules.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import sys
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+import psycopg2
+from psycopg2 import sql
+
+INFINIDYSK_FULL_ROW_DIGEST_ITERSIZE = 16
+INFINIDYSK_PRIMARY_KEY_DIGEST_ITERSIZE = 1000
+
+
+class ArrPostgresMigrationError(RuntimeError):
+    """Expected migration failure safe to report without a traceback."""
+
+
+def _postgres_params(postgres_config: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "host": postgres_config.get("host", "127.0.0.1"),
+        "port": int(postgres_config.get("port", 5432)),
+        "user": postgres_config.get("user", "DUMB"),
+        "password": postgres_config.get("password", "postgres"),
+    }
+
+
+def _pg_connect(postgres_config: dict[str, Any], database: str):
+    return psycopg2.connect(dbname=database, **_postgres_params(postgres_config))
+
+
+def _sqlite_columns(connection: sqlite3.Connection, table: str) -> list[str]:
+    escaped = table.replace('"', '""')
+    return [
+        str(row[1]) for row in connection.execute(f'PRAGMA table_info("{escaped}")')
+    ]
+
+
+def _postgres_table_columns(connection, table: str) -> dict[str, dict[str, str]]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT column_name, data_type, is_generated, is_identity, "
+            "identity_generation "
+            "FROM information_schema.columns "
+            "WHERE table_schema = 'public' AND table_name = %s "
+            "ORDER BY ordinal_position",
+            [table],
+        )
+        return {
+            row[0]: {
+                "data_type": row[1],
+                "is_generated": row[2],
+                "is_identity": row[3],
+                "identity_generation": row[4],
+            }
+            for row in cursor.fetchall()
+        }
+
+
+def _convert_value(value, data_type: str):
+    if value is None:
+        return None
+    if data_type == "boolean":
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            if value in {0, 1}:
+                return bool(value)
+            raise ArrPostgresMigrationError(
+                "SQLite boolean values must be exactly 0 or 1."
+            )
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized in {"0", "false"}:
+                return False
+            if normalized in {"1", "true"}:
+                return True
+        raise ArrPostgresMigrationError(
+            "SQLite boolean values must be exactly 0/1 or true/false."
+        )
+    if data_type in {"smallint", "integer", "bigint"} and isinstance(value, bool):
+        return int(value)
+    if data_type == "bytea" and isinstance(value, memoryview):
+        return value.tobytes()
+    if data_type.startswith("timestamp"):
+        numeric = value
+        if isinstance(value, str):
+            try:
+                numeric = float(value)
+            except ValueError:
+                numeric = None
+        if isinstance(numeric, (int, float)):
+            # SQLite applications sometimes store Unix milliseconds.
+            if abs(numeric) > 100_000_000_000:
+                numeric /= 1000
+            return datetime.fromtimestamp(numeric, tz=timezone.utc)
+    return value
+
+
+def _normalize_digest_value(value: Any, data_type: str) -> Any:
+    """Normalize a value as PostgreSQL stores it without exposing its content."""
+
+    if value is None:
+        return None
+    normalized_type = str(data_type or "").lower()
+    if normalized_type == "boolean":
+        return {"boolean": _convert_value(value, "boolean")}
+    if normalized_type in {"smallint", "integer", "bigint"}:
+        try:
+            return {"integer": str(int(value))}
+        except (TypeError, ValueError) as error:
+            raise ArrPostgresMigrationError(
+                "A SQLite integer value could not be normalized for validation."
+            ) from error
+    if normalized_type == "uuid":
+        try:
+            return {"uuid": str(uuid.UUID(str(value)))}
+        except (AttributeError, TypeError, ValueError) as error:
+            raise ArrPostgresMigrationError(
+                "A SQLite UUID value could not be normalized for validation."
+            ) from error
+    if normalized_type == "bytea":
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        if isinstance(value, bytearray):
+            value = bytes(value)
+        if not isinstance(value, bytes):
+            raise ArrPostgresMigrationError(
+                "A SQLite binary value could not be normalized for validation."
+            )
+        return {"bytea": value.hex()}
+    if normalized_type.startswith("timestamp"):
+        converted = _convert_value(value, normalized_type)
+        if isinstance(converted, str):
+            candidate = converted.strip()
+            if candidate.endswith(("Z", "z")):
+                candidate = f"{candidate[:-1]}+00:00"
+            try:
+                converted = datetime.fromisoformat(candidate)
+            except ValueError as error:
+                raise ArrPostgresMigrationError(
+                    "A SQLite timestamp could not be normalized for validation."
+                ) from error
+        if not isinstance(converted, datetime):
+            raise ArrPostgresMigrationError(
+                "A SQLite timestamp could not be normalized for validation."
+            )
+        if "without time zone" in normalized_type:
+            if converted.tzinfo is not None:
+                converted = converted.astimezone(timezone.utc).replace(tzinfo=None)
+            timestamp_value = converted.isoformat(timespec="microseconds")
+        else:
+            if converted.tzinfo is None:
+                converted = converted.replace(tzinfo=timezone.utc)
+            converted = converted.astimezone(timezone.utc)
+            timestamp_value = converted.isoformat(timespec="microseconds")
+        return {"timestamp": timestamp_value}
+    return {"text": str(value)}
+
+
+def _digest_rows(
+    rows,
+    data_types: list[str],
+    *,
+    source_values: bool,
+) -> dict[str, Any]:
+    count = 0
+    xor_value = 0
+    sum_value = 0
+    modulus = 1 << 256
+    for row in rows:
+        if len(row) != len(data_types):
+            raise ArrPostgresMigrationError(
+                "A database row did not match the expected validation columns."
+            )
+        normalized = [
+            _normalize_digest_value(
+                _convert_value(value, data_type) if source_values else value,
+                data_type,
+            )
+            for value, data_type in zip(row, data_types)
+        ]
+        digest = hashlib.sha256(
+            json.dumps(
+                normalized,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8")
+        ).digest()
+        numeric = int.from_bytes(digest, "big")
+        xor_value ^= numeric
+        sum_value = (sum_value + numeric) % modulus
+        count += 1
+    return {
+        "count": count,
+        "xor": f"{xor_value:064x}",
+        "sum": f"{sum_value:064x}",
+    }
+
+
+def _sqlite_rowid_key(source: sqlite3.Connection, table: str) -> str | None:
+    """Return the table's ``INTEGER PRIMARY KEY`` column, if it has one.
+
+    Only rowid aliases are used for range chunking: their values are always
+    integers, so SQLite and PostgreSQL order and compare them identically.
+    """
+
+    escaped_table = table.replace('"', '""')
+    keys = [
+        row
+        for row in source.execute(f'PRAGMA table_info("{escaped_table}")')
+        if int(row[5] or 0) > 0
+    ]
+    if len(keys) != 1 or str(keys[0][2] or "").strip().upper() != "INTEGER":
+        return None
+    return str(keys[0][1])
+
+
+def _digest_key_ranges(
+    source: sqlite3.Connection, table: str, key: str, chunk_rows: int
+) -> list[tuple[int | None, int | None]]:
+    """Split ``key`` into half-open ranges of about ``chunk_rows`` source rows.
+
+    The first range is unbounded below and the last unbounded above so rows
+    that exist only in PostgreSQL still land in some range.
+    """
+
+    chunk_rows = max(1, int(chunk_rows))
+    escaped_table = table.replace('"', '""')
+    escaped_key = key.replace('"', '""')
+    boundaries = []
+    cursor = source.execute(
+        f'SELECT "{escaped_key}" FROM "{escaped_table}" ORDER BY "{escaped_key}"'
+    )
+    for position, (value,) in enumerate(cursor):
+        if position and position % chunk_rows == 0:
+            boundaries.append(int(value))
+    lowers = [None, *boundaries]
+    uppers = [*boundaries, None]
+    return list(zip(lowers, uppers))
+
+
+def _describe_key_range(key: str, lower: int | None, upper: int | None) -> str:
+    if lower is None and upper is None:
+        return f"all {key} values"
+    if lower is None:
+        return f"{key} < {upper}"
+    if upper is None:
+        return f"{key} >= {lower}"
+    return f"{lower} <= {key} < {upper}"
+
+
+def _full_row_range_digests(
+    source: sqlite3.Connection,
+    target,
+    table: str,
+    columns: list[str],
+    data_types: list[str],
+    key: str | None = None,
+    lower: int | None = None,
+    upper: int | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return ``(source_digest, target_digest)`` for one key range of ``table``."""
+
+    escaped_table = table.replace('"', '""')
+    source_columns = ", ".join(
+        f'"{column.replace(chr(34), chr(34) * 2)}"' for column in columns
+    )
+    source_query = f'SELECT {source_columns} FROM "{escaped_table}"'
+    target_query = sql.SQL("SELECT {} FROM {}").format(
+        sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+        sql.Identifier(table),
+    )
+    source_clauses = []
+    target_clauses = []
+    params = []
+    if key is not None:
+        escaped_key = key.replace('"', '""')
+        if lower is not None:
+            source_clauses.append(f'"{escaped_key}" >= ?')
+            target_clauses.append(sql.SQL("{} >= %s").format(sql.Identifier(key)))
+            params.append(lower)
+        if upper is not None:
+            source_clauses.append(f'"{escaped_key}" < ?')
+            target_clauses.append(sql.SQL("{} < %s").format(sql.Identifier(key)))
+            params.append(upper)
+    if source_clauses:
+        source_query += " WHERE " + " AND ".join(source_clauses)
+        target_query = sql.SQL("{} WHERE {}").format(
+            target_query, sql.SQL(" AND ").join(target_clauses)
+        )
+
+    source_digest = _digest_rows(
+        source.execute(source_query, params),
+        data_types,
+        source_values=True,
+    )
+    cursor_name = f"dumb_full_{uuid.uuid4().hex}"
+    with target.cursor(name=cursor_name) as cursor:
+        cursor.itersize = INFINIDYSK_FULL_ROW_DIGEST_ITERSIZE
+        if params:
+            cursor.execute(target_query, params)
+        else:
+            cursor.execute(target_query)
+        target_digest = _digest_rows(
+            cursor,
+            data_types,
+            source_values=False,
+        )
+    return source_digest, target_digest
+
+
+def _validate_table_full_row_digests(
+    source: sqlite3.Connection,
+    target,
+    table: str,
+    chunk_rows: int | None = None,
+) -> list[tuple[int | None, int | None]]:
+    """Compare one table's content digests; return the key ranges checked."""
+
+    columns = _sqlite_columns(source, table)
+    target_columns = _postgres_table_columns(target, table)
+    missing_columns = [column for column in columns if column not in target_columns]
+    if missing_columns:
+        raise ArrPostgresMigrationError(
+            f"PostgreSQL table {table} is missing columns for content validation."
+        )
+    data_types = [target_columns[column]["data_type"] for column in columns]
+    key = _sqlite_rowid_key(source, table) if chunk_rows else None
+    ranges = (
+        _digest_key_ranges(source, table, key, chunk_rows)
+        if key is not None
+        else [(None, None)]
+    )
+    mismatched = []
+    for lower, upper in ranges:
+        source_digest, target_digest = _full_row_range_digests(
+            source, target, table, columns, data_types, key, lower, upper
+        )
+        if target_digest != source_digest:
+            mismatched.append((lower, upper))
+    if not mismatched:
+        return ranges
+    if key is None:
+        raise ArrPostgresMigrationError(
+            f"Full-row content validation failed for PostgreSQL table {table}."
+        )
+    described = ", ".join(
+        _describe_key_range(key, lower, upper) for lower, upper in mismatched[:5]
+    )
+    raise ArrPostgresMigrationError(
+        f"Full-row content validation failed for PostgreSQL table {table} "
+        f"in key range(s): {described}."
+    )
+
+
+def _validate_table_primary_key_digest(
+    source: sqlite3.Connection,
+    target,
+    table: str,
+) -> dict[str, Any]:
+    escaped_table = table.replace('"', '""')
+    source_info = source.execute(f'PRAGMA table_info("{escaped_table}")').fetchall()
+    source_keys = [
+        str(row[1])
+        for row in sorted(source_info, key=lambda item: int(item[5] or 0))
+        if int(row[5] or 0) > 0
+    ]
+    if not source_keys:
+        raise ArrPostgresMigrationError(
+            f"SQLite table {table} has no primary key for digest validation."
+        )
+    with target.cursor() as cursor:
+        cursor.execute(
+            "SELECT attribute.attname "
+            "FROM pg_index AS index_entry "
+            "JOIN pg_class AS table_entry "
+            "ON table_entry.oid = index_entry.indrelid "
+            "JOIN pg_namespace AS namespace_entry "
+            "ON namespace_entry.oid = table_entry.relnamespace "
+            "JOIN unnest(index_entry.indkey) WITH ORDINALITY "
+            "AS key_entry(attnum, position) ON TRUE "
+            "JOIN pg_attribute AS attribute "
+            "ON attribute.attrelid = table_entry.oid "
+            "AND attribute.attnum = key_entry.attnum "
+            "WHERE namespace_entry.nspname = 'public' "
+            "AND table_entry.relname = %s AND index_entry.indisprimary "
+            "ORDER BY key_entry.position",
+            [table],
+        )
+        target_keys = [str(row[0]) for row in cursor.fetchall()]
+    if target_keys != source_keys:
+        raise ArrPostgresMigrationError(
+            f"Primary-key definition differs for PostgreSQL table {table}."
+        )
+    target_columns = _postgres_table_columns(target, table)
+    key_data_types = [target_columns[column]["data_type"] for column in source_keys]
+
+    source_columns = ", ".join(
+        f'"{column.replace(chr(34), chr(34) * 2)}"' for column in source_keys
+    )
+    source_digest = _digest_rows(
+        source.execute(f'SELECT {source_columns} FROM "{escaped_table}"'),
+        key_data_types,
+        source_values=True,
+    )
+    cursor_name = f"dumb_keys_{uuid.uuid4().hex}"
+    with target.cursor(name=cursor_name) as cursor:
+        cursor.itersize = INFINIDYSK_PRIMARY_KEY_DIGEST_ITERSIZE
+        cursor.execute(
+            sql.SQL("SELECT {} FROM {}").format(
+                sql.SQL(", ").join(sql.Identifier(column) for column in target_keys),
+                sql.Identifier(table),
+            )
+        )
+        target_digest = _digest_rows(
+            cursor,
+            key_data_types,
+            source_values=False,
+        )
+    if target_digest != source_digest:
+        raise ArrPostgresMigrationError(
+            f"Primary-key digest validation failed for PostgreSQL table {table}."
+        )
+    return source_digest
+
+
+TABLE_VALIDATIONS = {
+    "full_row": _validate_table_full_row_digests,
+    "primary_key": _validate_table_primary_key_digest,
+}
+
+
+def validate_table(
+    check: str,
+    connection_args: tuple[str, dict[str, Any], str],
+    table: str,
+    options: dict[str, Any] | None = None,
+) -> Any:
+    """Run the ``check`` validation for one table on its own connection pair."""
+
+    sqlite_path, postgres_config, database = connection_args
+    source = sqlite3.connect(f"file:{sqlite_path}?mode=ro", uri=True, timeout=60)
+    try:
+        target = _pg_connect(postgres_config, database)
+        try:
+            return TABLE_VALIDATIONS[check](source, target, table, **(options or {}))
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
+def main(stdin=None, stdout=None) -> int:
+    """Worker entry point: read one JSON request and write one JSON reply."""
+
+    request = json.load(stdin or sys.stdin)
+    try:
+        result = validate_table(
+            request["check"],
+            tuple(request["connection_args"]),
+            request["table"],
+            request.get("options"),
+        )
+    except ArrPostgresMigrationError as error:
+        reply = {"error": str(error)}
+    except Exception as error:
+        reply = {"error": f"{type(error).__name__}: {error}"}
+    else:
+        reply = {"result": result}
+    json.dump(reply, stdout or sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
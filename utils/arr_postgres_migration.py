@@ -18,11 +18,13 @@ import shutil
 import sqlite3
 import stat
 import subprocess
+import sys
 import tempfile
 import threading
 import time
 import uuid
 from collections import deque
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable
@@ -30,9 +32,17 @@ from typing import Any, Callable
 import psycopg2
 import yaml
 from psycopg2 import sql
-from psycopg2.extras import execute_values
 
 from utils.arr_postgres import apply_arr_postgres_config, arr_postgres_database_names
+from utils.arr_postgres_digest import (
+    TABLE_VALIDATIONS,
+    ArrPostgresMigrationError,
+    _convert_value,
+    _pg_connect,
+    _postgres_params,
+    _postgres_table_columns,
+    _sqlite_columns,
+)
 from utils.infinidysk_migration_admission import (
     ACTIVE_NAMESPACE_MIGRATION_BLOCKER,
     EXTERNAL_MUTATION_BLOCKER,
@@ -189,8 +199,9 @@ INFINIDYSK_AUXILIARY_SQLITE_STORES = (
     "usenet-migration.db",
 )
 INFINIDYSK_IMPORT_BATCH_BYTES = 4 * 1024 * 1024
-INFINIDYSK_FULL_ROW_DIGEST_ITERSIZE = 16
-INFINIDYSK_PRIMARY_KEY_DIGEST_ITERSIZE = 1000
+IMPORT_TABLE_WORKERS = 4
+DIGEST_VALIDATION_WORKERS = 4
+FULL_ROW_DIGEST_CHUNK_ROWS = 100_000
 MAX_MIGRATION_JOB_BYTES = 2 * 1024 * 1024
 
 SUPPORTED_SERVICES = {
@@ -277,10 +288,6 @@ INFINIDYSK_RECOVERY_PENDING_JOB_STATUSES = {
 DEFAULT_ROOT = "/config/arr-postgres-migration"
 
 
-class ArrPostgresMigrationError(RuntimeError):
-    """Expected migration failure safe to report without a traceback."""
-
-
 def _safe_slug(value: str) -> str:
     slug = re.sub(r"[^a-z0-9]+", "-", str(value or "").lower()).strip("-")
     return slug or "service"
@@ -921,13 +928,6 @@ def _sqlite_tables(
     return [str(row[0]) for row in rows if str(row[0]) not in excluded_tables]
 
 
-def _sqlite_columns(connection: sqlite3.Connection, table: str) -> list[str]:
-    escaped = table.replace('"', '""')
-    return [
-        str(row[1]) for row in connection.execute(f'PRAGMA table_info("{escaped}")')
-    ]
-
-
 def _sqlite_row_counts(
     path: Path, excluded_tables: set[str] | None = None
 ) -> dict[str, int]:
@@ -944,19 +944,6 @@ def _sqlite_row_counts(
         connection.close()
 
 
-def _postgres_params(postgres_config: dict[str, Any]) -> dict[str, Any]:
-    return {
-        "host": postgres_config.get("host", "127.0.0.1"),
-        "port": int(postgres_config.get("port", 5432)),
-        "user": postgres_config.get("user", "DUMB"),
-        "password": postgres_config.get("password", "postgres"),
-    }
-
-
-def _pg_connect(postgres_config: dict[str, Any], database: str):
-    return psycopg2.connect(dbname=database, **_postgres_params(postgres_config))
-
-
 def _database_exists(postgres_config: dict[str, Any], database: str) -> bool:
     connection = _pg_connect(postgres_config, "postgres")
     try:
@@ -1703,67 +1690,6 @@ def _backup_sqlite(
                 pass
 
 
-def _postgres_table_columns(connection, table: str) -> dict[str, dict[str, str]]:
-    with connection.cursor() as cursor:
-        cursor.execute(
-            "SELECT column_name, data_type, is_generated, is_identity, "
-            "identity_generation "
-            "FROM information_schema.columns "
-            "WHERE table_schema = 'public' AND table_name = %s "
-            "ORDER BY ordinal_position",
-            [table],
-        )
-        return {
-            row[0]: {
-                "data_type": row[1],
-                "is_generated": row[2],
-                "is_identity": row[3],
-                "identity_generation": row[4],
-            }
-            for row in cursor.fetchall()
-        }
-
-
-def _convert_value(value, data_type: str):
-    if value is None:
-        return None
-    if data_type == "boolean":
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, (int, float)):
-            if value in {0, 1}:
-                return bool(value)
-            raise ArrPostgresMigrationError(
-                "SQLite boolean values must be exactly 0 or 1."
-            )
-        if isinstance(value, str):
-            normalized = value.strip().lower()
-            if normalized in {"0", "false"}:
-                return False
-            if normalized in {"1", "true"}:
-                return True
-        raise ArrPostgresMigrationError(
-            "SQLite boolean values must be exactly 0/1 or true/false."
-        )
-    if data_type in {"smallint", "integer", "bigint"} and isinstance(value, bool):
-        return int(value)
-    if data_type == "bytea" and isinstance(value, memoryview):
-        return value.tobytes()
-    if data_type.startswith("timestamp"):
-        numeric = value
-        if isinstance(value, str):
-            try:
-                numeric = float(value)
-            except ValueError:
-                numeric = None
-        if isinstance(numeric, (int, float)):
-            # SQLite applications sometimes store Unix milliseconds.
-            if abs(numeric) > 100_000_000_000:
-                numeric /= 1000
-            return datetime.fromtimestamp(numeric, tz=timezone.utc)
-    return value
-
-
 def _prepare_target_for_import(
     sqlite_path: Path,
     postgres_config: dict[str, Any],
@@ -2081,229 +2007,131 @@ def _validate_postgres_foreign_keys(
     return validated
 
 
-def _normalize_digest_value(value: Any, data_type: str) -> Any:
-    """Normalize a value as PostgreSQL stores it without exposing its content."""
+def _validate_table_in_subprocess(
+    check: str,
+    connection_args: tuple[str, dict[str, Any], str],
+    table: str,
+    options: dict[str, Any],
+) -> Any:
+    """Validate one table in a ``python -m utils.arr_postgres_digest`` worker.
 
-    if value is None:
-        return None
-    normalized_type = str(data_type or "").lower()
-    if normalized_type == "boolean":
-        return {"boolean": _convert_value(value, "boolean")}
-    if normalized_type in {"smallint", "integer", "bigint"}:
-        try:
-            return {"integer": str(int(value))}
-        except (TypeError, ValueError) as error:
-            raise ArrPostgresMigrationError(
-                "A SQLite integer value could not be normalized for validation."
-            ) from error
-    if normalized_type == "uuid":
-        try:
-            return {"uuid": str(uuid.UUID(str(value)))}
-        except (AttributeError, TypeError, ValueError) as error:
-            raise ArrPostgresMigrationError(
-                "A SQLite UUID value could not be normalized for validation."
-            ) from error
-    if normalized_type == "bytea":
-        if isinstance(value, memoryview):
-            value = value.tobytes()
-        if isinstance(value, bytearray):
-            value = bytes(value)
-        if not isinstance(value, bytes):
-            raise ArrPostgresMigrationError(
-                "A SQLite binary value could not be normalized for validation."
-            )
-        return {"bytea": value.hex()}
-    if normalized_type.startswith("timestamp"):
-        converted = _convert_value(value, normalized_type)
-        if isinstance(converted, str):
-            candidate = converted.strip()
-            if candidate.endswith(("Z", "z")):
-                candidate = f"{candidate[:-1]}+00:00"
-            try:
-                converted = datetime.fromisoformat(candidate)
-            except ValueError as error:
-                raise ArrPostgresMigrationError(
-                    "A SQLite timestamp could not be normalized for validation."
-                ) from error
-        if not isinstance(converted, datetime):
-            raise ArrPostgresMigrationError(
-                "A SQLite timestamp could not be normalized for validation."
-            )
-        if "without time zone" in normalized_type:
-            if converted.tzinfo is not None:
-                converted = converted.astimezone(timezone.utc).replace(tzinfo=None)
-            timestamp_value = converted.isoformat(timespec="microseconds")
-        else:
-            if converted.tzinfo is None:
-                converted = converted.replace(tzinfo=timezone.utc)
-            converted = converted.astimezone(timezone.utc)
-            timestamp_value = converted.isoformat(timespec="microseconds")
-        return {"timestamp": timestamp_value}
-    return {"text": str(value)}
+    The worker module imports nothing from DUMB, so unlike a multiprocessing
+    child it never re-runs ``main.py`` or touches the configuration.
+    """
+
+    request = json.dumps(
+        {
+            "check": check,
+            "connection_args": list(connection_args),
+            "table": table,
+            "options": options,
+        }
+    )
+    completed = subprocess.run(
+        [sys.executable, "-m", "utils.arr_postgres_digest"],
+        input=request,
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[1],
+        check=False,
+    )
+    try:
+        reply = json.loads(completed.stdout)
+    except ValueError:
+        reply = None
+    if completed.returncode != 0 or not isinstance(reply, dict):
+        raise ArrPostgresMigrationError(
+            f"Digest validation worker for table {table} exited with status "
+            f"{completed.returncode}."
+        )
+    if "error" in reply:
+        raise ArrPostgresMigrationError(str(reply["error"]))
+    return reply.get("result")
 
 
-def _digest_rows(
-    rows,
-    data_types: list[str],
-    *,
-    source_values: bool,
-) -> dict[str, Any]:
-    count = 0
-    xor_value = 0
-    sum_value = 0
-    modulus = 1 << 256
-    for row in rows:
-        if len(row) != len(data_types):
-            raise ArrPostgresMigrationError(
-                "A database row did not match the expected validation columns."
-            )
-        normalized = [
-            _normalize_digest_value(
-                _convert_value(value, data_type) if source_values else value,
-                data_type,
+def _run_table_validations(
+    tables: list[str],
+    check: str,
+    source: sqlite3.Connection,
+    target,
+    connection_args: tuple[str, dict[str, Any], str] | None,
+    workers: int,
+    options: dict[str, Any] | None = None,
+) -> list[Any]:
+    """Run the ``check`` validation for every table, in table order.
+
+    Digesting is CPU-bound Python, so with ``connection_args`` (a JSON-safe
+    ``(sqlite_path, postgres_config, database)`` tuple) each table runs in its
+    own worker process on its own connections, at most ``workers`` at a time.
+    Otherwise the tables share ``source`` and ``target`` in this process.
+    """
+
+    options = options or {}
+    if connection_args is None or workers <= 1 or len(tables) <= 1:
+        validate = TABLE_VALIDATIONS[check]
+        return [validate(source, target, table, **options) for table in tables]
+
+    with ThreadPoolExecutor(max_workers=min(int(workers), len(tables))) as executor:
+        futures = [
+            executor.submit(
+                _validate_table_in_subprocess, check, connection_args, table, options
             )
-            for value, data_type in zip(row, data_types)
+            for table in tables
         ]
-        digest = hashlib.sha256(
-            json.dumps(
-                normalized,
-                separators=(",", ":"),
-                ensure_ascii=False,
-            ).encode("utf-8")
-        ).digest()
-        numeric = int.from_bytes(digest, "big")
-        xor_value ^= numeric
-        sum_value = (sum_value + numeric) % modulus
-        count += 1
-    return {
-        "count": count,
-        "xor": f"{xor_value:064x}",
-        "sum": f"{sum_value:064x}",
-    }
+        wait(futures, return_when=FIRST_EXCEPTION)
+        failed = next(
+            (
+                future
+                for future in futures
+                if future.done() and not future.cancelled() and future.exception()
+            ),
+            None,
+        )
+        if failed is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise failed.exception()
+        return [future.result() for future in futures]
 
 
 def _validate_full_row_digests(
     source: sqlite3.Connection,
     target,
     tables: list[str],
+    *,
+    connection_args: tuple[str, dict[str, Any], str] | None = None,
+    workers: int = DIGEST_VALIDATION_WORKERS,
+    chunk_rows: int | None = None,
 ) -> int:
-    """Verify every imported value using order-independent per-table digests."""
-
-    validated = 0
-    for table in tables:
-        columns = _sqlite_columns(source, table)
-        target_columns = _postgres_table_columns(target, table)
-        missing_columns = [column for column in columns if column not in target_columns]
-        if missing_columns:
-            raise ArrPostgresMigrationError(
-                f"PostgreSQL table {table} is missing columns for content validation."
-            )
-        data_types = [target_columns[column]["data_type"] for column in columns]
-        escaped_table = table.replace('"', '""')
-        source_columns = ", ".join(
-            f'"{column.replace(chr(34), chr(34) * 2)}"' for column in columns
-        )
-        source_digest = _digest_rows(
-            source.execute(f'SELECT {source_columns} FROM "{escaped_table}"'),
-            data_types,
-            source_values=True,
-        )
-        cursor_name = f"dumb_full_{uuid.uuid4().hex}"
-        with target.cursor(name=cursor_name) as cursor:
-            cursor.itersize = INFINIDYSK_FULL_ROW_DIGEST_ITERSIZE
-            cursor.execute(
-                sql.SQL("SELECT {} FROM {}").format(
-                    sql.SQL(", ").join(sql.Identifier(column) for column in columns),
-                    sql.Identifier(table),
-                )
-            )
-            target_digest = _digest_rows(
-                cursor,
-                data_types,
-                source_values=False,
-            )
-        if target_digest != source_digest:
-            raise ArrPostgresMigrationError(
-                f"Full-row content validation failed for PostgreSQL table {table}."
-            )
-        validated += 1
-    return validated
+    """Verify every imported value using order-independent per-table digests.
+
+    ``chunk_rows`` digests ``INTEGER PRIMARY KEY`` tables in key ranges of
+    that many rows so a mismatch names the ranges that differ.
+    """
+
+    results = _run_table_validations(
+        tables,
+        "full_row",
+        source,
+        target,
+        connection_args,
+        workers,
+        {"chunk_rows": chunk_rows},
+    )
+    return len(results)
 
 
 def _validate_primary_key_digests(
     source: sqlite3.Connection,
     target,
     tables: list[str],
+    *,
+    connection_args: tuple[str, dict[str, Any], str] | None = None,
+    workers: int = DIGEST_VALIDATION_WORKERS,
 ) -> dict[str, dict[str, Any]]:
-    results = {}
-    for table in tables:
-        escaped_table = table.replace('"', '""')
-        source_info = source.execute(f'PRAGMA table_info("{escaped_table}")').fetchall()
-        source_keys = [
-            str(row[1])
-            for row in sorted(source_info, key=lambda item: int(item[5] or 0))
-            if int(row[5] or 0) > 0
-        ]
-        if not source_keys:
-            raise ArrPostgresMigrationError(
-                f"SQLite table {table} has no primary key for digest validation."
-            )
-        with target.cursor() as cursor:
-            cursor.execute(
-                "SELECT attribute.attname "
-                "FROM pg_index AS index_entry "
-                "JOIN pg_class AS table_entry "
-                "ON table_entry.oid = index_entry.indrelid "
-                "JOIN pg_namespace AS namespace_entry "
-                "ON namespace_entry.oid = table_entry.relnamespace "
-                "JOIN unnest(index_entry.indkey) WITH ORDINALITY "
-                "AS key_entry(attnum, position) ON TRUE "
-                "JOIN pg_attribute AS attribute "
-                "ON attribute.attrelid = table_entry.oid "
-                "AND attribute.attnum = key_entry.attnum "
-                "WHERE namespace_entry.nspname = 'public' "
-                "AND table_entry.relname = %s AND index_entry.indisprimary "
-                "ORDER BY key_entry.position",
-                [table],
-            )
-            target_keys = [str(row[0]) for row in cursor.fetchall()]
-        if target_keys != source_keys:
-            raise ArrPostgresMigrationError(
-                f"Primary-key definition differs for PostgreSQL table {table}."
-            )
-        target_columns = _postgres_table_columns(target, table)
-        key_data_types = [target_columns[column]["data_type"] for column in source_keys]
-
-        source_columns = ", ".join(
-            f'"{column.replace(chr(34), chr(34) * 2)}"' for column in source_keys
-        )
-        source_digest = _digest_rows(
-            source.execute(f'SELECT {source_columns} FROM "{escaped_table}"'),
-            key_data_types,
-            source_values=True,
-        )
-        cursor_name = f"dumb_keys_{uuid.uuid4().hex}"
-        with target.cursor(name=cursor_name) as cursor:
-            cursor.itersize = INFINIDYSK_PRIMARY_KEY_DIGEST_ITERSIZE
-            cursor.execute(
-                sql.SQL("SELECT {} FROM {}").format(
-                    sql.SQL(", ").join(
-                        sql.Identifier(column) for column in target_keys
-                    ),
-                    sql.Identifier(table),
-                )
-            )
-            target_digest = _digest_rows(
-                cursor,
-                key_data_types,
-                source_values=False,
-            )
-        if target_digest != source_digest:
-            raise ArrPostgresMigrationError(
-                f"Primary-key digest validation failed for PostgreSQL table {table}."
-            )
-        results[table] = source_digest
-    return results
+    results = _run_table_validations(
+        tables, "primary_key", source, target, connection_args, workers
+    )
+    return dict(zip(tables, results))
 
 
 def _validate_infinidysk_postgres_schema_connection(connection) -> dict[str, Any]:
@@ -2525,6 +2353,119 @@ def _converted_import_batches(
         yield batch
 
 
+_COPY_TEXT_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+
+def _copy_text_value(value: Any) -> str:
+    """Render a ``_convert_value`` result as a COPY text-format field."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex input; the backslash itself is escaped for COPY text.
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).translate(_COPY_TEXT_ESCAPES)
+
+
+class _CopyTextStream:
+    """File-like reader that feeds ``copy_expert`` from converted row batches.
+
+    Only one batch is encoded ahead of what PostgreSQL has read, so a table
+    streams through without being materialized. ``on_rows`` is told how many
+    rows each encoded batch held.
+    """
+
+    def __init__(self, batches, on_rows: Callable[[int], None] | None = None):
+        self._batches = iter(batches)
+        self._buffer = bytearray()
+        self._on_rows = on_rows
+
+    def read(self, size: int = -1) -> bytes:
+        while size is None or size < 0 or len(self._buffer) < size:
+            batch = next(self._batches, None)
+            if batch is None:
+                break
+            self._buffer += "".join(
+                "\t".join(_copy_text_value(value) for value in row) + "\n"
+                for row in batch
+            ).encode("utf-8")
+            if self._on_rows:
+                self._on_rows(len(batch))
+        if size is None or size < 0:
+            size = len(self._buffer)
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return chunk
+
+
+def _copy_sqlite_table(
+    sqlite_path: Path,
+    postgres_config: dict[str, Any],
+    database: str,
+    table: str,
+    columns: list[str],
+    target_columns: dict[str, dict[str, str]],
+    *,
+    batch_size: int,
+    max_batch_bytes: int | None,
+    on_rows: Callable[[int], None] | None = None,
+) -> int:
+    """Stream one SQLite table into PostgreSQL with ``COPY FROM STDIN``.
+
+    Each call uses its own SQLite and PostgreSQL connections so tables can be
+    copied concurrently, and commits once when the table is complete.
+    """
+    source = sqlite3.connect(f"file:{sqlite_path}?mode=ro", uri=True, timeout=60)
+    target = _pg_connect(postgres_config, database)
+    copied = 0
+
+    def count_rows(rows: int) -> None:
+        nonlocal copied
+        copied += rows
+        if on_rows:
+            on_rows(rows)
+
+    try:
+        target.autocommit = False
+        escaped = table.replace('"', '""')
+        select_columns = ", ".join(
+            f'"{column.replace(chr(34), chr(34) * 2)}"' for column in columns
+        )
+        source_cursor = source.execute(f'SELECT {select_columns} FROM "{escaped}"')
+        stream = _CopyTextStream(
+            _converted_import_batches(
+                source_cursor,
+                columns,
+                target_columns,
+                batch_size=batch_size,
+                max_batch_bytes=max_batch_bytes,
+            ),
+            count_rows,
+        )
+        with target.cursor() as cursor:
+            cursor.execute("SET session_replication_role = replica")
+            cursor.copy_expert(
+                sql.SQL("COPY {} ({}) FROM STDIN").format(
+                    sql.Identifier(table),
+                    sql.SQL(", ").join(sql.Identifier(column) for column in columns),
+                ),
+                stream,
+            )
+        target.commit()
+        return copied
+    except Exception:
+        target.rollback()
+        raise
+    finally:
+        source.close()
+        target.close()
+
+
 def import_sqlite_to_postgres(
     sqlite_path: str | Path,
     postgres_config: dict[str, Any],
@@ -2533,8 +2474,13 @@ def import_sqlite_to_postgres(
     batch_size: int = 500,
     excluded_tables: set[str] | None = None,
     service_key: str | None = None,
+    workers: int = IMPORT_TABLE_WORKERS,
 ) -> dict[str, Any]:
-    """Import data into an application-created PostgreSQL schema and validate counts."""
+    """Import data into an application-created PostgreSQL schema and validate counts.
+
+    Tables are streamed with ``COPY`` on up to ``workers`` connections at once;
+    replica mode disables foreign-key triggers, so table order does not matter.
+    """
     sqlite_path = Path(sqlite_path)
     tables = _prepare_target_for_import(
         sqlite_path,
@@ -2546,12 +2492,14 @@ def import_sqlite_to_postgres(
     source = sqlite3.connect(f"file:{sqlite_path}?mode=ro", uri=True, timeout=60)
     target = _pg_connect(postgres_config, database)
     imported: dict[str, int] = {}
+    table_rates: dict[str, float] = {}
     try:
         target.autocommit = False
         with target.cursor() as cursor:
             cursor.execute("SET session_replication_role = replica")
         total_rows = 0
         source_counts = {}
+        plans = []
         for table in tables:
             escaped = table.replace('"', '""')
             count = int(
@@ -2559,9 +2507,6 @@ def import_sqlite_to_postgres(
             )
             source_counts[table] = count
             total_rows += count
-
-        processed_rows = 0
-        for table_index, table in enumerate(tables, start=1):
             source_columns = _sqlite_columns(source, table)
             target_columns = _postgres_table_columns(target, table)
             columns = [
@@ -2578,47 +2523,99 @@ def import_sqlite_to_postgres(
                     f"PostgreSQL table {table} is missing importable columns: "
                     + ", ".join(missing_columns[:10])
                 )
-            escaped = table.replace('"', '""')
-            select_columns = ", ".join(
-                f'"{column.replace(chr(34), chr(34) * 2)}"' for column in columns
-            )
-            source_cursor = source.execute(f'SELECT {select_columns} FROM "{escaped}"')
-            imported_count = 0
-            insert_query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
-                sql.Identifier(table),
-                sql.SQL(", ").join(sql.Identifier(column) for column in columns),
-            )
-            max_batch_bytes = (
-                INFINIDYSK_IMPORT_BATCH_BYTES if service_key == "infinidysk" else None
-            )
-            for converted in _converted_import_batches(
-                source_cursor,
-                columns,
-                target_columns,
-                batch_size=batch_size,
-                max_batch_bytes=max_batch_bytes,
-            ):
-                with target.cursor() as cursor:
-                    execute_values(
-                        cursor,
-                        insert_query,
-                        converted,
-                        page_size=len(converted),
-                    )
-                target.commit()
-                imported_count += len(converted)
-                processed_rows += len(converted)
-                if progress:
-                    progress(
-                        {
-                            "table": table,
-                            "table_index": table_index,
-                            "table_count": len(tables),
-                            "processed_rows": processed_rows,
-                            "total_rows": total_rows,
-                        }
+            plans.append((table, columns, target_columns))
+        # Do not hold the planning transaction open while the workers copy.
+        target.commit()
+
+        max_batch_bytes = (
+            INFINIDYSK_IMPORT_BATCH_BYTES if service_key == "infinidysk" else None
+        )
+        progress_lock = threading.Lock()
+        processed_rows = 0
+        abort = threading.Event()
+        first_failure = []
+
+        def import_table(table_index, table, columns, target_columns):
+            started = time.monotonic()
+            table_rows = 0
+
+            def on_rows(rows):
+                nonlocal processed_rows, table_rows
+                if abort.is_set():
+                    # Raising from the COPY stream aborts and rolls back this table.
+                    raise ArrPostgresMigrationError(
+                        f"Import of {table} stopped after another table failed."
                     )
-            imported[table] = imported_count
+                with progress_lock:
+                    processed_rows += rows
+                    table_rows += rows
+                    if progress:
+                        elapsed = max(time.monotonic() - started, 1e-6)
+                        progress(
+                            {
+                                "table": table,
+                                "table_index": table_index,
+                                "table_count": len(tables),
+                                "processed_rows": processed_rows,
+                                "total_rows": total_rows,
+                                "table_rows": table_rows,
+                                "table_total_rows": source_counts[table],
+                                "rows_per_second": round(table_rows / elapsed, 1),
+                            }
+                        )
+
+            if abort.is_set():
+                raise ArrPostgresMigrationError(
+                    f"Import of {table} skipped after another table failed."
+                )
+            try:
+                copied = _copy_sqlite_table(
+                    sqlite_path,
+                    postgres_config,
+                    database,
+                    table,
+                    columns,
+                    target_columns,
+                    batch_size=batch_size,
+                    max_batch_bytes=max_batch_bytes,
+                    on_rows=on_rows,
+                )
+            except Exception as error:
+                with progress_lock:
+                    if not abort.is_set():
+                        first_failure.append(error)
+                        abort.set()
+                raise
+            elapsed = max(time.monotonic() - started, 1e-6)
+            return copied, round(copied / elapsed, 1)
+
+        worker_count = max(1, min(int(workers), len(plans)))
+        with ThreadPoolExecutor(
+            max_workers=worker_count, thread_name_prefix="postgres-import"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    import_table, table_index, table, columns, target_columns
+                ): table
+                for table_index, (table, columns, target_columns) in enumerate(
+                    plans, start=1
+                )
+            }
+            wait(futures, return_when=FIRST_EXCEPTION)
+            failed = next(
+                (
+                    future
+                    for future in futures
+                    if future.done() and not future.cancelled() and future.exception()
+                ),
+                None,
+            )
+            if failed is not None:
+                abort.set()
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise (first_failure or [failed.exception()])[0]
+            for future, table in futures.items():
+                imported[table], table_rates[table] = future.result()
 
         sequence_count = _reset_postgres_sequences(target)
         with target.cursor() as cursor:
@@ -2652,16 +2649,21 @@ def import_sqlite_to_postgres(
         full_row_digests_validated = 0
         foreign_key_validation = []
         schema_validation = None
+
+        connection_args = (str(sqlite_path), postgres_config, database)
         if service_key == "infinidysk":
             primary_key_digests = _validate_primary_key_digests(
                 source,
                 target,
                 tables,
+                connection_args=connection_args,
             )
             full_row_digests_validated = _validate_full_row_digests(
                 source,
                 target,
                 tables,
+                connection_args=connection_args,
+                chunk_rows=FULL_ROW_DIGEST_CHUNK_ROWS,
             )
             foreign_key_validation = _validate_postgres_foreign_keys(
                 target,
@@ -2681,6 +2683,7 @@ def import_sqlite_to_postgres(
                 schema_validation["fingerprint"] if schema_validation else None
             ),
             "row_counts": imported,
+            "rows_per_second": table_rates,
             "validated": True,
         }
     except Exception:
@@ -1,6 +1,10 @@
 import json
 import os
 import secrets
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -133,6 +137,7 @@ class AuthConfigManager:
                 os.fsync(f.fileno())
             os.chmod(temp_path, 0o600)
             os.replace(temp_path, self.config_path)
+            AUTH_STATE.invalidate()
         finally:
             try:
                 if os.path.exists(temp_path):
@@ -348,3 +353,108 @@ class AuthConfigManager:
             True if setup was skipped, False otherwise
         """
         return self.config.setup_skipped
+
+
+AUTH_STATE_RECHECK_SECONDS = 2.0
+TOKEN_CACHE_SIZE = 256
+
+
+class AuthStateCache:
+    """Process-wide auth configuration and verified-token cache.
+
+    Request dependencies read ``users.json`` through one shared
+    ``AuthConfigManager`` instead of parsing it per request. The file's
+    mtime is rechecked at most every ``recheck_seconds`` and any
+    ``save_config`` in this process invalidates immediately. Verified
+    access tokens are remembered until they expire or the auth state is
+    reloaded, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        recheck_seconds=AUTH_STATE_RECHECK_SECONDS,
+        token_cache_size=TOKEN_CACHE_SIZE,
+        clock=time.monotonic,
+    ):
+        self.recheck_seconds = max(0.0, float(recheck_seconds))
+        self.token_cache_size = max(1, int(token_cache_size))
+        self.clock = clock
+        self.version = 0
+        self._manager = None
+        self._path = None
+        self._mtime = None
+        self._checked_at = None
+        self._invalidated = 0
+        self._loaded_invalidation = None
+        self._tokens = OrderedDict()
+        # Reentrant: loading a config without a JWT secret saves it, which
+        # calls ``invalidate`` while ``manager`` still holds the lock.
+        self._lock = threading.RLock()
+
+    def invalidate(self):
+        with self._lock:
+            self._invalidated += 1
+
+    def manager(self) -> AuthConfigManager:
+        """Return the shared manager, reloading it if ``users.json`` changed."""
+        path = os.path.abspath(
+            os.environ.get(AUTH_CONFIG_PATH_ENV) or DEFAULT_AUTH_CONFIG_PATH
+        )
+        with self._lock:
+            now = self.clock()
+            if (
+                self._manager is not None
+                and self._path == path
+                and self._loaded_invalidation == self._invalidated
+            ):
+                if now - self._checked_at < self.recheck_seconds:
+                    return self._manager
+                self._checked_at = now
+                if self._file_mtime(path) == self._mtime:
+                    return self._manager
+
+            invalidation = self._invalidated
+            manager = AuthConfigManager(path)
+            self._manager = manager
+            self._path = path
+            self._mtime = self._file_mtime(path)
+            self._checked_at = now
+            self._loaded_invalidation = invalidation
+            self.version += 1
+            self._tokens.clear()
+            return manager
+
+    def cached_principal(self, token: str) -> Optional[str]:
+        """Return the principal of a previously verified, unexpired token."""
+        with self._lock:
+            entry = self._tokens.get(token)
+            if entry is None:
+                return None
+            principal, expires_at, version = entry
+            if version != self.version or time.time() >= expires_at:
+                del self._tokens[token]
+                return None
+            self._tokens.move_to_end(token)
+            return principal
+
+    def remember_token(self, token: str, payload) -> None:
+        """Cache a token that passed ``decode_token`` and principal checks."""
+        expires = getattr(payload, "exp", None)
+        if not isinstance(expires, datetime):
+            return
+        with self._lock:
+            self._tokens[token] = (payload.sub, expires.timestamp(), self.version)
+            self._tokens.move_to_end(token)
+            while len(self._tokens) > self.token_cache_size:
+                self._tokens.popitem(last=False)
+
+    @staticmethod
+    def _file_mtime(path):
+        try:
+            status = os.stat(path)
+        except OSError:
+            return None
+        return status.st_mtime_ns, status.st_size
+
+
+AUTH_STATE = AuthStateCache()
@@ -4166,7 +4166,6 @@ class Update:
 
         if config.get("wait_for_url", False):
             wait_url_entries = config["wait_for_url"]
-            time.sleep(5)
             result, error = wait_for_urls(
                 wait_url_entries,
                 process_name,
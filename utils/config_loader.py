@@ -1,8 +1,9 @@
-import os, shutil, copy, time, tempfile, json
+import os, shutil, copy, time, tempfile, json, threading
 from json import load, dump, JSONDecodeError
 from jsonschema import validate, ValidationError
 from dotenv import load_dotenv, find_dotenv
 from collections import OrderedDict
+from utils.process_registry import normalize_process_name
 from utils.release_selection import normalize_release_selectors
 from utils.runtime_paths import default_config_file, default_schema_file
 from utils.service_identity import INFINIDYSK_KEY, INFINIDYSK_LEGACY_KEY
@@ -40,6 +41,9 @@ class ConfigManager:
         self.default_config_path = os.path.abspath(default_config_path)
 
         self._legacy_infinidysk_identity = False
+        self.version = 0
+        self._process_index = None
+        self._process_index_lock = threading.Lock()
 
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"Config file not found: {self.file_path}")
@@ -51,6 +55,10 @@ class ConfigManager:
         self.schema = self._load_schema()
         self.config = self._load_and_validate_config()
 
+    def _bump_version(self):
+        """Invalidate the process index and any cache keyed on ``version``."""
+        self.version += 1
+
     @staticmethod
     def _map_infinidysk_identity(config, target_key):
         if not isinstance(config, dict):
@@ -569,6 +577,7 @@ class ConfigManager:
         else:
             ConfigManager.fix_null_strings(self.config, self.schema)
             self._atomic_write(self.config)
+        self._bump_version()
 
     def get(self, key, section=None, normalize_case=False):
         value = (
@@ -597,6 +606,7 @@ class ConfigManager:
             self.config[section][key] = value
         else:
             self.config[key] = value
+        self._bump_version()
 
     def reload(self):
         config = self._load_config()
@@ -604,26 +614,115 @@ class ConfigManager:
             INFINIDYSK_LEGACY_KEY in config and INFINIDYSK_KEY not in config
         )
         self.config = self._merge_with_env(self._canonicalize_runtime_config(config))
+        self._bump_version()
 
     def find_key_for_process(self, process_name):
-        for key, value in self.config.items():
-            if isinstance(value, dict) and value.get("process_name") == process_name:
-                return key, None
-
-            if isinstance(value, dict) and "instances" in value:
-                for instance_name, instance_config in value["instances"].items():
-                    if instance_config.get("process_name") == process_name:
-                        return key, instance_name
+        entry = self.find_process(process_name)
+        if entry is None:
+            return None, None
+        return entry[0], entry[1]
+
+    def find_process(self, process_name, normalized=False):
+        """Return ``(key, instance_name, config)`` for a process, or None.
+
+        Lookups use an index rebuilt when ``version`` changes or ``config`` is
+        replaced. Hits are checked against the live config, so in-place edits
+        made without ``set`` are noticed, rescanned and bump the version. A
+        miss rescans once and is then remembered until the version changes.
+        """
+        entry = self._lookup_process_index(process_name, normalized)
+        if entry is not None and self._process_entry_is_current(
+            entry, process_name, normalized
+        ):
+            return entry
+        miss = (process_name, bool(normalized))
+        with self._process_index_lock:
+            if entry is None and miss in self._process_index[4]:
+                return None
+            self._process_index = self._build_process_index()
+        rescanned = self._lookup_process_index(process_name, normalized)
+        with self._process_index_lock:
+            if entry is not None or rescanned is not None:
+                self._bump_version()
+                self._process_index = (
+                    self.version,
+                    *self._process_index[1:4],
+                    set(),
+                )
+            if rescanned is None:
+                self._process_index[4].add(miss)
+        return rescanned
 
-            if key == "dumb" and isinstance(value, dict):
+    @staticmethod
+    def _normalize_process_name(process_name):
+        return normalize_process_name(process_name)
+
+    def _lookup_process_index(self, process_name, normalized):
+        with self._process_index_lock:
+            index = self._process_index
+            if index is None or index[1] is not self.config:
+                self._bump_version()
+                index = self._process_index = self._build_process_index()
+            elif index[0] != self.version:
+                index = self._process_index = self._build_process_index()
+        _version, _config, exact, loose, _misses = index
+        entry = exact.get(process_name)
+        if entry is None and normalized:
+            entry = loose.get(self._normalize_process_name(process_name))
+        return entry
+
+    def _build_process_index(self):
+        exact, loose = {}, {}
+
+        def add(name, entry):
+            if name:
+                exact.setdefault(name, entry)
+                loose.setdefault(self._normalize_process_name(name), entry)
+
+        config = self.config
+        for key, value in config.items():
+            if not isinstance(value, dict):
+                continue
+            add(value.get("process_name"), (key, None, value))
+            instances = value.get("instances")
+            if isinstance(instances, dict):
+                for instance_name, instance_config in instances.items():
+                    if isinstance(instance_config, dict):
+                        add(
+                            instance_config.get("process_name"),
+                            (key, instance_name, instance_config),
+                        )
+            if key == "dumb":
                 for subkey, subvalue in value.items():
-                    if (
-                        isinstance(subvalue, dict)
-                        and subvalue.get("process_name") == process_name
-                    ):
-                        return key + "_" + subkey, None
-
-        return None, None
+                    if isinstance(subvalue, dict):
+                        add(
+                            subvalue.get("process_name"),
+                            (key + "_" + subkey, None, subvalue),
+                        )
+        return self.version, config, exact, loose, set()
+
+    def _process_entry_is_current(self, entry, process_name, normalized):
+        key, instance_name, section = entry
+        name = section.get("process_name")
+        if normalized:
+            if self._normalize_process_name(name) != self._normalize_process_name(
+                process_name
+            ):
+                return False
+        elif name != process_name:
+            return False
+        if instance_name is not None:
+            root = self.config.get(key)
+            instances = root.get("instances") if isinstance(root, dict) else None
+            return isinstance(instances, dict) and (
+                instances.get(instance_name) is section
+            )
+        if key in self.config:
+            return self.config[key] is section
+        if key.startswith("dumb_"):
+            dumb = self.config.get("dumb")
+            return isinstance(dumb, dict) and dumb.get(key[5:]) is section
+        return False
 
 
 def find_service_config(config, process_name):
@@ -9,11 +9,13 @@ runs integrity checks, VACUUM, checkpoints, ANALYZE, or application SQL queries.
 
 from __future__ import annotations
 
+import json
 import os
 import re
 import sqlite3
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from urllib.parse import unquote, urlparse
@@ -75,6 +77,13 @@ NETWORK_FILESYSTEMS = {
     "nfs4",
     "smb3",
 }
+COLLECTION_WORKERS = 4
+COLLECTION_DEADLINE_SECONDS = 30
+LOG_STATE_PATH = "/config/metrics/database-health-log-cursors.json"
+LOG_BUCKET_SECONDS = 60
+LOG_WINDOWS = {"15m": 900, "1h": 3600, "24h": 86400}
+LOG_READ_CHUNK_BYTES = 1024 * 1024
+LOG_SCAN_LIMIT_BYTES = 64 * 1024 * 1024
 LOG_PATTERNS = {
     "locked": re.compile(
         r"database\s+is\s+locked|database\s+table\s+is\s+locked", re.I
@@ -92,24 +101,39 @@ LOG_PATTERNS = {
 
 
 class DatabaseHealthCollector:
-    """Collect cached database pressure indicators for configured services."""
+    """Collect cached database pressure indicators for configured services.
 
-    def __init__(self, logger=None, clock=time.time, process_handler=None):
+    Stale services are collected on a small background pool so a slow
+    network-storage database never stalls the metrics tick. ``snapshot``
+    returns the last result with its ``age_sec`` and schedules a refresh;
+    callers that need fresh data pass ``wait_for_refresh`` and wait at most
+    ``COLLECTION_DEADLINE_SECONDS`` per service.
+    """
+
+    def __init__(
+        self, logger=None, clock=time.time, process_handler=None, log_state_path=None
+    ):
         self.logger = logger
         self.clock = clock
         self.process_handler = process_handler
+        self.log_state_path = log_state_path
         self._cache: dict[str, dict[str, Any]] = {}
-        self._log_states: dict[str, dict[str, Any]] = {}
+        self._log_states: dict[str, dict[str, Any]] | None = None
+        self._log_state_lock = threading.Lock()
         self._postgres_previous: dict[tuple[str, str], dict[str, int]] = {}
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
+        self._inflight: dict[str, tuple[Any, float]] = {}
+        self._executor = None
 
     def invalidate(self, service_id: str | None = None) -> None:
         """Drop cached probes so the next snapshot performs a fresh collection."""
         with self._lock:
             if service_id:
                 self._cache.pop(service_id, None)
+                self._inflight.pop(service_id, None)
             else:
                 self._cache.clear()
+                self._inflight.clear()
 
     def service_id_for_process(
         self, config: dict[str, Any], process_name: str
@@ -125,6 +149,7 @@ class DatabaseHealthCollector:
         details: bool = True,
         refresh_if_stale: bool = True,
         process_name: str | None = None,
+        wait_for_refresh: bool = False,
     ) -> dict[str, Any]:
         metrics_cfg = (config.get("dumb") or {}).get("metrics") or {}
         health_cfg = metrics_cfg.get("database_health") or {}
@@ -146,6 +171,8 @@ class DatabaseHealthCollector:
             ]
         now = self.clock()
         services = []
+        entries = []
+        pending = []
         with self._lock:
             for candidate in candidates:
                 service_cfg = configured_services.get(candidate["id"]) or {}
@@ -187,31 +214,56 @@ class DatabaseHealthCollector:
                     and bool(cached.get("ignore_network_storage"))
                     == ignore_network_storage
                 )
-                if (
+                if refresh_if_stale and not (
                     cache_matches_config
                     and now - float(cached.get("collected_at") or 0) < interval
                 ):
+                    pending.append(
+                        self._submit_collection(
+                            candidate,
+                            config,
+                            mode=mode,
+                            ignore_network_storage=ignore_network_storage,
+                            log_tail_bytes=log_tail_bytes,
+                        )
+                    )
+                entries.append((candidate, mode, ignore_network_storage, len(services)))
+                services.append(None)
+
+        if wait_for_refresh and pending:
+            deadline = time.monotonic() + COLLECTION_DEADLINE_SECONDS
+            for future in pending:
+                try:
+                    future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except Exception:
+                    pass
+
+        now = self.clock()
+        with self._lock:
+            for candidate, mode, ignore_network_storage, index in entries:
+                cached = self._cache.get(candidate["id"])
+                cache_matches_config = bool(
+                    cached
+                    and cached.get("mode") == mode
+                    and bool(cached.get("ignore_network_storage"))
+                    == ignore_network_storage
+                )
+                if cache_matches_config:
                     result = dict(cached)
-                elif not refresh_if_stale:
-                    result = (
-                        dict(cached)
-                        if cache_matches_config
-                        else self._waiting_result(candidate, mode)
+                    result["age_sec"] = round(
+                        max(0.0, now - float(cached.get("collected_at") or 0)), 1
                     )
                 else:
-                    result = self._collect_service(
-                        candidate,
-                        config,
-                        mode=mode,
-                        ignore_network_storage=ignore_network_storage,
-                        log_tail_bytes=log_tail_bytes,
-                        now=now,
-                    )
-                    self._cache[candidate["id"]] = result
+                    result = self._waiting_result(candidate, mode)
+                inflight = self._inflight.get(candidate["id"])
+                if inflight is not None:
+                    result["refreshing"] = True
+                    if time.monotonic() - inflight[1] > COLLECTION_DEADLINE_SECONDS:
+                        result["collection_overdue"] = True
                 result["monitoring_enabled"] = True
                 result["mode"] = mode
                 result["ignore_network_storage"] = ignore_network_storage
-                services.append(result if details else self._compact_result(result))
+                services[index] = result if details else self._compact_result(result)
 
         monitored = [item for item in services if item.get("monitoring_enabled")]
         if not details:
@@ -229,6 +281,65 @@ class DatabaseHealthCollector:
             "services": services,
         }
 
+    def _submit_collection(
+        self, candidate, config, mode, ignore_network_storage, log_tail_bytes
+    ):
+        """Queue one collection per service; return its future."""
+        inflight = self._inflight.get(candidate["id"])
+        if inflight is not None:
+            return inflight[0]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=COLLECTION_WORKERS,
+                thread_name_prefix="database-health",
+            )
+        future = self._executor.submit(
+            self._run_collection,
+            candidate,
+            config,
+            mode,
+            ignore_network_storage,
+            log_tail_bytes,
+        )
+        self._inflight[candidate["id"]] = (future, time.monotonic())
+        future.add_done_callback(
+            lambda done, service_id=candidate["id"]: self._finish_collection(
+                service_id, done
+            )
+        )
+        return future
+
+    def _run_collection(
+        self, candidate, config, mode, ignore_network_storage, log_tail_bytes
+    ):
+        started = time.monotonic()
+        result = self._collect_service(
+            candidate,
+            config,
+            mode=mode,
+            ignore_network_storage=ignore_network_storage,
+            log_tail_bytes=log_tail_bytes,
+            now=self.clock(),
+        )
+        result["collection_ms"] = round((time.monotonic() - started) * 1000, 1)
+        return result
+
+    def _finish_collection(self, service_id, future):
+        with self._lock:
+            inflight = self._inflight.get(service_id)
+            if inflight is None or inflight[0] is not future:
+                return
+            del self._inflight[service_id]
+            try:
+                self._cache[service_id] = future.result()
+            except Exception as error:
+                if self.logger:
+                    self.logger.warning(
+                        "Database health collection failed for %s: %s",
+                        service_id,
+                        _safe_error(error),
+                    )
+
     def _discover_services(self, config: dict[str, Any]) -> list[dict[str, Any]]:
         candidates = []
         for key in sorted(SUPPORTED_SERVICE_KEYS):
@@ -805,6 +916,13 @@ class DatabaseHealthCollector:
         return result
 
     def _collect_log_signals(self, path, tail_bytes):
+        """Scan only the bytes appended to ``path`` since the previous pass.
+
+        The cursor (inode and offset) persists across restarts. A log seen
+        for the first time starts ``tail_bytes`` from the end; a rotated or
+        truncated log is read from its start. Matches land in per-minute
+        buckets, and the reported counts cover the last hour.
+        """
         empty = {name: 0 for name in LOG_PATTERNS}
         if not path:
             return {**empty, "available": False}
@@ -814,55 +932,135 @@ class DatabaseHealthCollector:
         except OSError:
             return {**empty, "available": False, "path": path}
 
-        state = self._log_states.get(path)
+        with self._log_state_lock:
+            state = dict(self._loaded_log_states().get(path) or {})
         same_file = (
-            state
-            and state.get("inode") == stat.st_ino
-            and state.get("offset", 0) <= stat.st_size
-        )
-        start = (
-            int(state.get("offset", 0))
-            if same_file
-            else max(0, stat.st_size - tail_bytes)
+            state.get("inode") == stat.st_ino
+            and int(state.get("offset", 0)) <= stat.st_size
         )
-        counts = dict(state.get("counts", empty)) if same_file else dict(empty)
-        last_event_at = state.get("last_event_at") if same_file else None
-        last_seen = dict(state.get("last_seen", {})) if same_file else {}
+        if same_file:
+            start = int(state.get("offset", 0))
+        elif state:
+            start = 0
+        else:
+            start = max(0, stat.st_size - tail_bytes)
+        now = self.clock()
+        buckets = {
+            name: [
+                [float(bucket), int(count)]
+                for bucket, count in (state.get("buckets") or {}).get(name, [])
+                if now - float(bucket) < max(LOG_WINDOWS.values())
+            ]
+            for name in LOG_PATTERNS
+        }
+        last_event_at = state.get("last_event_at")
+        last_seen = dict(state.get("last_seen") or {})
         try:
-            with open(path, "rb") as handle:
-                handle.seek(start)
-                content = handle.read(tail_bytes).decode("utf-8", errors="replace")
-                offset = handle.tell()
+            offset = self._scan_log(path, start, buckets, last_seen, now)
         except OSError as exc:
             return {
-                **counts,
+                **self._window_counts(buckets, now, 3600),
                 "available": False,
                 "path": path,
                 "error": _safe_error(exc),
             }
 
-        for name, pattern in LOG_PATTERNS.items():
-            found = len(pattern.findall(content))
-            if found:
-                counts[name] = counts.get(name, 0) + found
-                last_event_at = self.clock()
-                last_seen[name] = last_event_at
-        self._log_states[path] = {
-            "inode": stat.st_ino,
-            "offset": offset,
-            "counts": counts,
-            "last_event_at": last_event_at,
-            "last_seen": last_seen,
-        }
+        if last_seen:
+            last_event_at = max(last_seen.values())
+        with self._log_state_lock:
+            self._loaded_log_states()[path] = {
+                "inode": stat.st_ino,
+                "offset": offset,
+                "buckets": buckets,
+                "last_event_at": last_event_at,
+                "last_seen": last_seen,
+            }
+            self._save_log_states()
         return {
-            **counts,
+            **self._window_counts(buckets, now, 3600),
             "available": True,
             "path": path,
             "last_event_at": last_event_at,
             "last_seen": last_seen,
+            "windows": {
+                label: self._window_counts(buckets, now, seconds)
+                for label, seconds in LOG_WINDOWS.items()
+            },
+            "scanned_bytes": offset - start,
             "scanned_through": offset,
         }
 
+    @staticmethod
+    def _scan_log(path, start, buckets, last_seen, now):
+        """Count signal matches in whole lines from ``start``; return the new cursor."""
+        bucket = now - now % LOG_BUCKET_SECONDS
+        offset = start
+        carry = b""
+        with open(path, "rb") as handle:
+            handle.seek(start)
+            while offset - start < LOG_SCAN_LIMIT_BYTES:
+                chunk = handle.read(LOG_READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                offset += len(chunk)
+                data = carry + chunk
+                cut = data.rfind(b"\n") + 1
+                if not cut and len(data) > LOG_READ_CHUNK_BYTES:
+                    cut = len(data)
+                content, carry = data[:cut], data[cut:]
+                text = content.decode("utf-8", errors="replace")
+                for name, pattern in LOG_PATTERNS.items():
+                    found = len(pattern.findall(text))
+                    if not found:
+                        continue
+                    series = buckets[name]
+                    if series and series[-1][0] == bucket:
+                        series[-1][1] += found
+                    else:
+                        series.append([bucket, found])
+                    last_seen[name] = now
+        return offset - len(carry)
+
+    @staticmethod
+    def _window_counts(buckets, now, seconds):
+        return {
+            name: sum(count for bucket, count in series if now - bucket < seconds)
+            for name, series in buckets.items()
+        }
+
+    def _loaded_log_states(self):
+        if self._log_states is None:
+            self._log_states = {}
+            if self.log_state_path:
+                try:
+                    with open(self.log_state_path, "r", encoding="utf-8") as handle:
+                        payload = json.load(handle)
+                    if isinstance(payload, dict):
+                        self._log_states = {
+                            str(path): state
+                            for path, state in payload.items()
+                            if isinstance(state, dict)
+                        }
+                except (OSError, ValueError):
+                    pass
+        return self._log_states
+
+    def _save_log_states(self):
+        if not self.log_state_path:
+            return
+        temporary_path = f"{self.log_state_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.log_state_path), exist_ok=True)
+            with open(temporary_path, "w", encoding="utf-8") as handle:
+                json.dump(self._log_states, handle, separators=(",", ":"))
+            os.replace(temporary_path, self.log_state_path)
+        except OSError as error:
+            if self.logger:
+                self.logger.debug(
+                    "Database health log cursors could not be saved: %s",
+                    _safe_error(error),
+                )
+
     @staticmethod
     def _score(result):
         score = 0
@@ -134,11 +134,11 @@ def get_optional_current_user(
 
     Use this for endpoints that should work with or without authentication enabled.
     """
-    from utils.auth_config import AuthConfigManager
+    from utils.auth_config import AUTH_STATE
     from utils.auth import decode_token
     from fastapi import HTTPException
 
-    auth_config = AuthConfigManager()
+    auth_config = AUTH_STATE.manager()
 
     # If auth is not enabled, allow all requests
     if not auth_config.is_auth_enabled():
@@ -153,6 +153,10 @@ def get_optional_current_user(
         )
 
     token = credentials.credentials
+    principal = AUTH_STATE.cached_principal(token)
+    if principal is not None:
+        return principal
+
     payload = decode_token(token)
 
     if not payload or payload.type != "access":
@@ -169,6 +173,7 @@ def get_optional_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    AUTH_STATE.remember_token(token, payload)
     return payload.sub
 
 
@@ -180,10 +185,10 @@ async def get_websocket_current_user(websocket: WebSocket) -> Optional[str]:
     Raises WebSocketException if auth is enabled but token is invalid.
     Starlette/FastAPI will send the close frame for the websocket exception.
     """
-    from utils.auth_config import AuthConfigManager
+    from utils.auth_config import AUTH_STATE
     from utils.auth import decode_token
 
-    auth_config = AuthConfigManager()
+    auth_config = AUTH_STATE.manager()
 
     # If auth is not enabled, allow all websocket connections
     if not auth_config.is_auth_enabled():
@@ -196,6 +201,10 @@ async def get_websocket_current_user(websocket: WebSocket) -> Optional[str]:
             code=status.WS_1008_POLICY_VIOLATION, reason="Authentication required"
         )
 
+    principal = AUTH_STATE.cached_principal(token)
+    if principal is not None:
+        return principal
+
     payload = decode_token(token)
 
     if not payload or payload.type != "access":
@@ -209,4 +218,5 @@ async def get_websocket_current_user(websocket: WebSocket) -> Optional[str]:
             reason="User account or identity provider is no longer authorized",
         )
 
+    AUTH_STATE.remember_token(token, payload)
     return payload.sub
@@ -1,7 +1,14 @@
 from utils.global_logger import logger
 from utils.config_loader import CONFIG_MANAGER
-from utils.install_cache import INSTALL_CACHE
-import requests, time, os, zipfile, io, shutil, platform, re, tarfile, tempfile, stat, hashlib
+from utils.install_cache import CHUNK_SIZE, INSTALL_CACHE
+from utils.ranged_download import (
+    DigestMismatch,
+    DownloadTooLarge,
+    SegmentedDownload,
+    download_settings,
+    probe_range,
+)
+import requests, time, os, zipfile, shutil, platform, re, tarfile, tempfile, stat, hashlib
 import fnmatch
 from pathlib import Path
 from urllib.parse import quote
@@ -57,12 +64,18 @@ class Downloader:
             return True
         return False
 
-    def fetch_with_retries(self, url, headers, max_retries=5, accepted_statuses=(200,)):
+    def fetch_with_retries(
+        self, url, headers, max_retries=5, accepted_statuses=(200,), stream=False
+    ):
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, headers=headers, timeout=(15, 300))
+                response = requests.get(
+                    url, headers=headers, timeout=(15, 300), stream=stream
+                )
                 if response.status_code in accepted_statuses:
                     return response
+                if stream:
+                    response.close()
                 if response.status_code in [403, 429]:
                     if not self.handle_rate_limits(response):
                         break
@@ -903,16 +916,20 @@ class Downloader:
                             raise ValueError(
                                 f"Could not open nested tar: {member_name}"
                             )
-                        nested_tar_data = file_obj.read()
                         self.logger.debug(
-                            f"Nested TAR {member_name} size: {len(nested_tar_data)} bytes"
-                        )
-                        self._extract_tarfile(
-                            io.BytesIO(nested_tar_data),
-                            target_dir,
-                            zip_folder_name,
-                            exclude_dirs,
+                            f"Nested TAR {member_name} size: {member.size} bytes"
                         )
+                        with tempfile.SpooledTemporaryFile(
+                            max_size=CHUNK_SIZE
+                        ) as nested_tar:
+                            shutil.copyfileobj(file_obj, nested_tar, CHUNK_SIZE)
+                            nested_tar.seek(0)
+                            self._extract_tarfile(
+                                nested_tar,
+                                target_dir,
+                                zip_folder_name,
+                                exclude_dirs,
+                            )
                         continue
 
                     with open(fpath, "wb") as dst:
@@ -934,63 +951,113 @@ class Downloader:
         staging_validator=None,
     ):
         staging_dir = None
+        download_path = None
         try:
             self.logger.debug(f"Downloading from {url}")
             headers = dict(headers or self.get_headers())
-            cached_content, cached_metadata = INSTALL_CACHE.lookup_download(url)
+            expected_digest = str(expected_sha256 or "").strip().lower()
+            if expected_digest.startswith("sha256:"):
+                expected_digest = expected_digest.removeprefix("sha256:")
+            if expected_digest and not re.fullmatch(r"[0-9a-f]{64}", expected_digest):
+                return False, "Expected SHA-256 digest is invalid."
+            cached_path, cached_metadata = INSTALL_CACHE.lookup_download_path(url)
+            range_headers = dict(headers)
             if cached_metadata.get("etag"):
                 headers["If-None-Match"] = cached_metadata["etag"]
             if cached_metadata.get("last_modified"):
                 headers["If-Modified-Since"] = cached_metadata["last_modified"]
+            connections, segment_bytes = download_settings()
+            headers["Range"] = probe_range(segment_bytes)
             response = self.fetch_with_retries(
-                url, headers, accepted_statuses=(200, 304)
+                url, headers, accepted_statuses=(200, 206, 304), stream=True
             )
             limits = self._archive_limits()
 
-            cached_fallback = response is None and cached_content is not None
+            cached_fallback = response is None and cached_path is not None
             if response is None and not cached_fallback:
                 return False, "Failed to download."
-            if response is not None and response.status_code not in (200, 304):
+            if response is not None and response.status_code not in (200, 206, 304):
                 return False, "Failed to download."
 
+            resolved_target = os.path.realpath(os.path.abspath(target_dir))
+            target_parent = os.path.dirname(resolved_target)
+            os.makedirs(target_parent, exist_ok=True)
+
             if cached_fallback:
                 self.logger.warning(
                     "Download revalidation failed; using the last digest-verified cache entry for %s.",
                     url,
                 )
-                content = cached_content
+                archive_path = str(cached_path)
+                digest = cached_metadata["sha256"]
             elif response.status_code == 304:
-                if cached_content is None:
+                response.close()
+                if cached_path is None:
                     return (
                         False,
                         "Download cache revalidation returned no cached object.",
                     )
-                content = cached_content
+                archive_path = str(cached_path)
+                digest = cached_metadata["sha256"]
             else:
-                content_length = response.headers.get("Content-Length")
-                if content_length:
-                    try:
-                        if int(content_length) > limits["download_bytes"]:
-                            return False, "Download exceeds the configured size limit."
-                    except (TypeError, ValueError):
-                        pass
-                content = response.content
-            size = len(content)
-            if size > limits["download_bytes"]:
-                return False, "Download exceeds the configured size limit."
-            expected_digest = str(expected_sha256 or "").strip().lower()
-            if expected_digest.startswith("sha256:"):
-                expected_digest = expected_digest.removeprefix("sha256:")
-            if expected_digest:
-                if not re.fullmatch(r"[0-9a-f]{64}", expected_digest):
-                    return False, "Expected SHA-256 digest is invalid."
-                actual_digest = hashlib.sha256(content).hexdigest()
-                if actual_digest != expected_digest:
+
+                def open_range(start, end, validator):
+                    request_headers = dict(range_headers, Range=f"bytes={start}-{end}")
+                    if validator:
+                        request_headers["If-Range"] = validator
+                    return self.fetch_with_retries(
+                        url,
+                        request_headers,
+                        max_retries=1,
+                        accepted_statuses=(200, 206),
+                        stream=True,
+                    )
+
+                url_key = hashlib.sha256(url.encode("utf-8", errors="ignore"))
+                part_path = os.path.join(
+                    target_parent,
+                    f".{os.path.basename(resolved_target)}.dumb-download-"
+                    f"{url_key.hexdigest()[:16]}.part",
+                )
+                transfer = SegmentedDownload(
+                    open_range,
+                    part_path,
+                    identity=url,
+                    expected_sha256=expected_digest or None,
+                    max_bytes=limits["download_bytes"],
+                    connections=connections,
+                    segment_bytes=segment_bytes,
+                )
+                try:
+                    digest = transfer.run(response)
+                except DownloadTooLarge:
+                    return False, "Download exceeds the configured size limit."
+                except DigestMismatch as error:
+                    if not expected_digest:
+                        return False, str(error)
                     INSTALL_CACHE.invalidate_download(url, "digest-mismatch")
                     return (
                         False,
                         "Downloaded archive failed its published SHA-256 verification.",
                     )
+                if transfer.resumed_bytes:
+                    self.logger.info(
+                        "Resumed download of %s from %s of %s bytes.",
+                        url,
+                        transfer.resumed_bytes,
+                        transfer.size,
+                    )
+                download_path = part_path
+                archive_path = download_path
+            size = os.path.getsize(archive_path)
+            if size > limits["download_bytes"]:
+                return False, "Download exceeds the configured size limit."
+            if expected_digest and digest != expected_digest:
+                INSTALL_CACHE.invalidate_download(url, "digest-mismatch")
+                return (
+                    False,
+                    "Downloaded archive failed its published SHA-256 verification.",
+                )
             self.logger.debug(
                 f"{zip_folder_name} download successful. Content size: {size} bytes"
             )
@@ -1012,9 +1079,10 @@ class Downloader:
                 ctype = str(cached_metadata.get("content_type") or "").lower()
 
             if response is not None and response.status_code == 200:
-                INSTALL_CACHE.store_download(
+                INSTALL_CACHE.store_download_file(
                     url,
-                    content,
+                    download_path,
+                    digest,
                     etag=response_headers.get("ETag"),
                     last_modified=response_headers.get("Last-Modified"),
                     filename=filename,
@@ -1045,13 +1113,9 @@ class Downloader:
                     )
                 )
 
-            archive_data = io.BytesIO(content)
             normalized_excludes = self._normalized_archive_excludes(
                 target_dir, exclude_dirs
             )
-            resolved_target = os.path.realpath(os.path.abspath(target_dir))
-            target_parent = os.path.dirname(resolved_target)
-            os.makedirs(target_parent, exist_ok=True)
             staging_dir = tempfile.mkdtemp(
                 prefix=f".{os.path.basename(resolved_target)}.dumb-extract-",
                 dir=target_parent,
@@ -1059,7 +1123,7 @@ class Downloader:
 
             if looks_like_zip():
                 try:
-                    with zipfile.ZipFile(io.BytesIO(content)) as z:
+                    with zipfile.ZipFile(archive_path) as z:
                         entries = z.infolist()
                         if len(entries) > limits["entries"]:
                             raise ValueError("Archive contains too many entries.")
@@ -1163,12 +1227,13 @@ class Downloader:
             if looks_like_tar():
                 try:
                     self.logger.debug("Attempting TAR extraction...")
-                    self._extract_tarfile(
-                        archive_data,
-                        staging_dir,
-                        zip_folder_name,
-                        normalized_excludes,
-                    )
+                    with open(archive_path, "rb") as archive_data:
+                        self._extract_tarfile(
+                            archive_data,
+                            staging_dir,
+                            zip_folder_name,
+                            normalized_excludes,
+                        )
                     if staging_validator is not None:
                         valid, validation_error = staging_validator(staging_dir)
                         if not valid:
@@ -1195,8 +1260,8 @@ class Downloader:
             temporary_out = os.path.join(
                 target_dir, f".{os.path.basename(out_path)}.{os.getpid()}.part"
             )
-            with open(temporary_out, "wb") as f:
-                f.write(content)
+            with open(archive_path, "rb") as src, open(temporary_out, "wb") as f:
+                shutil.copyfileobj(src, f, CHUNK_SIZE)
                 f.flush()
                 os.fsync(f.fileno())
             os.replace(temporary_out, out_path)
@@ -1209,6 +1274,11 @@ class Downloader:
         finally:
             if staging_dir:
                 shutil.rmtree(staging_dir, ignore_errors=True)
+            if download_path:
+                try:
+                    os.remove(download_path)
+                except OSError:
+                    pass
 
     def set_permissions(self, file_path, mode):
         try:
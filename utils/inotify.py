@@ -0,0 +1,90 @@
+import ctypes
+import ctypes.util
+import os
+import struct
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+_EVENT_HEADER = struct.Struct("iIII")
+_libc = None
+
+
+def _load_libc():
+    global _libc
+    if _libc is None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        _libc = libc
+    return _libc
+
+
+def _raise_errno(message):
+    error = ctypes.get_errno()
+    raise OSError(error, f"{message}: {os.strerror(error)}")
+
+
+class Inotify:
+    """Minimal non-blocking inotify handle backed by libc.
+
+    Raises ``OSError`` on platforms without inotify; callers are expected to
+    fall back to polling.
+    """
+
+    def __init__(self):
+        try:
+            libc = _load_libc()
+            init = libc.inotify_init1
+        except (AttributeError, OSError) as e:
+            raise OSError(f"inotify is unavailable: {e}") from e
+        self._libc = libc
+        self._fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            _raise_errno("inotify_init1 failed")
+
+    def fileno(self):
+        return self._fd
+
+    def add_watch(self, path, mask):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            _raise_errno(f"inotify_add_watch failed for {path}")
+        return wd
+
+    def rm_watch(self, wd):
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def read_events(self):
+        """Return pending ``(wd, mask, name)`` events without blocking."""
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            if not data:
+                return events
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                events.append((wd, mask, os.fsdecode(name)))
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -217,6 +217,27 @@ def _atomic_json(path: Path, payload: dict) -> None:
     os.replace(temporary, path)
 
 
+def _download_metadata(
+    url: str,
+    digest: str,
+    size: int,
+    etag: str | None,
+    last_modified: str | None,
+    filename: str | None,
+    content_type: str | None,
+) -> dict:
+    return {
+        "url": url,
+        "sha256": digest,
+        "size": size,
+        "etag": etag or "",
+        "last_modified": last_modified or "",
+        "filename": filename or "",
+        "content_type": content_type or "",
+        "stored_at": int(time.time()),
+    }
+
+
 def _directory_size(path: Path) -> tuple[int, int]:
     total = 0
     files = 0
@@ -330,6 +351,70 @@ class InstallCache:
                     message TEXT
                 )
                 """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS verified_objects (
+                    digest TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    verified_at REAL NOT NULL
+                )
+                """)
+
+    def _record_verified(self, digest: str, path: Path) -> None:
+        """Remember the stat identity of an object whose digest was just checked."""
+        try:
+            info = path.stat()
+            with sqlite3.connect(self.telemetry_db, timeout=5) as connection:
+                connection.execute(
+                    """
+                    INSERT OR REPLACE INTO verified_objects (
+                        digest, size, mtime_ns, inode, verified_at
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (digest, info.st_size, info.st_mtime_ns, info.st_ino, time.time()),
+                )
+        except (OSError, sqlite3.Error) as error:
+            logger.debug("Trusted-digest index is unavailable: %s", error)
+
+    def _forget_verified(self, digests: Iterable[str]) -> None:
+        try:
+            with sqlite3.connect(self.telemetry_db, timeout=5) as connection:
+                connection.executemany(
+                    "DELETE FROM verified_objects WHERE digest = ?",
+                    [(digest,) for digest in digests],
+                )
+        except sqlite3.Error as error:
+            logger.debug("Trusted-digest index is unavailable: %s", error)
+
+    def _is_trusted(self, digest: str, info: os.stat_result) -> bool:
+        """Return whether ``digest`` was verified for this exact file identity.
+
+        Entries older than ``object_reverify_hours`` are no longer trusted, so
+        the next hit re-hashes the object; ``0`` disables the shortcut.
+        """
+        try:
+            hours = float(_install_cache_config().get("object_reverify_hours", 168))
+        except (TypeError, ValueError):
+            hours = 168
+        if hours <= 0:
+            return False
+        try:
+            with sqlite3.connect(self.telemetry_db, timeout=5) as connection:
+                row = connection.execute(
+                    """
+                    SELECT size, mtime_ns, inode, verified_at
+                    FROM verified_objects WHERE digest = ?
+                    """,
+                    (digest,),
+                ).fetchone()
+        except sqlite3.Error:
+            return False
+        return (
+            row is not None
+            and tuple(row[:3]) == (info.st_size, info.st_mtime_ns, info.st_ino)
+            and time.time() - row[3] < hours * 3600
+        )
 
     def _object_path(self, digest: str) -> Path:
         return self.objects / digest[:2] / digest
@@ -350,10 +435,16 @@ class InstallCache:
         try:
             if not object_path.is_file() or object_path.is_symlink():
                 return None
-            if sha256_file(object_path) != normalized:
-                self.quarantine_path(object_path, "digest-mismatch")
-                return None
-            os.utime(object_path, None)
+            info = object_path.stat()
+            if not self._is_trusted(normalized, info):
+                if sha256_file(object_path) != normalized:
+                    self._forget_verified([normalized])
+                    self.quarantine_path(object_path, "digest-mismatch")
+                    return None
+                self._record_verified(normalized, object_path)
+            # Touch only the access time: prune orders by it, and keeping
+            # mtime intact keeps the trusted-digest identity valid.
+            os.utime(object_path, ns=(time.time_ns(), info.st_mtime_ns))
             return object_path
         except OSError:
             return None
@@ -377,9 +468,20 @@ class InstallCache:
                     temporary.unlink(missing_ok=True)
                     raise OSError("content cache copy failed digest verification")
                 os.replace(temporary, destination)
+                self._record_verified(normalized, destination)
         return destination
 
     def lookup_download(self, url: str) -> tuple[bytes | None, dict]:
+        object_path, metadata = self.lookup_download_path(url)
+        if object_path is None:
+            return None, metadata
+        try:
+            return object_path.read_bytes(), metadata
+        except OSError:
+            return None, {}
+
+    def lookup_download_path(self, url: str) -> tuple[Path | None, dict]:
+        """Return the verified cached object for ``url`` without reading it."""
         if not install_cache_enabled():
             return None, {}
         self.ensure()
@@ -392,7 +494,7 @@ class InstallCache:
             object_path = self.lookup_content(digest)
             if object_path is None:
                 raise ValueError("cached object is missing")
-            return object_path.read_bytes(), metadata
+            return object_path, metadata
         except (OSError, ValueError, json.JSONDecodeError) as error:
             if index_path.exists():
                 logger.warning("Ignoring invalid download cache entry: %s", error)
@@ -414,16 +516,9 @@ class InstallCache:
         self.ensure()
         digest = hashlib.sha256(content).hexdigest()
         object_path = self._object_path(digest)
-        metadata = {
-            "url": url,
-            "sha256": digest,
-            "size": len(content),
-            "etag": etag or "",
-            "last_modified": last_modified or "",
-            "filename": filename or "",
-            "content_type": content_type or "",
-            "stored_at": int(time.time()),
-        }
+        metadata = _download_metadata(
+            url, digest, len(content), etag, last_modified, filename, content_type
+        )
         with self._lock:
             object_path.parent.mkdir(parents=True, exist_ok=True)
             if not object_path.exists():
@@ -438,6 +533,58 @@ class InstallCache:
                     temporary.unlink(missing_ok=True)
                     raise OSError("download cache write failed integrity verification")
                 os.replace(temporary, object_path)
+                self._record_verified(digest, object_path)
+            _atomic_json(self._index_path(url), metadata)
+        return metadata
+
+    def store_download_file(
+        self,
+        url: str,
+        source_path: str | Path,
+        digest: str,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        filename: str | None = None,
+        content_type: str | None = None,
+    ) -> dict:
+        """Retain a streamed download by digest, re-hashing while copying."""
+        if not install_cache_enabled():
+            return {}
+        self.ensure()
+        source = Path(source_path)
+        normalized = str(digest or "").lower().removeprefix("sha256:")
+        object_path = self._object_path(normalized)
+        metadata = _download_metadata(
+            url,
+            normalized,
+            source.stat().st_size,
+            etag,
+            last_modified,
+            filename,
+            content_type,
+        )
+        with self._lock:
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            if not object_path.exists():
+                temporary = object_path.with_name(
+                    f".{object_path.name}.{uuid.uuid4().hex}.part"
+                )
+                copied = hashlib.sha256()
+                with open(source, "rb") as src, open(temporary, "wb") as dst:
+                    while True:
+                        chunk = src.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        copied.update(chunk)
+                        dst.write(chunk)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                if copied.hexdigest() != normalized:
+                    temporary.unlink(missing_ok=True)
+                    raise OSError("download cache write failed integrity verification")
+                os.replace(temporary, object_path)
+                self._record_verified(normalized, object_path)
             _atomic_json(self._index_path(url), metadata)
         return metadata
 
@@ -1073,10 +1220,12 @@ class InstallCache:
         }
 
     def verify(self) -> dict:
+        """Re-hash every cached object and rebuild the trusted-digest index."""
         self.ensure()
         checked = 0
         quarantined = 0
         errors = []
+        verified = set()
         for prefix in list(self.objects.iterdir()) if self.objects.exists() else []:
             if not prefix.is_dir() or prefix.is_symlink():
                 continue
@@ -1090,10 +1239,21 @@ class InstallCache:
                         or sha256_file(candidate) != candidate.name
                     ):
                         raise ValueError("digest mismatch")
+                    self._record_verified(candidate.name, candidate)
+                    verified.add(candidate.name)
                 except (OSError, ValueError) as error:
                     if self.quarantine_path(candidate, "verify-failed"):
                         quarantined += 1
                     errors.append({"entry": candidate.name, "error": str(error)})
+        try:
+            with sqlite3.connect(self.telemetry_db, timeout=5) as connection:
+                indexed = {
+                    row[0]
+                    for row in connection.execute("SELECT digest FROM verified_objects")
+                }
+        except sqlite3.Error:
+            indexed = set()
+        self._forget_verified(indexed - verified)
         return {"checked": checked, "quarantined": quarantined, "errors": errors[:50]}
 
     def clear_artifacts(self, service_key: str | None = None) -> dict:
@@ -0,0 +1,297 @@
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+INDEX_VERSION = 1
+DEFAULT_STRIDE = 1000
+_READ_BLOCK_BYTES = 1024 * 1024
+_LEVEL_SCAN_CHARS = 160
+_LEVEL_PATTERN = re.compile(
+    rb"(?<![A-Za-z])(TRACE|DEBUG|INFO|WARNING|WARN|ERROR|ERR|CRITICAL|FATAL)(?![A-Za-z])"
+)
+_LEVEL_ALIASES = {b"WARN": "WARNING", b"ERR": "ERROR", b"FATAL": "CRITICAL"}
+_BANNER_INFO_PATTERN = re.compile(rb"^.* - INFO - ")
+_BANNER_ART_PATTERN = re.compile(rb"^\s*DDDDDDDDDDDDD")
+# Every sidecar written by ``LogLineIndex._save`` starts with this header, so
+# only our own files are ever pruned from a service's log directory.
+_SIDECAR_HEADER_PATTERN = re.compile(rb'^\{"version":\d+,"stride":\d+,"file_id":')
+MAX_CACHED_INDEXES = 32
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_log_index(log_path, stride=DEFAULT_STRIDE):
+    """Return the shared, refreshed index for ``log_path``.
+
+    At most ``MAX_CACHED_INDEXES`` indexes are kept, least recently used
+    first out. Each new index also prunes orphaned sidecars in its directory.
+    """
+    path = os.path.abspath(str(log_path))
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            for cached_path in [p for p in _indexes if not os.path.exists(p)]:
+                del _indexes[cached_path]
+            prune_orphan_sidecars(os.path.dirname(path))
+            index = _indexes[path] = LogLineIndex(path, stride=stride)
+            while len(_indexes) > MAX_CACHED_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(path)
+    return index.refresh()
+
+
+def sidecar_path(log_path):
+    directory, name = os.path.split(str(log_path))
+    return os.path.join(directory, f".{name}.idx")
+
+
+def _is_index_sidecar(path):
+    try:
+        with open(path, "rb") as f:
+            header = f.read(64)
+    except OSError:
+        return False
+    return _SIDECAR_HEADER_PATTERN.match(header) is not None
+
+
+def prune_orphan_sidecars(directory):
+    """Remove index sidecars whose log file no longer exists.
+
+    Only ``.<name>.idx`` files carrying the index header are removed; other
+    dotfiles with that name shape are left alone.
+    """
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    removed = []
+    for name in names:
+        if not (name.startswith(".") and name.endswith(".idx")):
+            continue
+        if os.path.exists(os.path.join(directory, name[1:-4])):
+            continue
+        path = os.path.join(directory, name)
+        if not _is_index_sidecar(path):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        removed.append(name)
+    return removed
+
+
+def line_level(line):
+    """Return the normalized level named near the start of ``line``."""
+    match = _LEVEL_PATTERN.search(line[:_LEVEL_SCAN_CHARS])
+    if not match:
+        return None
+    token = match.group(1)
+    return _LEVEL_ALIASES.get(token) or token.decode("ascii")
+
+
+class LogLineIndex:
+    """Sidecar line-offset index for one log file.
+
+    Records the byte offset of every ``stride``-th line, per-block level
+    counts and DUMB startup-banner offsets. ``refresh`` only scans bytes
+    appended since the last call and rebuilds when the file is rotated or
+    truncated. The index is persisted next to the log as ``.<name>.idx``
+    when the directory is writable and kept in memory otherwise.
+    """
+
+    def __init__(self, log_path, stride=DEFAULT_STRIDE, index_path=None):
+        self.log_path = str(log_path)
+        self.index_path = index_path or sidecar_path(self.log_path)
+        self.stride = max(1, int(stride))
+        self._lock = threading.RLock()
+        self._reset(None)
+        self._load()
+
+    def _reset(self, file_id):
+        self.file_id = file_id
+        self.size = 0
+        self.line_count = 0
+        self.checkpoints = []
+        self.block_levels = []
+        self.level_counts = {}
+        self.banners = []
+        # (offset, starts an INFO line) for the two lines before the next one,
+        # so a banner split across refreshes is still detected.
+        self._recent = []
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION or data.get("stride") != self.stride:
+            return
+        try:
+            self.file_id = data["file_id"]
+            self.size = int(data["size"])
+            self.line_count = int(data["line_count"])
+            self.checkpoints = [int(offset) for offset in data["checkpoints"]]
+            self.block_levels = [dict(levels) for levels in data["block_levels"]]
+            self.level_counts = dict(data["level_counts"])
+            self.banners = [
+                [int(line), int(offset)] for line, offset in data["banners"]
+            ]
+            self._recent = [
+                [int(offset), bool(info)] for offset, info in data["recent"]
+            ]
+        except (KeyError, TypeError, ValueError):
+            self._reset(None)
+
+    def _save(self):
+        data = {
+            "version": INDEX_VERSION,
+            "stride": self.stride,
+            "file_id": self.file_id,
+            "size": self.size,
+            "line_count": self.line_count,
+            "checkpoints": self.checkpoints,
+            "block_levels": self.block_levels,
+            "level_counts": self.level_counts,
+            "banners": self.banners,
+            "recent": self._recent,
+        }
+        tmp_path = f"{self.index_path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def refresh(self):
+        """Index complete lines appended since the last refresh."""
+        with self._lock:
+            try:
+                f = open(self.log_path, "rb")
+            except OSError:
+                self._reset(None)
+                return self
+            with f:
+                stat = os.fstat(f.fileno())
+                file_id = f"{stat.st_dev:x}:{stat.st_ino:x}"
+                if file_id != self.file_id or stat.st_size < self.size:
+                    self._reset(file_id)
+                if stat.st_size > self.size and self._scan(f, stat.st_size):
+                    self._save()
+        return self
+
+    def _scan(self, f, size):
+        f.seek(self.size)
+        offset = self.size
+        pending = b""
+        changed = False
+        while offset + len(pending) < size:
+            block = f.read(min(_READ_BLOCK_BYTES, size - offset - len(pending)))
+            if not block:
+                break
+            data = pending + block
+            start = 0
+            while True:
+                newline = data.find(b"\n", start)
+                if newline < 0:
+                    break
+                self._add_line(data[start : newline + 1], offset + start)
+                start = newline + 1
+                changed = True
+            offset += start
+            pending = data[start:]
+        self.size = offset
+        return changed
+
+    def _add_line(self, line, offset):
+        line_number = self.line_count
+        if line_number % self.stride == 0:
+            self.checkpoints.append(offset)
+            self.block_levels.append({})
+        level = line_level(line)
+        if level:
+            self.level_counts[level] = self.level_counts.get(level, 0) + 1
+            block = self.block_levels[-1]
+            block[level] = block.get(level, 0) + 1
+        if (
+            len(self._recent) == 2
+            and self._recent[0][1]
+            and _BANNER_ART_PATTERN.match(line)
+        ):
+            self.banners.append([line_number - 2, self._recent[0][0]])
+        self._recent = (
+            self._recent + [[offset, _BANNER_INFO_PATTERN.match(line) is not None]]
+        )[-2:]
+        self.line_count = line_number + 1
+
+    def latest_banner(self):
+        """Return ``(line_number, offset)`` of the latest startup banner."""
+        with self._lock:
+            return tuple(self.banners[-1]) if self.banners else None
+
+    def summary(self):
+        with self._lock:
+            return {
+                "size": self.size,
+                "line_count": self.line_count,
+                "level_counts": dict(self.level_counts),
+                "banners": [line for line, _offset in self.banners],
+                "file_id": self.file_id,
+            }
+
+    def read_lines(self, start_line=0, count=500, level=None):
+        """Return up to ``count`` ``(line_number, text)`` pairs.
+
+        With ``level`` only matching lines are returned and blocks whose
+        level counts show no match are skipped without being read.
+        """
+        with self._lock:
+            start_line = max(0, int(start_line))
+            end_line = self.line_count
+            checkpoints = list(self.checkpoints)
+            block_levels = list(self.block_levels)
+            file_id = self.file_id
+        results = []
+        if count <= 0 or start_line >= end_line:
+            return results
+        block = start_line // self.stride
+        try:
+            f = open(self.log_path, "rb")
+        except OSError:
+            return results
+        with f:
+            stat = os.fstat(f.fileno())
+            if f"{stat.st_dev:x}:{stat.st_ino:x}" != file_id:
+                return results
+            while block < len(checkpoints) and len(results) < count:
+                if level and not block_levels[block].get(level):
+                    block += 1
+                    continue
+                f.seek(checkpoints[block])
+                line_number = block * self.stride
+                block_end = min(line_number + self.stride, end_line)
+                while line_number < block_end and len(results) < count:
+                    line = f.readline()
+                    if not line:
+                        return results
+                    if line_number >= start_line and (
+                        not level or line_level(line) == level
+                    ):
+                        results.append(
+                            (
+                                line_number,
+                                line.decode("utf-8", "replace").rstrip("\r\n"),
+                            )
+                        )
+                    line_number += 1
+                block += 1
+        return results
@@ -1,5 +1,5 @@
 from utils.config_loader import CONFIG_MANAGER
-import asyncio, os, re, sys, tempfile, threading, time, logging
+import asyncio, functools, os, re, sys, tempfile, threading, time, logging
 from logging.handlers import BaseRotatingHandler
 from colorlog import ColoredFormatter
 
@@ -147,6 +147,115 @@ def _ensure_sensitive_filter(handler):
         handler.addFilter(SensitiveDataFilter())
 
 
+_SUBPROCESS_LOG_LEVELS = ("DEBUG", "INFO", "NOTICE", "WARNING", "ERROR", "CRITICAL")
+_SUBPROCESS_ALT_LOG_LEVELS = (
+    "DEBUG",
+    "INFO",
+    "NOTICE",
+    "WARN",
+    "ERROR",
+    "FATAL",
+    "LOG",
+)
+_SUBPROCESS_LEVEL_PATTERN = re.compile(
+    r"({})\s*(.*)".format("|".join(_SUBPROCESS_LOG_LEVELS))
+)
+_SUBPROCESS_ALT_LEVEL_PATTERN = re.compile(
+    r"({})\s*(.*)".format("|".join(_SUBPROCESS_ALT_LOG_LEVELS))
+)
+_SUBPROCESS_LEVEL_ALIASES = {"WARN": "WARNING", "LOG": "INFO", "FATAL": "CRITICAL"}
+_SHORT_DATE_TIME_PREFIX = re.compile(r"^\d{2}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} ")
+_LONG_DATE_TIME_PREFIX = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} - ")
+_ZILEAN_TIME_PREFIX = re.compile(r"^\[\d{2}:\d{2}:\d{2}\] \| ")
+_ZILEAN_RELEVANT_PART = re.compile(r"\| (Zilean\..*)")
+
+
+def _search_level(pattern, levels, line):
+    # Every match contains one of the level names, so a plain substring
+    # check rejects most lines before any regex work.
+    for level in levels:
+        if level in line:
+            return pattern.search(line)
+    return None
+
+
+def _parse_zurg_line(line, process_name):
+    match = _search_level(
+        _SUBPROCESS_ALT_LEVEL_PATTERN, _SUBPROCESS_ALT_LOG_LEVELS, line
+    )
+    if not match:
+        return None, line
+    message_parts = match.group(2).strip().split()
+    if len(message_parts) > 0:
+        first_word = message_parts[1].strip()
+        rest_of_message = " ".join(message_parts[2:]).strip()
+        if rest_of_message:
+            return match.group(1), f"| {first_word} | {rest_of_message}"
+        return match.group(1), f"| {first_word} |"
+    return match.group(1), line
+
+
+def _parse_postgresql_line(line, process_name):
+    match = _search_level(
+        _SUBPROCESS_ALT_LEVEL_PATTERN, _SUBPROCESS_ALT_LOG_LEVELS, line
+    )
+    if not match:
+        return None, line
+    message = match.group(2).strip()
+    if message.startswith(":"):
+        message = message.lstrip(":").strip()
+    return match.group(1), message
+
+
+def _parse_zilean_line(line, process_name):
+    match = _search_level(
+        _SUBPROCESS_ALT_LEVEL_PATTERN, _SUBPROCESS_ALT_LOG_LEVELS, line
+    )
+    if not match:
+        return None, line
+    message = _ZILEAN_TIME_PREFIX.sub("", match.group(2).strip())
+    relevant = _ZILEAN_RELEVANT_PART.search(message)
+    if relevant:
+        message = relevant.group(1).strip()
+    return match.group(1), message
+
+
+def _parse_cli_debrid_line(line, process_name):
+    return "INFO", _LONG_DATE_TIME_PREFIX.sub("", line).strip()
+
+
+def _parse_default_line(line, process_name):
+    match = _search_level(_SUBPROCESS_LEVEL_PATTERN, _SUBPROCESS_LOG_LEVELS, line)
+    if match:
+        log_level = match.group(1)
+        message = match.group(2).strip()
+        if process_name == "rclone" and message.startswith(": "):
+            message = message[2:]
+            if message.startswith(":"):
+                message = message.lstrip(":").strip()
+    else:
+        log_level = "UNKNOWN"
+        message = line
+    return log_level, _SHORT_DATE_TIME_PREFIX.sub("", message).strip()
+
+
+# Parsers for services whose output does not follow the default
+# "<LEVEL> message" layout. Zurg is matched by substring so every Zurg
+# instance name shares its parser; the rest are exact process names.
+_SUBPROCESS_LOG_PARSERS = {
+    "PostgreSQL": _parse_postgresql_line,
+    "Zilean": _parse_zilean_line,
+    "CLI Debrid": _parse_cli_debrid_line,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _subprocess_log_parser(process_name):
+    if "Zurg" in process_name:
+        return _parse_zurg_line
+    return _SUBPROCESS_LOG_PARSERS.get(process_name, _parse_default_line)
+
+
 class SubprocessLogger:
     def __init__(
         self, logger, key_type, file_logger=None, access_logger=None, log_to_main=True
@@ -195,97 +304,8 @@ class SubprocessLogger:
 
     @staticmethod
     def parse_log_level_and_message(line, process_name):
-        log_levels = {"DEBUG", "INFO", "NOTICE", "WARNING", "ERROR", "CRITICAL"}
-        alt_log_levels = {"DEBUG", "INFO", "NOTICE", "WARN", "ERROR", "FATAL", "LOG"}
-
-        log_level = None
-        message = None
-
-        if "Zurg" in process_name:
-            log_level_pattern = re.compile(
-                r"({})\s*(.*)".format("|".join(alt_log_levels))
-            )
-            match = log_level_pattern.search(line)
-            if match:
-                log_level = match.group(1)
-                message = match.group(2).strip()
-                message_parts = message.split()
-                if len(message_parts) > 0:
-                    first_word = message_parts[1].strip()
-                    rest_of_message = " ".join(message_parts[2:]).strip()
-                    if rest_of_message:
-                        message = f"| {first_word} | {rest_of_message}"
-                    else:
-                        message = f"| {first_word} |"
-                else:
-                    message = line
-            else:
-                message = line
-
-        elif process_name == "PostgreSQL":
-            log_level_pattern = re.compile(
-                r"({})\s*(.*)".format("|".join(alt_log_levels))
-            )
-            match = log_level_pattern.search(line)
-            if match:
-                log_level = match.group(1)
-                message = match.group(2).strip()
-                if message.startswith(":"):
-                    message = message.lstrip(":").strip()
-            else:
-                message = line
-
-        elif process_name == "Zilean":
-            log_level_pattern = re.compile(
-                r"({})\s*(.*)".format("|".join(alt_log_levels))
-            )
-            match = log_level_pattern.search(line)
-            if match:
-                log_level = match.group(1)
-                message = match.group(2).strip()
-                time_prefix_pattern = re.compile(r"^\[\d{2}:\d{2}:\d{2}\] \| ")
-                message = time_prefix_pattern.sub("", message)
-                relevant_part_pattern = re.compile(r"\| (Zilean\..*)")
-                match = relevant_part_pattern.search(message)
-                if match:
-                    message = match.group(1).strip()
-            else:
-                message = line
-
-        elif process_name == "CLI Debrid":
-            date_time_prefix_pattern = re.compile(
-                r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} - "
-            )
-            message = date_time_prefix_pattern.sub("", line).strip()
-            log_level = "INFO"
-
-        else:
-            log_level_pattern = re.compile(r"({})\s*(.*)".format("|".join(log_levels)))
-            match = log_level_pattern.search(line)
-            if match:
-                log_level = match.group(1)
-                message = match.group(2).strip()
-                if process_name == "rclone" and message.startswith(": "):
-                    message = message[2:]
-                    if message.startswith(":"):
-                        message = message.lstrip(":").strip()
-            else:
-                log_level = "UNKNOWN"
-                message = line
-
-            date_time_prefix_pattern = re.compile(
-                r"^\d{2}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} "
-            )
-            message = date_time_prefix_pattern.sub("", message).strip()
-
-        if log_level == "WARN":
-            log_level = "WARNING"
-        if log_level == "LOG":
-            log_level = "INFO"
-        elif log_level == "FATAL":
-            log_level = "CRITICAL"
-
-        return log_level, message
+        log_level, message = _subprocess_log_parser(process_name)(line, process_name)
+        return _SUBPROCESS_LEVEL_ALIASES.get(log_level, log_level), message
 
     def monitor_stderr(self, process, mount_name, process_name):
         for line in process.stderr:
@@ -1,8 +1,11 @@
 import os
+import socket
+import threading
 import time
 import psutil
+from collections import namedtuple
 
-from utils.database_health import DatabaseHealthCollector
+from utils.database_health import LOG_STATE_PATH, DatabaseHealthCollector
 from utils.plex_status import PlexStatusCollector
 
 DEFAULT_FILESYSTEM_PATHS = ["/"]
@@ -46,6 +49,25 @@ _NETWORK_COUNTER_ATTRIBUTES = {
     "drops_in": "dropin",
     "drops_out": "dropout",
 }
+_PROC_ROOT = "/proc"
+try:
+    _CLOCK_TICKS = os.sysconf("SC_CLK_TCK") or 100
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") or 4096
+except (AttributeError, OSError, ValueError):
+    _CLOCK_TICKS = 100
+    _PAGE_SIZE = 4096
+_TCP_STATUSES = {"01": psutil.CONN_ESTABLISHED, "0A": psutil.CONN_LISTEN}
+_SocketAddress = namedtuple("_SocketAddress", "ip port")
+_SocketConnection = namedtuple("_SocketConnection", "status laddr raddr")
+# Seconds between refreshes of each collector family. System CPU/memory/IO
+# counters are read on every snapshot; the other families are cached and
+# reused until their interval elapses.
+DEFAULT_COLLECTION_INTERVALS = {
+    "system": 0,
+    "connections": 10,
+    "filesystems": 30,
+    "external": 15,
+}
 
 
 class MetricsCollector:
@@ -56,8 +78,16 @@ class MetricsCollector:
         self.container_start_time = self._get_container_start_time()
         self._cgroup_last_cpu_usage = None
         self._cgroup_last_cpu_time = None
+        self._collection_lock = threading.Lock()
+        self._collection_intervals = dict(DEFAULT_COLLECTION_INTERVALS)
+        self._collected_at = {}
+        self._collection_cache = {}
+        self._external_cpu_ticks = {}
+        self._external_scan_time = None
         self.database_health = DatabaseHealthCollector(
-            logger=logger, process_handler=process_handler
+            logger=logger,
+            process_handler=process_handler,
+            log_state_path=LOG_STATE_PATH,
         )
         self.plex_status = PlexStatusCollector(logger=logger)
 
@@ -67,9 +97,24 @@ class MetricsCollector:
         from utils.config_loader import CONFIG_MANAGER
 
         now = time.time()
+        self._begin_collection(
+            CONFIG_MANAGER.get("dumb", {})
+            .get("metrics", {})
+            .get("collection_intervals")
+        )
         managed = self._collect_managed_processes()
         managed_pids = {entry["pid"] for entry in managed if entry.get("pid")}
-        external = self._collect_external_processes(managed_pids, limit=external_limit)
+        external = (
+            self._cached_section(
+                "external",
+                (frozenset(managed_pids), external_limit),
+                lambda: self._collect_external_processes(
+                    managed_pids, limit=external_limit
+                ),
+            )
+            if external_limit and external_limit > 0
+            else []
+        )
         return {
             "timestamp": now,
             "system": self._collect_system_metrics(),
@@ -84,15 +129,55 @@ class MetricsCollector:
                 CONFIG_MANAGER.config,
                 refresh_if_stale=True,
             ),
+            "collection": self._collection_ages(),
         }
 
+    def _begin_collection(self, configured_intervals=None):
+        """Start a snapshot, expiring every collector family that is due."""
+        intervals = _collection_intervals(configured_intervals)
+        now = time.monotonic()
+        with self._collection_lock:
+            self._collection_intervals = intervals
+            for family, interval in intervals.items():
+                collected_at = self._collected_at.get(family)
+                if collected_at is None or now - collected_at >= interval:
+                    self._collected_at[family] = now
+                    self._collection_cache[family] = {}
+
+    def _cached_section(self, family, key, loader):
+        """Return the cached ``family`` value for ``key``, loading it on a miss."""
+        with self._collection_lock:
+            cache = self._collection_cache.setdefault(family, {})
+            if key in cache:
+                return cache[key]
+        value = loader()
+        with self._collection_lock:
+            self._collection_cache.setdefault(family, {})[key] = value
+        return value
+
+    def _collection_ages(self):
+        now = time.monotonic()
+        with self._collection_lock:
+            return {
+                family: {
+                    "interval_sec": interval,
+                    "age_sec": round(
+                        max(0.0, now - self._collected_at.get(family, now)), 3
+                    ),
+                }
+                for family, interval in self._collection_intervals.items()
+            }
+
     def _collect_system_metrics(self):
         from utils.config_loader import CONFIG_MANAGER
 
         metrics_config = CONFIG_MANAGER.get("dumb", {}).get("metrics", {})
         scope = metrics_config.get("system_scope", "host")
-        filesystems = self._collect_filesystem_metrics(
-            metrics_config.get("filesystem_paths")
+        filesystem_paths = metrics_config.get("filesystem_paths")
+        filesystems = self._cached_section(
+            "filesystems",
+            tuple(filesystem_paths) if isinstance(filesystem_paths, list) else None,
+            lambda: self._collect_filesystem_metrics(filesystem_paths),
         )
         net_io, network_interfaces = self._collect_network_metrics(
             metrics_config.get("network_interfaces")
@@ -492,8 +577,10 @@ class MetricsCollector:
             if key or instance_name:
                 config = CONFIG_MANAGER.get_instance(instance_name, key)
                 config_ports = self._collect_config_ports(config)
-                entry["disk_paths"] = self._collect_disk_paths(
-                    config, extra_paths=mount_paths
+                entry["disk_paths"] = self._cached_section(
+                    "filesystems",
+                    ("disk_paths", process_name, key, instance_name),
+                    lambda: self._collect_disk_paths(config, extra_paths=mount_paths),
                 )
                 if config_ports:
                     entry["ports_config"] = config_ports
@@ -501,6 +588,57 @@ class MetricsCollector:
         return managed
 
     def _collect_external_processes(self, managed_pids, limit=20):
+        samples = _scan_proc_stats()
+        if samples is None:
+            return self._collect_external_processes_psutil(managed_pids, limit)
+
+        now = time.monotonic()
+        elapsed = (
+            now - self._external_scan_time
+            if self._external_scan_time is not None
+            else None
+        )
+        previous = self._external_cpu_ticks
+        ranked = []
+        for pid, sample in samples.items():
+            if pid in managed_pids:
+                continue
+            cpu_percent = 0.0
+            baseline = previous.get(pid)
+            if elapsed and baseline and baseline[0] == sample["start_time"]:
+                delta = max(sample["cpu_ticks"] - baseline[1], 0)
+                cpu_percent = delta / _CLOCK_TICKS / elapsed * 100.0
+            ranked.append((cpu_percent, sample["rss"], pid))
+        self._external_cpu_ticks = {
+            pid: (sample["start_time"], sample["cpu_ticks"])
+            for pid, sample in samples.items()
+        }
+        self._external_scan_time = now
+        for pid in list(self._proc_cache):
+            if pid not in samples:
+                self._proc_cache.pop(pid, None)
+
+        ranked.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        external = []
+        for cpu_percent, _rss, pid in ranked[:limit]:
+            sample = samples[pid]
+            metrics = {"name": sample["name"], "pid": pid}
+            proc = self._get_process(pid)
+            if proc:
+                try:
+                    metrics["name"] = proc.name()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+                metrics.update(self._collect_process_metrics(proc))
+            metrics["cpu_percent"] = cpu_percent
+            metrics.setdefault("rss", sample["rss"])
+            metrics.setdefault("vms", sample["vms"])
+            metrics.setdefault("threads", sample["threads"])
+            metrics["container_id"] = self._detect_container_id(pid)
+            external.append(metrics)
+        return external
+
+    def _collect_external_processes_psutil(self, managed_pids, limit=20):
         candidates = []
         for proc in psutil.process_iter(["pid", "name"]):
             if proc.info["pid"] in managed_pids:
@@ -535,28 +673,55 @@ class MetricsCollector:
         except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
             metrics["disk_io"] = None
 
-        detected_ports = self._collect_listen_ports(proc)
+        detected_ports, connections = self._cached_section(
+            "connections", proc.pid, lambda: self._collect_socket_metrics(proc)
+        )
         if detected_ports:
             metrics["ports"] = detected_ports
-        connections = self._collect_process_connections(proc)
         if connections:
             metrics["net_connections"] = connections
         return metrics
 
-    def _collect_listen_ports(self, proc):
+    def _collect_socket_metrics(self, proc):
+        sockets = self._process_sockets(proc)
+        return (
+            self._collect_listen_ports(proc, sockets),
+            self._collect_process_connections(proc, sockets=sockets),
+        )
+
+    def _process_sockets(self, proc):
+        """Return ``proc``'s TCP sockets from the shared per-refresh index.
+
+        The socket table is read once per connections refresh and each
+        process only contributes its fd inode list, instead of every process
+        walking the socket tables through ``net_connections``. Returns
+        ``None`` when procfs is unavailable so callers fall back to psutil.
+        """
+        table = self._cached_section("connections", "socket_table", _read_socket_table)
+        if table is None:
+            return None
+        return [
+            table[inode] for inode in _read_socket_inodes(proc.pid) if inode in table
+        ]
+
+    def _collect_listen_ports(self, proc, sockets=None):
         try:
             ports = set()
-            for conn in proc.net_connections(kind="inet"):
+            if sockets is None:
+                sockets = proc.net_connections(kind="inet")
+            for conn in sockets:
                 if conn.status == psutil.CONN_LISTEN and conn.laddr:
                     ports.add(conn.laddr.port)
             return sorted(ports)
         except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
             return []
 
-    def _collect_process_connections(self, proc, limit=50):
+    def _collect_process_connections(self, proc, limit=50, sockets=None):
         try:
             connections = []
-            for conn in proc.net_connections(kind="inet"):
+            if sockets is None:
+                sockets = proc.net_connections(kind="inet")
+            for conn in sockets:
                 if conn.status != psutil.CONN_ESTABLISHED:
                     continue
                 entry = {
@@ -677,6 +842,131 @@ class MetricsCollector:
             return time.time()
 
 
+def _collection_intervals(configured):
+    intervals = dict(DEFAULT_COLLECTION_INTERVALS)
+    if not isinstance(configured, dict):
+        return intervals
+    for family in intervals:
+        value = configured.get(f"{family}_sec")
+        if value is None or isinstance(value, bool):
+            continue
+        try:
+            intervals[family] = max(0, min(float(value), 3600))
+        except (TypeError, ValueError):
+            continue
+    return intervals
+
+
+def _scan_proc_stats(proc_root=None):
+    """Read ``/proc/<pid>/stat`` for every process in one pass.
+
+    Returns ``{pid: sample}`` or ``None`` when procfs is unavailable, in which
+    case callers fall back to psutil.
+    """
+    proc_root = proc_root or _PROC_ROOT
+    try:
+        entries = os.scandir(proc_root)
+    except OSError:
+        return None
+    samples = {}
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            sample = _read_proc_stat(os.path.join(entry.path, "stat"))
+            if sample is not None:
+                samples[int(entry.name)] = sample
+    return samples
+
+
+def _read_proc_stat(path):
+    try:
+        with open(path, "rb") as f:
+            raw = f.read().decode("utf-8", "replace")
+    except OSError:
+        return None
+    # The command name is wrapped in parentheses and may itself contain
+    # spaces or parentheses, so split on the last closing one.
+    open_paren = raw.find("(")
+    close_paren = raw.rfind(")")
+    if open_paren < 0 or close_paren < open_paren:
+        return None
+    fields = raw[close_paren + 2 :].split()
+    try:
+        return {
+            "name": raw[open_paren + 1 : close_paren],
+            "cpu_ticks": int(fields[11]) + int(fields[12]),
+            "threads": int(fields[17]),
+            "start_time": int(fields[19]),
+            "vms": int(fields[20]),
+            "rss": int(fields[21]) * _PAGE_SIZE,
+        }
+    except (IndexError, ValueError):
+        return None
+
+
+def _read_socket_table(proc_root=None):
+    """Map socket inode to connection for every TCP socket in ``/proc/net``.
+
+    UDP tables are skipped: psutil never reports UDP sockets as LISTEN or
+    ESTABLISHED, which are the only states the collector looks up.
+    """
+    proc_root = proc_root or _PROC_ROOT
+    table = {}
+    found = False
+    for name, family in (("tcp", socket.AF_INET), ("tcp6", socket.AF_INET6)):
+        try:
+            with open(os.path.join(proc_root, "net", name), "r") as f:
+                lines = f.readlines()[1:]
+        except OSError:
+            continue
+        found = True
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 10:
+                continue
+            try:
+                table[int(fields[9])] = _SocketConnection(
+                    _TCP_STATUSES.get(fields[3], fields[3]),
+                    _decode_socket_address(fields[1], family),
+                    _decode_socket_address(fields[2], family),
+                )
+            except (ValueError, OSError):
+                continue
+    return table if found else None
+
+
+def _read_socket_inodes(pid, proc_root=None):
+    fd_dir = os.path.join(proc_root or _PROC_ROOT, str(pid), "fd")
+    try:
+        names = os.listdir(fd_dir)
+    except OSError:
+        return []
+    inodes = []
+    for name in names:
+        try:
+            target = os.readlink(os.path.join(fd_dir, name))
+        except OSError:
+            continue
+        if target.startswith("socket:["):
+            try:
+                inodes.append(int(target[8:-1]))
+            except ValueError:
+                continue
+    return inodes
+
+
+def _decode_socket_address(value, family):
+    ip, port = value.split(":")
+    port = int(port, 16)
+    if not port:
+        return ()
+    raw = bytes.fromhex(ip)
+    # /proc/net stores addresses as host-order 32-bit words.
+    raw = b"".join(raw[index : index + 4][::-1] for index in range(0, len(raw), 4))
+    return _SocketAddress(socket.inet_ntop(family, raw), port)
+
+
 def _addr_to_tuple(addr):
     if not addr:
         return None
@@ -0,0 +1,248 @@
+import asyncio
+import copy
+import json
+
+SNAPSHOT_SECTIONS = (
+    "system",
+    "dumb_managed",
+    "external",
+    "database_health",
+    "plex_status",
+)
+_PROCESS_SECTIONS = ("dumb_managed", "external")
+
+
+def _subscription_names(value, field):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return value.split(",")
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return value
+    raise ValueError(f"Metrics {field} must be a string or a list of strings")
+
+
+def normalize_subscription(sections=None, processes=None):
+    """Return ``(sections, processes)`` for a metrics stream subscription.
+
+    ``sections`` defaults to every snapshot section. ``processes`` limits the
+    managed and external process lists to the named processes; ``None`` keeps
+    every process. Both accept a comma-separated string or a list of strings;
+    anything else raises ``ValueError``.
+    """
+    sections = _subscription_names(sections, "sections")
+    processes = _subscription_names(processes, "processes")
+    normalized_sections = []
+    for section in sections:
+        section = section.strip().lower()
+        if not section:
+            continue
+        if section not in SNAPSHOT_SECTIONS:
+            raise ValueError(f"Unknown metrics section: {section}")
+        if section not in normalized_sections:
+            normalized_sections.append(section)
+    normalized_processes = sorted(
+        {name.strip().lower() for name in processes if name.strip()}
+    )
+    return (
+        tuple(normalized_sections) or SNAPSHOT_SECTIONS,
+        tuple(normalized_processes) or None,
+    )
+
+
+def filter_snapshot(snapshot, sections=SNAPSHOT_SECTIONS, processes=None):
+    """Project a snapshot onto the subscribed sections and process names."""
+    view = {"timestamp": snapshot.get("timestamp")}
+    wanted = set(processes or ())
+    for section in sections:
+        value = snapshot.get(section)
+        if wanted and section in _PROCESS_SECTIONS:
+            value = [
+                process
+                for process in value or []
+                if str(process.get("name") or "").strip().lower() in wanted
+            ]
+        view[section] = value
+    return view
+
+
+def _escape(token):
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_snapshot(previous, current, path=""):
+    """Return JSON-patch style operations turning ``previous`` into ``current``.
+
+    Objects are compared key by key and equal-length lists element by element;
+    lists whose length changed are replaced whole, which keeps patches simple
+    for process lists that grow, shrink or reorder.
+    """
+    if isinstance(previous, dict) and isinstance(current, dict):
+        ops = []
+        for key, value in current.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in previous:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff_snapshot(previous[key], value, child))
+        for key in previous:
+            if key not in current:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        return ops
+    if (
+        isinstance(previous, list)
+        and isinstance(current, list)
+        and len(previous) == len(current)
+    ):
+        ops = []
+        for index, (old, new) in enumerate(zip(previous, current)):
+            ops.extend(diff_snapshot(old, new, f"{path}/{index}"))
+        return ops
+    if type(previous) is type(current) and previous == current:
+        return []
+    return [{"op": "replace", "path": path, "value": current}]
+
+
+def apply_patch(document, ops):
+    """Apply operations produced by :func:`diff_snapshot` to a copy."""
+    document = copy.deepcopy(document)
+    for op in ops:
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        if not tokens:
+            document = copy.deepcopy(op.get("value"))
+            continue
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            last = int(last)
+        if op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op["value"])
+    return document
+
+
+class MetricsDeltaStream:
+    """Per-subscription delta state for the metrics websocket.
+
+    Clients that share a sections/process filter share one view, diff and
+    encoded message. Every group sends a keyframe on its first tick and every
+    ``keyframe_every`` ticks after that, plus to any client that subscribed or
+    asked to resync since the last tick. Other ticks send a ``delta`` against
+    the previous ``seq``.
+    """
+
+    def __init__(self, keyframe_every=30):
+        self.keyframe_every = max(1, int(keyframe_every))
+        self.clients = {}
+        self.groups = {}
+
+    def subscribe(self, websocket, sections=None, processes=None):
+        """Subscribe ``websocket``; return an encoded error frame if rejected.
+
+        A rejected request leaves any existing subscription unchanged.
+        """
+        try:
+            sections, processes = normalize_subscription(sections, processes)
+        except ValueError as error:
+            return json.dumps({"type": "error", "detail": str(error)})
+        self.clients[websocket] = {
+            "sections": sections,
+            "processes": processes,
+            "keyframe": True,
+        }
+        return None
+
+    def handle_message(self, websocket, message):
+        """Apply ``subscribe``/``resync`` requests sent by a delta client.
+
+        Returns an encoded error frame to send back, or None.
+        """
+        try:
+            payload = json.loads(message)
+        except (TypeError, ValueError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        if payload.get("type") == "subscribe":
+            return self.subscribe(
+                websocket, payload.get("sections"), payload.get("processes")
+            )
+        if payload.get("type") == "resync" and websocket in self.clients:
+            self.clients[websocket]["keyframe"] = True
+        return None
+
+    def remove(self, websocket):
+        self.clients.pop(websocket, None)
+
+    async def publish(self, snapshot, manager):
+        """Send ``snapshot`` to every connection of ``manager``.
+
+        Connections without a delta subscription receive the full
+        ``{"type": "snapshot"}`` message, as before.
+        """
+        if not self.clients:
+            self.groups.clear()
+            await manager.broadcast(json.dumps({"type": "snapshot", "data": snapshot}))
+            return
+        sends = []
+        groups = {}
+        legacy = []
+        for connection in list(manager.active_connections):
+            client = self.clients.get(connection)
+            if client is None:
+                legacy.append(connection)
+            else:
+                key = (client["sections"], client["processes"])
+                groups.setdefault(key, []).append(connection)
+        if legacy:
+            message = json.dumps({"type": "snapshot", "data": snapshot})
+            sends.extend(manager.send(connection, message) for connection in legacy)
+        for key in list(self.groups):
+            if key not in groups:
+                del self.groups[key]
+        for key, connections in groups.items():
+            sends.extend(self._group_sends(key, connections, snapshot, manager))
+        await asyncio.gather(*sends)
+
+    def _group_sends(self, key, connections, snapshot, manager):
+        sections, processes = key
+        view = filter_snapshot(snapshot, sections, processes)
+        state = self.groups.get(key)
+        keyframe_all = state is None or state["ticks"] >= self.keyframe_every
+        seq = 1 if state is None else state["seq"] + 1
+        keyframe_message = None
+        delta_message = None
+        if not keyframe_all:
+            delta_message = json.dumps(
+                {
+                    "type": "delta",
+                    "seq": seq,
+                    "base": state["seq"],
+                    "ops": diff_snapshot(state["view"], view),
+                }
+            )
+        sends = []
+        for connection in connections:
+            client = self.clients[connection]
+            if keyframe_all or client["keyframe"]:
+                if keyframe_message is None:
+                    keyframe_message = json.dumps(
+                        {"type": "keyframe", "seq": seq, "data": view}
+                    )
+                client["keyframe"] = False
+                sends.append(manager.send(connection, keyframe_message))
+            else:
+                sends.append(manager.send(connection, delta_message))
+        self.groups[key] = {
+            "view": view,
+            "seq": seq,
+            "ticks": 0 if keyframe_all else state["ticks"] + 1,
+        }
+        return sends
@@ -392,6 +392,28 @@ def read_history_series(
     )
 
 
+def history_bucket_seconds(range_seconds, bucket_seconds=None, max_points=600):
+    auto_bucket = max(5, int(math.ceil(range_seconds / max_points)))
+    if bucket_seconds is None or bucket_seconds <= 0:
+        return auto_bucket
+    return max(bucket_seconds, auto_bucket)
+
+
+def _apply_stats_extrema(stats, extrema):
+    """Replace gauge stats with pre-aggregated minimum/maximum values."""
+    if not stats or not extrema:
+        return stats
+    for key in ("cpu", "mem", "disk", "inode"):
+        if key in extrema:
+            stats[key] = dict(extrema[key])
+    filesystems = stats.get("filesystems") or {}
+    for path, values in (extrema.get("filesystems") or {}).items():
+        if path in filesystems:
+            for key, value in values.items():
+                filesystems[path][key] = dict(value)
+    return stats
+
+
 def prepare_history_series(
     items,
     truncated=False,
@@ -400,6 +422,7 @@ def prepare_history_series(
     default_hours=6,
     bucket_seconds=None,
     max_points=600,
+    extrema=None,
 ):
     range_seconds = None
     if since is not None:
@@ -408,15 +431,13 @@ def prepare_history_series(
         range_seconds = default_hours * 60 * 60
 
     if range_seconds is not None and max_points and max_points > 0:
-        auto_bucket = max(5, int(math.ceil(range_seconds / max_points)))
-        if bucket_seconds is None or bucket_seconds <= 0:
-            bucket_seconds = auto_bucket
-        else:
-            bucket_seconds = max(bucket_seconds, auto_bucket)
+        bucket_seconds = history_bucket_seconds(
+            range_seconds, bucket_seconds, max_points
+        )
     selected = _downsample_history_items(
         items, bucket_seconds=bucket_seconds, max_points=max_points
     )
     compacted = compact_history_items(selected)
     series = build_history_series(compacted)
-    stats = compute_history_stats(items)
+    stats = _apply_stats_extrema(compute_history_stats(items), extrema)
     return compacted, series, truncated, stats, bucket_seconds
@@ -9,7 +9,12 @@ import zlib
 import psycopg2
 from psycopg2 import sql
 
-from utils.metrics_history_reader import _list_history_files, _read_history_file
+from utils.metrics_history_reader import (
+    _list_history_files,
+    _read_history_file,
+    history_bucket_seconds,
+    prepare_history_series,
+)
 
 _IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 _MAINTENANCE_INTERVAL_SECONDS = 300
@@ -31,10 +36,308 @@ def _safe_identifier(value, fallback):
     return value if _IDENTIFIER_RE.fullmatch(value) else fallback
 
 
+# Typed per-metric columns mirrored from each snapshot so series reads do not
+# need to decompress and parse the full payload. Paths are relative to
+# snapshot["system"].
+_SERIES_COLUMNS = (
+    ("cpu_percent", ("cpu_percent",)),
+    ("cpu_count", ("cpu_count",)),
+    ("mem_percent", ("mem", "percent")),
+    ("disk_percent", ("disk", "percent")),
+    ("inode_percent", ("inode", "percent")),
+    ("disk_read_bytes", ("disk_io", "read_bytes")),
+    ("disk_write_bytes", ("disk_io", "write_bytes")),
+    ("net_sent_bytes", ("net_io", "sent_bytes")),
+    ("net_recv_bytes", ("net_io", "recv_bytes")),
+)
+_SERIES_COLUMN_PATHS = dict(_SERIES_COLUMNS)
+_SERIES_INTEGER_COLUMNS = {
+    "cpu_count",
+    "disk_read_bytes",
+    "disk_write_bytes",
+    "net_sent_bytes",
+    "net_recv_bytes",
+}
+# Labelled families are stored one row per (timestamp, label, metric):
+# snapshot list key -> (family, label key, {metric: path within entry}).
+_SERIES_LABELED_FAMILIES = {
+    "filesystems": (
+        "filesystem",
+        "path",
+        {"percent": ("percent",), "inode_percent": ("inode", "percent")},
+    ),
+    "network_interfaces": (
+        "network_interface",
+        "name",
+        {"sent_bytes": ("sent_bytes",), "recv_bytes": ("recv_bytes",)},
+    ),
+}
+SERIES_FIELDS = {
+    "cpu": ("cpu_percent", "cpu_count"),
+    "mem": ("mem_percent",),
+    "disk": ("disk_percent",),
+    "inode": ("inode_percent",),
+    "disk_io": ("disk_read_bytes", "disk_write_bytes"),
+    "net_io": ("net_sent_bytes", "net_recv_bytes"),
+    "filesystems": (),
+    "network_interfaces": (),
+}
+_SERIES_BACKFILL_BATCH = 500
+
+
+def normalize_series_fields(fields=None):
+    """Return the requested series field groups, defaulting to all of them."""
+    if fields is None:
+        return tuple(SERIES_FIELDS)
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    normalized = []
+    for field in fields:
+        field = str(field or "").strip().lower()
+        if not field:
+            continue
+        if field not in SERIES_FIELDS:
+            raise ValueError(f"Unknown metrics series field: {field}")
+        if field not in normalized:
+            normalized.append(field)
+    return tuple(normalized) or tuple(SERIES_FIELDS)
+
+
+def _series_number(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _lookup_path(data, path):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _series_rows(snapshot, timestamp):
+    system = snapshot.get("system") or {}
+    if not isinstance(system, dict):
+        system = {}
+    column_row = (timestamp,) + tuple(
+        _series_number(_lookup_path(system, path)) for _column, path in _SERIES_COLUMNS
+    )
+    label_rows = []
+    for list_key, (family, label_key, metrics) in _SERIES_LABELED_FAMILIES.items():
+        entries = system.get(list_key) or []
+        if not isinstance(entries, list):
+            continue
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict) or not entry.get(label_key):
+                continue
+            for metric, path in metrics.items():
+                label_rows.append(
+                    (
+                        timestamp,
+                        family,
+                        str(entry[label_key]),
+                        metric,
+                        position,
+                        _series_number(_lookup_path(entry, path)),
+                    )
+                )
+    return column_row, label_rows
+
+
+def _set_path(data, path, value):
+    for key in path[:-1]:
+        data = data.setdefault(key, {})
+    data[path[-1]] = value
+
+
+def _series_value(column, value):
+    if value is None:
+        return None
+    if column in _SERIES_INTEGER_COLUMNS and float(value).is_integer():
+        return int(value)
+    return value
+
+
+def _build_series_items(columns, rows, label_rows, fields):
+    """Rebuild sparse snapshot-shaped items from typed series rows."""
+    items = []
+    by_timestamp = {}
+    for row in rows:
+        timestamp = float(row[0])
+        system = {}
+        for column, value in zip(columns, row[1:]):
+            value = _series_value(column, value)
+            path = _SERIES_COLUMN_PATHS[column]
+            if value is None and len(path) > 1:
+                continue
+            _set_path(system, path, value)
+        item = {"timestamp": timestamp, "system": system}
+        for list_key in _SERIES_LABELED_FAMILIES:
+            if list_key in fields:
+                system[list_key] = []
+        by_timestamp[timestamp] = item
+        items.append(item)
+    families = {
+        family: (list_key, label_key, metrics)
+        for list_key, (family, label_key, metrics) in _SERIES_LABELED_FAMILIES.items()
+    }
+    entries = {}
+    for timestamp, family, label, metric, _position, value in label_rows:
+        item = by_timestamp.get(float(timestamp))
+        if item is None or family not in families:
+            continue
+        list_key, label_key, metrics = families[family]
+        entry = entries.get((float(timestamp), family, label))
+        if entry is None:
+            entry = {label_key: label}
+            entries[(float(timestamp), family, label)] = entry
+            item["system"][list_key].append(entry)
+        if value is not None:
+            _set_path(entry, metrics[metric], value)
+    return items
+
+
+def project_series_snapshot(snapshot, fields=None):
+    """Reduce a live snapshot to the sparse shape returned by series reads."""
+    fields = normalize_series_fields(fields)
+    columns, families = _series_query_parts(fields)
+    timestamp_value = snapshot.get("timestamp")
+    timestamp = float(time.time() if timestamp_value is None else timestamp_value)
+    column_row, label_rows = _series_rows(snapshot, timestamp)
+    values = dict(zip((column for column, _path in _SERIES_COLUMNS), column_row[1:]))
+    row = (timestamp, *(values[column] for column in columns))
+    label_rows = [label_row for label_row in label_rows if label_row[1] in families]
+    return _build_series_items(columns, [row], label_rows, fields)[0]
+
+
+# Fixed rollup resolutions with their retention config key and default days.
+ROLLUP_TIERS = (
+    (60, "minute_retention_days", 7),
+    (300, "five_minute_retention_days", 30),
+    (3600, "hour_retention_days", 90),
+)
+ROLLUP_RESOLUTIONS = tuple(resolution for resolution, _key, _days in ROLLUP_TIERS)
+_ROLLUP_REBUILD_BATCH = 2000
+_ROLLUP_GAUGE_STATS = {
+    ("system", "cpu_percent"): "cpu",
+    ("system", "mem_percent"): "mem",
+    ("system", "disk_percent"): "disk",
+    ("system", "inode_percent"): "inode",
+    ("filesystem", "percent"): "disk",
+    ("filesystem", "inode_percent"): "inode",
+}
+
+
+def rollup_retention(storage):
+    """Return ``{resolution: retention_days}`` for the enabled rollup tiers."""
+    rollups = (storage or {}).get("rollups", {}) or {}
+    if not rollups.get("enabled", True):
+        return {}
+    retention = {}
+    for resolution, key, default in ROLLUP_TIERS:
+        try:
+            retention[resolution] = max(0.0, float(rollups.get(key, default)))
+        except (TypeError, ValueError):
+            retention[resolution] = float(default)
+    return retention
+
+
+def _rollup_rows(series_rows, series_label_rows, resolutions):
+    """Aggregate series rows into per-bucket min/max/sum/count/last rows."""
+    if not resolutions:
+        return []
+    columns = [column for column, _path in _SERIES_COLUMNS]
+    values = []
+    for row in series_rows:
+        for column, value in zip(columns, row[1:]):
+            values.append((row[0], "system", "", column, 0, value))
+    values.extend(series_label_rows)
+    buckets = {}
+    for timestamp, family, label, metric, position, value in values:
+        if value is None:
+            continue
+        for resolution in resolutions:
+            bucket = float(int(timestamp // resolution) * resolution)
+            key = (resolution, bucket, family, label, metric)
+            current = buckets.get(key)
+            if current is None:
+                buckets[key] = [position, value, value, value, 1, timestamp, value]
+                continue
+            current[0] = position
+            current[1] = min(current[1], value)
+            current[2] = max(current[2], value)
+            current[3] += value
+            current[4] += 1
+            if timestamp >= current[5]:
+                current[5] = timestamp
+                current[6] = value
+    return [key + tuple(aggregate) for key, aggregate in buckets.items()]
+
+
+def _build_rollup_items(rows, fields):
+    """Rebuild snapshot-shaped items from rollup rows.
+
+    Items carry each bucket's last value, matching how raw history is
+    downsampled, while gauge minimum/maximum values are returned separately so
+    stats still reflect every sample in the bucket.
+    """
+    columns, _families = _series_query_parts(fields)
+    column_index = {column: index for index, column in enumerate(columns)}
+    series_rows = {}
+    label_rows = []
+    extrema = {}
+    for bucket, family, label, metric, position, min_value, max_value, last in rows:
+        bucket = float(bucket)
+        if family == "system":
+            if metric not in column_index:
+                continue
+            row = series_rows.setdefault(bucket, [bucket] + [None] * len(columns))
+            row[column_index[metric] + 1] = last
+        else:
+            series_rows.setdefault(bucket, [bucket] + [None] * len(columns))
+            label_rows.append((bucket, family, label, metric, position, last))
+        stat_name = _ROLLUP_GAUGE_STATS.get((family, metric))
+        if stat_name is None:
+            continue
+        if family == "system":
+            target = extrema
+        else:
+            target = extrema.setdefault("filesystems", {}).setdefault(label, {})
+        current = target.get(stat_name)
+        if current is None:
+            target[stat_name] = {"min": min_value, "max": max_value}
+        else:
+            current["min"] = min(current["min"], min_value)
+            current["max"] = max(current["max"], max_value)
+    ordered = [series_rows[bucket] for bucket in sorted(series_rows)]
+    return _build_series_items(columns, ordered, label_rows, fields), extrema
+
+
+def _series_query_parts(fields):
+    columns = [column for field in fields for column in SERIES_FIELDS[field]]
+    families = [
+        _SERIES_LABELED_FAMILIES[field][0]
+        for field in fields
+        if field in _SERIES_LABELED_FAMILIES
+    ]
+    return columns, families
+
+
+def _used_bytes(connection):
+    """Return the bytes held by in-use pages, i.e. every table and index."""
+    page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+    page_count = connection.execute("PRAGMA page_count").fetchone()[0]
+    free_pages = connection.execute("PRAGMA freelist_count").fetchone()[0]
+    return (page_count - free_pages) * page_size
+
+
 class SQLiteMetricsHistoryStore:
-    def __init__(self, path, logger=None):
+    def __init__(self, path, logger=None, rollup_resolutions=ROLLUP_RESOLUTIONS):
         self.path = str(path)
         self.logger = logger
+        self.rollup_resolutions = tuple(rollup_resolutions or ())
         self._lock = threading.RLock()
         self._ensure_schema()
 
@@ -75,6 +378,44 @@ class SQLiteMetricsHistoryStore:
                 "CREATE INDEX IF NOT EXISTS idx_metrics_created_at "
                 "ON metrics_snapshots(created_at)"
             )
+            series_columns = ",\n".join(
+                f"                    {column} REAL"
+                for column, _path in _SERIES_COLUMNS
+            )
+            connection.execute(f"""
+                CREATE TABLE IF NOT EXISTS metrics_series (
+                    timestamp REAL PRIMARY KEY,
+{series_columns}
+                )
+                """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS metrics_series_labels (
+                    timestamp REAL NOT NULL,
+                    family TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    value REAL,
+                    PRIMARY KEY (timestamp, family, label, metric)
+                ) WITHOUT ROWID
+                """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS metrics_rollups (
+                    resolution INTEGER NOT NULL,
+                    bucket REAL NOT NULL,
+                    family TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    min_value REAL NOT NULL,
+                    max_value REAL NOT NULL,
+                    sum_value REAL NOT NULL,
+                    sample_count INTEGER NOT NULL,
+                    last_timestamp REAL NOT NULL,
+                    last_value REAL NOT NULL,
+                    PRIMARY KEY (resolution, bucket, family, label, metric)
+                ) WITHOUT ROWID
+                """)
         try:
             os.chmod(self.path, 0o600)
         except OSError:
@@ -87,6 +428,8 @@ class SQLiteMetricsHistoryStore:
 
     def write_many(self, snapshots):
         rows = []
+        series_rows = []
+        series_label_rows = []
         for snapshot in snapshots:
             timestamp_value = snapshot.get("timestamp")
             timestamp = float(
@@ -96,6 +439,9 @@ class SQLiteMetricsHistoryStore:
             snapshot["timestamp"] = timestamp
             payload, raw_size = _encode_snapshot(snapshot)
             rows.append((timestamp, payload, raw_size, len(payload), time.time()))
+            column_row, label_rows = _series_rows(snapshot, timestamp)
+            series_rows.append(column_row)
+            series_label_rows.extend(label_rows)
         if not rows:
             return 0
         with self._lock, self._connect() as connection:
@@ -111,8 +457,73 @@ class SQLiteMetricsHistoryStore:
                 """,
                 rows,
             )
+            self._write_series(connection, series_rows, series_label_rows)
         return len(rows)
 
+    def _write_series(self, connection, series_rows, series_label_rows):
+        columns = [column for column, _path in _SERIES_COLUMNS]
+        existing = set()
+        timestamps = [row[0] for row in series_rows]
+        if self.rollup_resolutions:
+            for start in range(0, len(timestamps), 500):
+                chunk = timestamps[start : start + 500]
+                existing.update(
+                    row[0]
+                    for row in connection.execute(
+                        "SELECT timestamp FROM metrics_series WHERE timestamp IN "
+                        f"({', '.join('?' for _ in chunk)})",
+                        chunk,
+                    )
+                )
+        connection.executemany(
+            f"INSERT OR REPLACE INTO metrics_series (timestamp, {', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in range(len(columns) + 1))})",
+            series_rows,
+        )
+        connection.executemany(
+            "DELETE FROM metrics_series_labels WHERE timestamp = ?",
+            [(row[0],) for row in series_rows],
+        )
+        connection.executemany(
+            """
+            INSERT OR REPLACE INTO metrics_series_labels
+                (timestamp, family, label, metric, position, value)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            series_label_rows,
+        )
+        # Rewrites of an already stored timestamp keep their original rollup
+        # contribution so replays never double count a sample.
+        self._write_rollups(
+            connection,
+            [row for row in series_rows if row[0] not in existing],
+            [row for row in series_label_rows if row[0] not in existing],
+        )
+
+    def _write_rollups(self, connection, series_rows, series_label_rows):
+        connection.executemany(
+            """
+            INSERT INTO metrics_rollups
+                (resolution, bucket, family, label, metric, position, min_value,
+                 max_value, sum_value, sample_count, last_timestamp, last_value)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(resolution, bucket, family, label, metric) DO UPDATE SET
+                position = excluded.position,
+                min_value = MIN(metrics_rollups.min_value, excluded.min_value),
+                max_value = MAX(metrics_rollups.max_value, excluded.max_value),
+                sum_value = metrics_rollups.sum_value + excluded.sum_value,
+                sample_count = metrics_rollups.sample_count + excluded.sample_count,
+                last_value = CASE
+                    WHEN excluded.last_timestamp >= metrics_rollups.last_timestamp
+                    THEN excluded.last_value ELSE metrics_rollups.last_value
+                END,
+                last_timestamp = MAX(
+                    metrics_rollups.last_timestamp, excluded.last_timestamp
+                )
+            """,
+            _rollup_rows(series_rows, series_label_rows, self.rollup_resolutions),
+        )
+
     def read(self, since=None, limit=5000):
         params = []
         where = ""
@@ -157,7 +568,186 @@ class SQLiteMetricsHistoryStore:
             ).fetchone()
         return row[0] if row and row[0] is not None else None
 
+    def read_series(self, since=None, limit=5000, fields=None):
+        fields = normalize_series_fields(fields)
+        columns, families = _series_query_parts(fields)
+        params = []
+        where = ""
+        if since is not None:
+            where = "WHERE timestamp >= ?"
+            params.append(float(since))
+        limit_sql = ""
+        if limit and limit > 0:
+            limit_sql = "LIMIT ?"
+            params.append(int(limit))
+        selected = ", ".join(["timestamp", *columns])
+        query = (
+            f"SELECT {selected} FROM metrics_series "
+            f"{where} ORDER BY timestamp DESC {limit_sql}"
+        )
+        label_rows = []
+        with self._lock, self._connect() as connection:
+            rows = connection.execute(query, params).fetchall()
+            rows.reverse()
+            if rows and families:
+                placeholders = ", ".join("?" for _ in families)
+                label_rows = connection.execute(
+                    "SELECT timestamp, family, label, metric, position, value "
+                    "FROM metrics_series_labels "
+                    f"WHERE family IN ({placeholders}) "
+                    "AND timestamp >= ? AND timestamp <= ? "
+                    "ORDER BY timestamp, position, metric",
+                    [*families, rows[0][0], rows[-1][0]],
+                ).fetchall()
+        return _build_series_items(columns, rows, label_rows, fields)
+
+    def read_rollups(self, resolution, since=None, limit=5000, fields=None):
+        """Return ``(items, extrema)`` for one rollup tier, oldest first."""
+        fields = normalize_series_fields(fields)
+        columns, families = _series_query_parts(fields)
+        resolution = int(resolution)
+        start = None
+        if since is not None:
+            start = float(int(float(since) // resolution) * resolution)
+        filters = ["resolution = ?"]
+        params = [resolution]
+        if start is not None:
+            filters.append("bucket >= ?")
+            params.append(start)
+        with self._lock, self._connect() as connection:
+            if limit and limit > 0:
+                row = connection.execute(
+                    "SELECT MIN(bucket) FROM (SELECT DISTINCT bucket "
+                    f"FROM metrics_rollups WHERE {' AND '.join(filters)} "
+                    "ORDER BY bucket DESC LIMIT ?)",
+                    [*params, int(limit)],
+                ).fetchone()
+                if not row or row[0] is None:
+                    return [], {}
+                filters = ["resolution = ?", "bucket >= ?"]
+                params = [resolution, row[0]]
+            scopes = []
+            if columns:
+                scopes.append(
+                    "(family = 'system' AND metric IN "
+                    f"({', '.join('?' for _ in columns)}))"
+                )
+                params.extend(columns)
+            if families:
+                scopes.append(f"family IN ({', '.join('?' for _ in families)})")
+                params.extend(families)
+            filters.append(f"({' OR '.join(scopes)})")
+            rows = connection.execute(
+                "SELECT bucket, family, label, metric, position, min_value, "
+                "max_value, last_value FROM metrics_rollups "
+                f"WHERE {' AND '.join(filters)} "
+                "ORDER BY bucket, position, metric",
+                params,
+            ).fetchall()
+        return _build_rollup_items(rows, fields)
+
+    def prune_rollups(self, retention):
+        """Trim each rollup tier to its own ``{resolution: days}`` retention."""
+        deleted = 0
+        now = time.time()
+        with self._lock, self._connect() as connection:
+            for resolution, retention_days in (retention or {}).items():
+                if not retention_days or retention_days <= 0:
+                    continue
+                cursor = connection.execute(
+                    "DELETE FROM metrics_rollups WHERE resolution = ? AND bucket < ?",
+                    (int(resolution), now - float(retention_days) * 86400),
+                )
+                deleted += max(cursor.rowcount, 0)
+        return deleted
+
+    def rebuild_rollups(self, batch_size=_ROLLUP_REBUILD_BATCH):
+        """Recompute every rollup tier from the stored series rows."""
+        columns = [column for column, _path in _SERIES_COLUMNS]
+        rebuilt = 0
+        cursor_timestamp = None
+        with self._lock, self._connect() as connection:
+            connection.execute("DELETE FROM metrics_rollups")
+        while self.rollup_resolutions:
+            params = []
+            after = ""
+            if cursor_timestamp is not None:
+                after = "WHERE timestamp > ?"
+                params.append(cursor_timestamp)
+            params.append(int(batch_size))
+            with self._lock, self._connect() as connection:
+                series_rows = connection.execute(
+                    f"SELECT timestamp, {', '.join(columns)} FROM metrics_series "
+                    f"{after} ORDER BY timestamp ASC LIMIT ?",
+                    params,
+                ).fetchall()
+                if not series_rows:
+                    break
+                label_rows = connection.execute(
+                    "SELECT timestamp, family, label, metric, position, value "
+                    "FROM metrics_series_labels "
+                    "WHERE timestamp >= ? AND timestamp <= ?",
+                    (series_rows[0][0], series_rows[-1][0]),
+                ).fetchall()
+                self._write_rollups(connection, series_rows, label_rows)
+            rebuilt += len(series_rows)
+            cursor_timestamp = series_rows[-1][0]
+            if len(series_rows) < batch_size:
+                break
+        return rebuilt
+
+    def backfill_series(self, batch_size=_SERIES_BACKFILL_BATCH):
+        """Derive typed series rows for stored payloads written before them."""
+        backfilled = 0
+        skipped = 0
+        cursor_timestamp = None
+        while True:
+            params = []
+            after = ""
+            if cursor_timestamp is not None:
+                after = "AND snapshots.timestamp > ?"
+                params.append(cursor_timestamp)
+            params.append(int(batch_size))
+            with self._lock, self._connect() as connection:
+                rows = connection.execute(
+                    f"""
+                    SELECT snapshots.timestamp, snapshots.payload
+                    FROM metrics_snapshots AS snapshots
+                    LEFT JOIN metrics_series AS series
+                        ON series.timestamp = snapshots.timestamp
+                    WHERE series.timestamp IS NULL {after}
+                    ORDER BY snapshots.timestamp ASC
+                    LIMIT ?
+                    """,
+                    params,
+                ).fetchall()
+                if not rows:
+                    break
+                series_rows = []
+                series_label_rows = []
+                for timestamp, payload in rows:
+                    try:
+                        snapshot = _decode_snapshot(payload)
+                    except (ValueError, zlib.error):
+                        skipped += 1
+                        continue
+                    column_row, label_rows = _series_rows(snapshot, timestamp)
+                    series_rows.append(column_row)
+                    series_label_rows.extend(label_rows)
+                self._write_series(connection, series_rows, series_label_rows)
+            backfilled += len(series_rows)
+            cursor_timestamp = rows[-1][0]
+            if len(rows) < batch_size:
+                break
+        return {"samples": backfilled, "skipped": skipped}
+
     def prune(self, retention_days=0, max_total_mb=0):
+        """Drop samples older than ``retention_days`` and cap the database size.
+
+        ``max_total_mb`` is measured against every in-use page, so payloads,
+        typed series, labels, rollups and indexes all count; the oldest
+        samples are evicted until the database fits.
+        """
         deleted = 0
         with self._lock, self._connect() as connection:
             if retention_days and retention_days > 0:
@@ -166,27 +756,32 @@ class SQLiteMetricsHistoryStore:
                     "DELETE FROM metrics_snapshots WHERE timestamp < ?", (cutoff,)
                 )
                 deleted += max(cursor.rowcount, 0)
+                for table in ("metrics_series", "metrics_series_labels"):
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE timestamp < ?", (cutoff,)
+                    )
             if max_total_mb and max_total_mb > 0:
                 max_bytes = int(float(max_total_mb) * 1024 * 1024)
-                row = connection.execute(
-                    "SELECT COALESCE(SUM(stored_size), 0) FROM metrics_snapshots"
-                ).fetchone()
-                stored_bytes = int(row[0] or 0)
-                while stored_bytes > max_bytes:
-                    rows = connection.execute(
-                        "SELECT timestamp, stored_size FROM metrics_snapshots "
-                        "ORDER BY timestamp ASC LIMIT 1000"
-                    ).fetchall()
-                    if not rows:
+                while _used_bytes(connection) > max_bytes:
+                    timestamps = [
+                        row[0]
+                        for row in connection.execute(
+                            "SELECT timestamp FROM metrics_snapshots "
+                            "ORDER BY timestamp ASC LIMIT 1000"
+                        )
+                    ]
+                    if not timestamps:
                         break
-                    timestamps = [row[0] for row in rows]
-                    reclaimed = sum(int(row[1] or 0) for row in rows)
-                    connection.executemany(
-                        "DELETE FROM metrics_snapshots WHERE timestamp = ?",
-                        [(timestamp,) for timestamp in timestamps],
-                    )
-                    stored_bytes -= reclaimed
-                    deleted += len(rows)
+                    for table in (
+                        "metrics_snapshots",
+                        "metrics_series",
+                        "metrics_series_labels",
+                    ):
+                        connection.executemany(
+                            f"DELETE FROM {table} WHERE timestamp = ?",
+                            [(timestamp,) for timestamp in timestamps],
+                        )
+                    deleted += len(timestamps)
         return deleted
 
     def metadata(self, key, default=None):
@@ -213,6 +808,12 @@ class SQLiteMetricsHistoryStore:
                        COALESCE(SUM(stored_size), 0), MIN(timestamp), MAX(timestamp)
                 FROM metrics_snapshots
                 """).fetchone()
+            series_row = connection.execute(
+                "SELECT COUNT(*) FROM metrics_series"
+            ).fetchone()
+            rollup_rows = connection.execute(
+                "SELECT resolution, COUNT(*) FROM metrics_rollups GROUP BY resolution"
+            ).fetchall()
         file_size = 0
         for suffix in ("", "-wal", "-shm"):
             try:
@@ -224,6 +825,10 @@ class SQLiteMetricsHistoryStore:
         return {
             "path": self.path,
             "samples": int(row[0] or 0),
+            "series_samples": int(series_row[0] or 0),
+            "rollup_rows": {
+                str(resolution): int(count) for resolution, count in rollup_rows
+            },
             "raw_bytes": raw_size,
             "compressed_bytes": stored_size,
             "file_bytes": file_size,
@@ -236,12 +841,21 @@ class SQLiteMetricsHistoryStore:
 
 
 class PostgreSQLMetricsHistoryStore:
-    def __init__(self, postgres_config, database, schema="public", logger=None):
+    def __init__(
+        self,
+        postgres_config,
+        database,
+        schema="public",
+        logger=None,
+        rollup_resolutions=ROLLUP_RESOLUTIONS,
+    ):
         self.postgres_config = postgres_config or {}
         self.database = _safe_identifier(database, "dumb_metrics")
         self.schema = _safe_identifier(schema, "public")
         self.logger = logger
+        self.rollup_resolutions = tuple(rollup_resolutions or ())
         self._ready = False
+        self._series_backfilled = False
         self._lock = threading.RLock()
 
     def _connection_kwargs(self, database=None):
@@ -300,6 +914,48 @@ class PostgreSQLMetricsHistoryStore:
                             "ON {}.metrics_snapshots(created_at)"
                         ).format(sql.Identifier(self.schema))
                     )
+                    cursor.execute(
+                        sql.SQL(
+                            "CREATE TABLE IF NOT EXISTS {}.metrics_series "
+                            "(timestamp DOUBLE PRECISION PRIMARY KEY, {})"
+                        ).format(
+                            sql.Identifier(self.schema),
+                            sql.SQL(", ").join(
+                                sql.SQL("{} DOUBLE PRECISION").format(
+                                    sql.Identifier(column)
+                                )
+                                for column, _path in _SERIES_COLUMNS
+                            ),
+                        )
+                    )
+                    cursor.execute(sql.SQL("""
+                            CREATE TABLE IF NOT EXISTS {}.metrics_series_labels (
+                                timestamp DOUBLE PRECISION NOT NULL,
+                                family TEXT NOT NULL,
+                                label TEXT NOT NULL,
+                                metric TEXT NOT NULL,
+                                position INTEGER NOT NULL,
+                                value DOUBLE PRECISION,
+                                PRIMARY KEY (timestamp, family, label, metric)
+                            )
+                            """).format(sql.Identifier(self.schema)))
+                    cursor.execute(sql.SQL("""
+                            CREATE TABLE IF NOT EXISTS {}.metrics_rollups (
+                                resolution INTEGER NOT NULL,
+                                bucket DOUBLE PRECISION NOT NULL,
+                                family TEXT NOT NULL,
+                                label TEXT NOT NULL,
+                                metric TEXT NOT NULL,
+                                position INTEGER NOT NULL,
+                                min_value DOUBLE PRECISION NOT NULL,
+                                max_value DOUBLE PRECISION NOT NULL,
+                                sum_value DOUBLE PRECISION NOT NULL,
+                                sample_count BIGINT NOT NULL,
+                                last_timestamp DOUBLE PRECISION NOT NULL,
+                                last_value DOUBLE PRECISION NOT NULL,
+                                PRIMARY KEY (resolution, bucket, family, label, metric)
+                            )
+                            """).format(sql.Identifier(self.schema)))
                 connection.commit()
             finally:
                 connection.close()
@@ -315,6 +971,8 @@ class PostgreSQLMetricsHistoryStore:
             return 0
         self._ensure_schema()
         rows = []
+        series_rows = []
+        series_label_rows = []
         for snapshot in snapshots:
             timestamp_value = snapshot.get("timestamp")
             timestamp = float(
@@ -332,6 +990,9 @@ class PostgreSQLMetricsHistoryStore:
                     time.time(),
                 )
             )
+            column_row, label_rows = _series_rows(snapshot, timestamp)
+            series_rows.append(column_row)
+            series_label_rows.extend(label_rows)
         connection = psycopg2.connect(**self._connection_kwargs())
         try:
             with connection.cursor() as cursor:
@@ -347,11 +1008,91 @@ class PostgreSQLMetricsHistoryStore:
                         """).format(sql.Identifier(self.schema)),
                     rows,
                 )
+                self._write_series(cursor, series_rows, series_label_rows)
             connection.commit()
         finally:
             connection.close()
         return len(rows)
 
+    def _write_series(self, cursor, series_rows, series_label_rows):
+        columns = [column for column, _path in _SERIES_COLUMNS]
+        existing = set()
+        if self.rollup_resolutions and series_rows:
+            cursor.execute(
+                sql.SQL(
+                    "SELECT timestamp FROM {}.metrics_series WHERE timestamp = ANY(%s)"
+                ).format(sql.Identifier(self.schema)),
+                ([row[0] for row in series_rows],),
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        cursor.executemany(
+            sql.SQL(
+                "INSERT INTO {}.metrics_series ({}) VALUES ({}) "
+                "ON CONFLICT(timestamp) DO UPDATE SET {}"
+            ).format(
+                sql.Identifier(self.schema),
+                sql.SQL(", ").join(
+                    sql.Identifier(column) for column in ["timestamp", *columns]
+                ),
+                sql.SQL(", ").join(sql.Placeholder() for _ in range(len(columns) + 1)),
+                sql.SQL(", ").join(
+                    sql.SQL("{} = EXCLUDED.{}").format(
+                        sql.Identifier(column), sql.Identifier(column)
+                    )
+                    for column in columns
+                ),
+            ),
+            series_rows,
+        )
+        cursor.executemany(
+            sql.SQL("DELETE FROM {}.metrics_series_labels WHERE timestamp = %s").format(
+                sql.Identifier(self.schema)
+            ),
+            [(row[0],) for row in series_rows],
+        )
+        cursor.executemany(
+            sql.SQL("""
+                INSERT INTO {}.metrics_series_labels
+                    (timestamp, family, label, metric, position, value)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT(timestamp, family, label, metric) DO UPDATE SET
+                    position = EXCLUDED.position,
+                    value = EXCLUDED.value
+                """).format(sql.Identifier(self.schema)),
+            series_label_rows,
+        )
+        # Replays from the SQLite continuity buffer rewrite timestamps that are
+        # already stored; only new samples contribute to the rollups.
+        self._write_rollups(
+            cursor,
+            [row for row in series_rows if row[0] not in existing],
+            [row for row in series_label_rows if row[0] not in existing],
+        )
+
+    def _write_rollups(self, cursor, series_rows, series_label_rows):
+        cursor.executemany(
+            sql.SQL("""
+                INSERT INTO {schema}.metrics_rollups AS rollups
+                    (resolution, bucket, family, label, metric, position, min_value,
+                     max_value, sum_value, sample_count, last_timestamp, last_value)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT(resolution, bucket, family, label, metric) DO UPDATE SET
+                    position = EXCLUDED.position,
+                    min_value = LEAST(rollups.min_value, EXCLUDED.min_value),
+                    max_value = GREATEST(rollups.max_value, EXCLUDED.max_value),
+                    sum_value = rollups.sum_value + EXCLUDED.sum_value,
+                    sample_count = rollups.sample_count + EXCLUDED.sample_count,
+                    last_value = CASE
+                        WHEN EXCLUDED.last_timestamp >= rollups.last_timestamp
+                        THEN EXCLUDED.last_value ELSE rollups.last_value
+                    END,
+                    last_timestamp = GREATEST(
+                        rollups.last_timestamp, EXCLUDED.last_timestamp
+                    )
+                """).format(schema=sql.Identifier(self.schema)),
+            _rollup_rows(series_rows, series_label_rows, self.rollup_resolutions),
+        )
+
     def read(self, since=None, limit=5000):
         self._ensure_schema()
         where = sql.SQL("")
@@ -375,6 +1116,249 @@ class PostgreSQLMetricsHistoryStore:
             connection.close()
         return [_decode_snapshot(row[0]) for row in reversed(rows)]
 
+    def read_series(self, since=None, limit=5000, fields=None):
+        fields = normalize_series_fields(fields)
+        columns, families = _series_query_parts(fields)
+        self._ensure_schema()
+        self._ensure_series_backfill()
+        where = sql.SQL("")
+        params = []
+        if since is not None:
+            where = sql.SQL("WHERE timestamp >= %s")
+            params.append(float(since))
+        limit_sql = sql.SQL("")
+        if limit and limit > 0:
+            limit_sql = sql.SQL("LIMIT %s")
+            params.append(int(limit))
+        query = sql.SQL(
+            "SELECT {} FROM {}.metrics_series {} ORDER BY timestamp DESC {}"
+        ).format(
+            sql.SQL(", ").join(
+                sql.Identifier(column) for column in ["timestamp", *columns]
+            ),
+            sql.Identifier(self.schema),
+            where,
+            limit_sql,
+        )
+        label_rows = []
+        connection = psycopg2.connect(**self._connection_kwargs())
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(query, params)
+                rows = list(reversed(cursor.fetchall()))
+                if rows and families:
+                    cursor.execute(
+                        sql.SQL(
+                            "SELECT timestamp, family, label, metric, position, value "
+                            "FROM {}.metrics_series_labels "
+                            "WHERE family = ANY(%s) "
+                            "AND timestamp >= %s AND timestamp <= %s "
+                            "ORDER BY timestamp, position, metric"
+                        ).format(sql.Identifier(self.schema)),
+                        (families, rows[0][0], rows[-1][0]),
+                    )
+                    label_rows = cursor.fetchall()
+        finally:
+            connection.close()
+        return _build_series_items(columns, rows, label_rows, fields)
+
+    def _ensure_series_backfill(self):
+        with self._lock:
+            if self._series_backfilled:
+                return
+            self.backfill_series()
+            if self.rollup_resolutions and self._rollups_missing():
+                self.rebuild_rollups()
+            self._series_backfilled = True
+
+    def _rollups_missing(self):
+        connection = psycopg2.connect(**self._connection_kwargs())
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL(
+                        "SELECT EXISTS (SELECT 1 FROM {schema}.metrics_series), "
+                        "EXISTS (SELECT 1 FROM {schema}.metrics_rollups)"
+                    ).format(schema=sql.Identifier(self.schema))
+                )
+                has_series, has_rollups = cursor.fetchone()
+        finally:
+            connection.close()
+        return bool(has_series and not has_rollups)
+
+    def read_rollups(self, resolution, since=None, limit=5000, fields=None):
+        """Return ``(items, extrema)`` for one rollup tier, oldest first."""
+        fields = normalize_series_fields(fields)
+        columns, families = _series_query_parts(fields)
+        self._ensure_schema()
+        self._ensure_series_backfill()
+        resolution = int(resolution)
+        start = None
+        if since is not None:
+            start = float(int(float(since) // resolution) * resolution)
+        connection = psycopg2.connect(**self._connection_kwargs())
+        try:
+            with connection.cursor() as cursor:
+                if limit and limit > 0:
+                    cursor.execute(
+                        sql.SQL(
+                            "SELECT MIN(bucket) FROM (SELECT DISTINCT bucket "
+                            "FROM {}.metrics_rollups WHERE resolution = %s "
+                            "AND bucket >= COALESCE(%s, bucket) "
+                            "ORDER BY bucket DESC LIMIT %s) AS recent"
+                        ).format(sql.Identifier(self.schema)),
+                        (resolution, start, int(limit)),
+                    )
+                    row = cursor.fetchone()
+                    if not row or row[0] is None:
+                        return [], {}
+                    start = row[0]
+                cursor.execute(
+                    sql.SQL(
+                        "SELECT bucket, family, label, metric, position, min_value, "
+                        "max_value, last_value FROM {}.metrics_rollups "
+                        "WHERE resolution = %s AND bucket >= COALESCE(%s, bucket) "
+                        "AND ((family = 'system' AND metric = ANY(%s::text[])) "
+                        "OR family = ANY(%s::text[])) "
+                        "ORDER BY bucket, position, metric"
+                    ).format(sql.Identifier(self.schema)),
+                    (resolution, start, list(columns), list(families)),
+                )
+                rows = cursor.fetchall()
+        finally:
+            connection.close()
+        return _build_rollup_items(rows, fields)
+
+    def prune_rollups(self, retention):
+        """Trim each rollup tier to its own ``{resolution: days}`` retention."""
+        self._ensure_schema()
+        deleted = 0
+        now = time.time()
+        connection = psycopg2.connect(**self._connection_kwargs())
+        try:
+            with connection.cursor() as cursor:
+                for resolution, retention_days in (retention or {}).items():
+                    if not retention_days or retention_days <= 0:
+                        continue
+                    cursor.execute(
+                        sql.SQL(
+                            "DELETE FROM {}.metrics_rollups "
+                            "WHERE resolution = %s AND bucket < %s"
+                        ).format(sql.Identifier(self.schema)),
+                        (int(resolution), now - float(retention_days) * 86400),
+                    )
+                    deleted += max(cursor.rowcount, 0)
+            connection.commit()
+        finally:
+            connection.close()
+        return deleted
+
+    def rebuild_rollups(self, batch_size=_ROLLUP_REBUILD_BATCH):
+        """Recompute every rollup tier from the stored series rows."""
+        self._ensure_schema()
+        columns = [column for column, _path in _SERIES_COLUMNS]
+        rebuilt = 0
+        cursor_timestamp = None
+        connection = psycopg2.connect(**self._connection_kwargs())
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL("DELETE FROM {}.metrics_rollups").format(
+                        sql.Identifier(self.schema)
+                    )
+                )
+            connection.commit()
+            while self.rollup_resolutions:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        sql.SQL(
+                            "SELECT {} FROM {}.metrics_series "
+                            "WHERE timestamp > COALESCE(%s::double precision, '-Infinity') "
+                            "ORDER BY timestamp ASC LIMIT %s"
+                        ).format(
+                            sql.SQL(", ").join(
+                                sql.Identifier(column)
+                                for column in ["timestamp", *columns]
+                            ),
+                            sql.Identifier(self.schema),
+                        ),
+                        (cursor_timestamp, int(batch_size)),
+                    )
+                    series_rows = cursor.fetchall()
+                    if not series_rows:
+                        break
+                    cursor.execute(
+                        sql.SQL(
+                            "SELECT timestamp, family, label, metric, position, value "
+                            "FROM {}.metrics_series_labels "
+                            "WHERE timestamp >= %s AND timestamp <= %s"
+                        ).format(sql.Identifier(self.schema)),
+                        (series_rows[0][0], series_rows[-1][0]),
+                    )
+                    self._write_rollups(cursor, series_rows, cursor.fetchall())
+                connection.commit()
+                rebuilt += len(series_rows)
+                cursor_timestamp = series_rows[-1][0]
+                if len(series_rows) < batch_size:
+                    break
+        finally:
+            connection.close()
+        return rebuilt
+
+    def backfill_series(self, batch_size=_SERIES_BACKFILL_BATCH):
+        """Derive typed series rows for stored payloads written before them."""
+        self._ensure_schema()
+        backfilled = 0
+        skipped = 0
+        cursor_timestamp = None
+        connection = psycopg2.connect(**self._connection_kwargs())
+        try:
+            while True:
+                params = []
+                after = sql.SQL("")
+                if cursor_timestamp is not None:
+                    after = sql.SQL("AND snapshots.timestamp > %s")
+                    params.append(cursor_timestamp)
+                params.append(int(batch_size))
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        sql.SQL("""
+                            SELECT snapshots.timestamp, snapshots.payload
+                            FROM {schema}.metrics_snapshots AS snapshots
+                            LEFT JOIN {schema}.metrics_series AS series
+                                ON series.timestamp = snapshots.timestamp
+                            WHERE series.timestamp IS NULL {after}
+                            ORDER BY snapshots.timestamp ASC
+                            LIMIT %s
+                            """).format(
+                            schema=sql.Identifier(self.schema), after=after
+                        ),
+                        params,
+                    )
+                    rows = cursor.fetchall()
+                    if not rows:
+                        break
+                    series_rows = []
+                    series_label_rows = []
+                    for timestamp, payload in rows:
+                        try:
+                            snapshot = _decode_snapshot(payload)
+                        except (ValueError, zlib.error):
+                            skipped += 1
+                            continue
+                        column_row, label_rows = _series_rows(snapshot, timestamp)
+                        series_rows.append(column_row)
+                        series_label_rows.extend(label_rows)
+                    self._write_series(cursor, series_rows, series_label_rows)
+                connection.commit()
+                backfilled += len(series_rows)
+                cursor_timestamp = rows[-1][0]
+                if len(rows) < batch_size:
+                    break
+        finally:
+            connection.close()
+        return {"samples": backfilled, "skipped": skipped}
+
     def latest_timestamp(self):
         self._ensure_schema()
         connection = psycopg2.connect(**self._connection_kwargs())
@@ -406,6 +1390,13 @@ class PostgreSQLMetricsHistoryStore:
                     (cutoff,),
                 )
                 deleted = max(cursor.rowcount, 0)
+                for table in ("metrics_series", "metrics_series_labels"):
+                    cursor.execute(
+                        sql.SQL("DELETE FROM {}.{} WHERE timestamp < %s").format(
+                            sql.Identifier(self.schema), sql.Identifier(table)
+                        ),
+                        (cutoff,),
+                    )
             connection.commit()
         finally:
             connection.close()
@@ -460,6 +1451,7 @@ class MetricsHistoryManager:
         self._last_postgres_success = None
         self._last_sqlite_prune = 0.0
         self._last_postgres_prune = 0.0
+        self._rollup_retention = {}
         self._last_migration = {
             "completed": False,
             "files": 0,
@@ -490,10 +1482,13 @@ class MetricsHistoryManager:
         )
         pg_storage = storage.get("postgresql", {}) or {}
         postgres_config = self._root_config().get("postgres", {}) or {}
+        self._rollup_retention = rollup_retention(storage)
+        rollup_resolutions = tuple(sorted(self._rollup_retention))
         maintenance_key = (
             metrics.get("history_retention_days", 7),
             metrics.get("history_max_total_mb", 100),
             pg_storage.get("local_retention_days", 7),
+            tuple(sorted(self._rollup_retention.items())),
         )
         if maintenance_key != self._maintenance_config_key:
             # Apply changed retention limits to the next stored sample without
@@ -510,10 +1505,13 @@ class MetricsHistoryManager:
             postgres_config.get("port"),
             postgres_config.get("user"),
             postgres_config.get("password"),
+            rollup_resolutions,
         )
         if key == self._config_key:
             return metrics, storage
-        self._sqlite = SQLiteMetricsHistoryStore(sqlite_path, logger=self.logger)
+        self._sqlite = SQLiteMetricsHistoryStore(
+            sqlite_path, logger=self.logger, rollup_resolutions=rollup_resolutions
+        )
         self._postgres = None
         if provider == "postgresql":
             self._postgres = PostgreSQLMetricsHistoryStore(
@@ -521,6 +1519,7 @@ class MetricsHistoryManager:
                 database=pg_storage.get("database", "dumb_metrics"),
                 schema=pg_storage.get("schema", "public"),
                 logger=self.logger,
+                rollup_resolutions=rollup_resolutions,
             )
         self._configured_provider = provider
         self._active_provider = "sqlite"
@@ -531,7 +1530,10 @@ class MetricsHistoryManager:
         self._last_sqlite_prune = 0.0
         self._last_postgres_prune = 0.0
         if storage.get("migrate_jsonl", True):
+            # The migration backfills series rows itself before importing.
             self.migrate_legacy(force=False, _configured=True)
+        else:
+            self._backfill_series()
         return metrics, storage
 
     def migrate_legacy(self, force=False, _configured=False):
@@ -540,6 +1542,7 @@ class MetricsHistoryManager:
                 metrics, _storage = self._configure()
             else:
                 metrics = self._metrics_config()
+            series = self._backfill_series(force=force)
             migration_key = "jsonl_migration_v1"
             if not force and self._sqlite.metadata(migration_key) == "complete":
                 self._last_migration = {
@@ -547,6 +1550,7 @@ class MetricsHistoryManager:
                     "files": int(self._sqlite.metadata("jsonl_migration_files", 0)),
                     "samples": int(self._sqlite.metadata("jsonl_migration_samples", 0)),
                     "skipped": 0,
+                    "series": series,
                 }
                 return dict(self._last_migration)
             history_dir = metrics.get("history_dir", "/config/metrics")
@@ -586,6 +1590,7 @@ class MetricsHistoryManager:
                 "files": len(files),
                 "samples": samples,
                 "skipped": skipped,
+                "series": series,
             }
             if skipped and self.logger:
                 self.logger.warning(
@@ -601,6 +1606,35 @@ class MetricsHistoryManager:
                 self._active_provider = "sqlite"
             return dict(self._last_migration)
 
+    def _backfill_series(self, force=False):
+        """Populate typed series tables from compressed payloads stored before
+        the series layout existed."""
+        backfill_key = "series_backfill_v1"
+        if not force and self._sqlite.metadata(backfill_key) == "complete":
+            self._rebuild_rollups()
+            return {"completed": True, "samples": 0, "skipped": 0}
+        result = self._sqlite.backfill_series()
+        completed = not result["skipped"]
+        self._sqlite.set_metadata(
+            backfill_key, "complete" if completed else "incomplete"
+        )
+        if result["skipped"] and self.logger:
+            self.logger.warning(
+                "Metrics series backfill skipped %s unreadable stored sample(s).",
+                result["skipped"],
+            )
+        self._rebuild_rollups(force=force)
+        return {"completed": completed, **result}
+
+    def _rebuild_rollups(self, force=False):
+        """Rebuild rollup tiers once per change of the enabled resolutions."""
+        resolutions = ",".join(str(value) for value in self._sqlite.rollup_resolutions)
+        if not force and self._sqlite.metadata("rollup_resolutions") == resolutions:
+            return 0
+        rebuilt = self._sqlite.rebuild_rollups()
+        self._sqlite.set_metadata("rollup_resolutions", resolutions)
+        return rebuilt
+
     def _postgres_retry_interval(self, storage):
         postgres = storage.get("postgresql", {}) or {}
         try:
@@ -648,6 +1682,7 @@ class MetricsHistoryManager:
                         self._postgres.prune(
                             retention_days=metrics.get("history_retention_days", 7)
                         )
+                        self._postgres.prune_rollups(self._rollup_retention)
                         self._last_postgres_prune = now
                     self._active_provider = "postgresql"
                     self._last_error = None
@@ -671,6 +1706,7 @@ class MetricsHistoryManager:
                     retention_days=local_retention,
                     max_total_mb=metrics.get("history_max_total_mb", 100),
                 )
+                self._sqlite.prune_rollups(self._rollup_retention)
                 self._last_sqlite_prune = now
 
     def activate_postgresql(self):
@@ -710,6 +1746,110 @@ class MetricsHistoryManager:
                 raise
 
     def read(self, since=None, full=False, limit=5000, default_hours=6):
+        items = self._read_from_active_store(
+            "read", since=since, full=full, limit=limit, default_hours=default_hours
+        )
+        return items, bool(limit and len(items) >= limit)
+
+    def read_series(
+        self, since=None, full=False, limit=5000, default_hours=6, fields=None
+    ):
+        """Read sparse snapshot-shaped items from the typed series tables.
+
+        Only the requested field groups (see ``SERIES_FIELDS``) are selected, so
+        chart queries avoid decoding full snapshot payloads.
+        """
+        fields = normalize_series_fields(fields)
+        items = self._read_from_active_store(
+            "read_series",
+            since=since,
+            full=full,
+            limit=limit,
+            default_hours=default_hours,
+            fields=fields,
+        )
+        return items, bool(limit and len(items) >= limit)
+
+    def read_history_series(
+        self,
+        since=None,
+        full=False,
+        limit=5000,
+        default_hours=6,
+        bucket_seconds=None,
+        max_points=600,
+        fields=None,
+    ):
+        """Return ``prepare_history_series`` output for a chart request.
+
+        Field-scoped requests are served from the coarsest rollup tier that
+        still yields ``max_points`` buckets for the range; shorter ranges and
+        unscoped requests read raw samples.
+        """
+        if since is None and not full:
+            since = time.time() - (default_hours * 60 * 60)
+        resolution = None
+        if fields:
+            fields = normalize_series_fields(fields)
+            resolution = self._select_rollup_resolution(
+                since, bucket_seconds, max_points
+            )
+        extrema = None
+        if resolution:
+            items, extrema = self._read_from_active_store(
+                "read_rollups",
+                since=since,
+                full=full,
+                limit=limit,
+                default_hours=default_hours,
+                resolution=resolution,
+                fields=fields,
+            )
+            truncated = bool(limit and len(items) >= limit)
+        elif fields:
+            items, truncated = self.read_series(
+                since=since,
+                full=full,
+                limit=limit,
+                default_hours=default_hours,
+                fields=fields,
+            )
+        else:
+            items, truncated = self.read(
+                since=since, full=full, limit=limit, default_hours=default_hours
+            )
+        return prepare_history_series(
+            items,
+            truncated=truncated,
+            since=since,
+            full=full,
+            default_hours=default_hours,
+            bucket_seconds=bucket_seconds,
+            max_points=max_points,
+            extrema=extrema,
+        )
+
+    def _select_rollup_resolution(self, since, bucket_seconds, max_points):
+        if since is None or not max_points or max_points <= 0:
+            return None
+        with self._lock:
+            self._configure()
+            retention = dict(self._rollup_retention)
+        span = max(time.time() - since, 1)
+        target = history_bucket_seconds(span, bucket_seconds, max_points)
+        # A tier pruned before ``since`` would silently drop the start of the
+        # range, so only tiers whose retention covers it are eligible.
+        eligible = [
+            resolution
+            for resolution, retention_days in sorted(retention.items())
+            if resolution <= target
+            and (retention_days <= 0 or retention_days * 86400 >= span)
+        ]
+        return eligible[-1] if eligible else None
+
+    def _read_from_active_store(
+        self, method, since=None, full=False, limit=5000, default_hours=6, **kwargs
+    ):
         with self._lock:
             _metrics, storage = self._configure()
             if since is None and not full:
@@ -721,16 +1861,17 @@ class MetricsHistoryManager:
                 try:
                     if self._active_provider != "postgresql":
                         self._sync_postgres(full=True)
-                    items = self._postgres.read(since=since, limit=limit)
+                    result = getattr(self._postgres, method)(
+                        since=since, limit=limit, **kwargs
+                    )
                     self._active_provider = "postgresql"
                     self._last_error = None
                     self._last_postgres_success = time.time()
-                    return items, bool(limit and len(items) >= limit)
+                    return result
                 except Exception as exc:
                     self._active_provider = "sqlite"
                     self._last_error = str(exc)
-            items = self._sqlite.read(since=since, limit=limit)
-            return items, bool(limit and len(items) >= limit)
+            return getattr(self._sqlite, method)(since=since, limit=limit, **kwargs)
 
     def status(self, probe_postgresql=False):
         with self._lock:
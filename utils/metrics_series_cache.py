@@ -0,0 +1,245 @@
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+
+from utils.metrics_history_reader import (
+    build_history_series,
+    compact_history_items,
+    compute_history_stats,
+)
+from utils.metrics_history_store import (
+    normalize_series_fields,
+    project_series_snapshot,
+)
+
+DEFAULT_MAX_ENTRIES = 16
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+# Entries are rebuilt from storage after this long so stats that include
+# samples which have since aged out of the window do not drift indefinitely.
+DEFAULT_MAX_AGE_SEC = 900
+# Without a running publisher nothing extends the cache; treat entries that
+# have not seen a snapshot for this long as stale.
+DEFAULT_STALE_AFTER_SEC = 30
+_WINDOW_GRANULARITY_SEC = 60
+
+
+def _merge_stats(target, update):
+    for key, value in (update or {}).items():
+        if not isinstance(value, dict):
+            continue
+        if "min" in value and "max" in value:
+            current = target.get(key)
+            if current is None:
+                target[key] = dict(value)
+            else:
+                current["min"] = min(current["min"], value["min"])
+                current["max"] = max(current["max"], value["max"])
+        else:
+            _merge_stats(target.setdefault(key, {}), value)
+    return target
+
+
+def _copy_stats(stats):
+    return json.loads(json.dumps(stats)) if stats is not None else None
+
+
+class MetricsSeriesCache:
+    """Shared bootstrap series for the metrics websocket.
+
+    Each entry holds the downsampled, compacted items for one
+    (window, bucket, points, limit, fields) request shape. The publisher loop
+    extends every entry with each live snapshot, so bootstraps are rendered in
+    O(points) without reading the history store.
+    """
+
+    def __init__(
+        self,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        max_bytes=DEFAULT_MAX_BYTES,
+        max_age=DEFAULT_MAX_AGE_SEC,
+        stale_after=DEFAULT_STALE_AFTER_SEC,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_age = max_age
+        self.stale_after = stale_after
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        since=None,
+        full=False,
+        limit=5000,
+        default_hours=6,
+        bucket_seconds=None,
+        max_points=600,
+        fields=None,
+        now=None,
+    ):
+        """Return the cache key for a request, or ``None`` when uncacheable."""
+        if full:
+            return None
+        now = time.time() if now is None else now
+        window = (
+            default_hours * 60 * 60 if since is None else max(now - float(since), 1)
+        )
+        window = max(
+            _WINDOW_GRANULARITY_SEC,
+            int(round(window / _WINDOW_GRANULARITY_SEC)) * _WINDOW_GRANULARITY_SEC,
+        )
+        return (
+            window,
+            int(bucket_seconds) if bucket_seconds and bucket_seconds > 0 else None,
+            int(max_points or 0),
+            int(limit or 0),
+            normalize_series_fields(fields) if fields else None,
+        )
+
+    def get(self, loader, **request):
+        """Return ``prepare_history_series`` output, loading on a miss.
+
+        ``loader`` is called with ``request`` unchanged, typically
+        ``MetricsHistoryManager.read_history_series``.
+        """
+        key = self.key(**request)
+        if key is None:
+            return loader(**request)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._fresh(entry, now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._render(entry)
+            self.misses += 1
+        result = loader(**request)
+        items, _series, truncated, stats, bucket_seconds = result
+        if not truncated and bucket_seconds:
+            self._store(key, items, stats, bucket_seconds)
+        return result
+
+    def extend(self, snapshot):
+        """Fold one live snapshot into every cached entry."""
+        timestamp = snapshot.get("timestamp") if snapshot else None
+        if timestamp is None:
+            return
+        timestamp = float(timestamp)
+        with self._lock:
+            if not self._entries:
+                return
+            compacted = {}
+            for entry in self._entries.values():
+                fields = entry["fields"]
+                item = compacted.get(fields)
+                if item is None:
+                    source = (
+                        project_series_snapshot(snapshot, fields)
+                        if fields
+                        else snapshot
+                    )
+                    item = compact_history_items([source])[0]
+                    compacted[fields] = item
+                self._extend_entry(entry, item, timestamp)
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def status(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _fresh(self, entry, now):
+        return (
+            now - entry["built_at"] <= self.max_age
+            and now - entry["updated_at"] <= self.stale_after
+        )
+
+    def _store(self, key, items, stats, bucket_seconds):
+        encoded_size = len(json.dumps(items, separators=(",", ":")))
+        item_bytes = max(64, encoded_size // max(len(items), 1))
+        now = time.monotonic()
+        entry = {
+            "window": key[0],
+            "bucket_seconds": bucket_seconds,
+            "max_points": key[2],
+            "fields": key[4],
+            "items": deque(items),
+            "stats": _copy_stats(stats),
+            "bucket_bytes": item_bytes,
+            "bytes": item_bytes * len(items),
+            "built_at": now,
+            "updated_at": now,
+        }
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous["bytes"]
+            self._entries[key] = entry
+            self._bytes += entry["bytes"]
+            self._evict()
+
+    def _extend_entry(self, entry, item, timestamp):
+        items = entry["items"]
+        bucket_seconds = entry["bucket_seconds"]
+        last = items[-1] if items else None
+        last_timestamp = last.get("timestamp") if last else None
+        if last_timestamp is not None and timestamp < last_timestamp:
+            return
+        stats_items = [last, item] if last is not None else [item]
+        if entry["stats"] is None:
+            entry["stats"] = compute_history_stats(stats_items)
+        else:
+            _merge_stats(entry["stats"], compute_history_stats(stats_items))
+        if last_timestamp is not None and int(last_timestamp // bucket_seconds) == int(
+            timestamp // bucket_seconds
+        ):
+            items[-1] = item
+        else:
+            items.append(item)
+            entry["bytes"] += entry["bucket_bytes"]
+            self._bytes += entry["bucket_bytes"]
+        cutoff = timestamp - entry["window"]
+        while items and (items[0].get("timestamp") or 0) < cutoff:
+            items.popleft()
+            entry["bytes"] -= entry["bucket_bytes"]
+            self._bytes -= entry["bucket_bytes"]
+        entry["updated_at"] = time.monotonic()
+
+    def _render(self, entry):
+        cutoff = time.time() - entry["window"]
+        items = [
+            item for item in entry["items"] if (item.get("timestamp") or 0) >= cutoff
+        ]
+        max_points = entry["max_points"]
+        if max_points and len(items) > max_points:
+            items = items[-max_points:]
+        return (
+            items,
+            build_history_series(items),
+            False,
+            _copy_stats(entry["stats"]),
+            entry["bucket_seconds"],
+        )
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            _key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry["bytes"]
@@ -10,6 +10,15 @@ from urllib.parse import urlencode
 import requests
 
 from utils.install_cache import INSTALL_CACHE, install_cache_enabled
+from utils.ranged_download import (
+    DigestMismatch,
+    DownloadTooLarge,
+    RangedDownloadError,
+    SegmentedDownload,
+    SizeMismatch,
+    download_settings,
+    probe_range,
+)
 
 OCI_INDEX_MEDIA_TYPES = {
     "application/vnd.oci.image.index.v1+json",
@@ -284,33 +293,49 @@ class OCIRegistryClient:
                     return target
             except OSError:
                 target.unlink(missing_ok=True)
-        hasher = hashlib.sha256()
-        bytes_written = 0
+        blob_url = self._registry_url(repository, f"blobs/{digest}")
+        connections, segment_bytes = download_settings()
+
+        def open_range(start, end, _validator):
+            # Blobs are content-addressed, so the digest check replaces If-Range.
+            return self._get(
+                blob_url,
+                repository,
+                headers={"Range": f"bytes={start}-{end}"},
+                stream=True,
+            )
+
+        transfer = SegmentedDownload(
+            open_range,
+            target.with_name(f".{target.name}.part"),
+            identity=digest,
+            expected_sha256=digest,
+            expected_size=expected_size,
+            max_bytes=_MAX_COMPRESSED_IMAGE_BYTES,
+            connections=connections,
+            segment_bytes=segment_bytes,
+        )
         response = self._get(
-            self._registry_url(repository, f"blobs/{digest}"),
+            blob_url,
             repository,
+            headers={"Range": probe_range(segment_bytes)},
             stream=True,
         )
         try:
-            with target.open("wb") as handle:
-                for chunk in response.iter_content(chunk_size=1024 * 1024):
-                    if not chunk:
-                        continue
-                    handle.write(chunk)
-                    hasher.update(chunk)
-                    bytes_written += len(chunk)
-        except OSError as exc:
+            transfer.run(response)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(transfer.part_path, target)
+        except SizeMismatch as exc:
             target.unlink(missing_ok=True)
-            raise OCIImageError("Unable to write the OCI image layer.") from exc
-        finally:
-            response.close()
-        actual_digest = f"sha256:{hasher.hexdigest()}"
-        if actual_digest != digest:
+            raise OCIImageError("OCI image layer size verification failed.") from exc
+        except DigestMismatch as exc:
             target.unlink(missing_ok=True)
-            raise OCIImageError("OCI image layer digest verification failed.")
-        if expected_size and bytes_written != expected_size:
+            raise OCIImageError("OCI image layer digest verification failed.") from exc
+        except DownloadTooLarge as exc:
+            raise OCIImageError("OCI image exceeds the compressed size limit.") from exc
+        except (RangedDownloadError, OSError) as exc:
             target.unlink(missing_ok=True)
-            raise OCIImageError("OCI image layer size verification failed.")
+            raise OCIImageError("Unable to write the OCI image layer.") from exc
         if install_cache_enabled():
             try:
                 INSTALL_CACHE.store_content_file(target, digest)
@@ -0,0 +1,104 @@
+"""In-memory registry of running DUMB-managed processes.
+
+``ProcessHandler`` publishes the running set here and ``APIState`` reads it
+directly, so status queries need no filesystem I/O. The registry indexes
+entries by normalized name and bumps ``seq`` on every change. The
+``running_processes.json`` file is still written for ``healthcheck.py`` (a
+separate process), but by a background writer that coalesces bursts of
+changes into one atomic write.
+"""
+
+import json
+import os
+import threading
+
+RUNNING_PROCESSES_FILE = "/healthcheck/running_processes.json"
+
+
+def normalize_process_name(name):
+    return str(name or "").replace(" ", "").replace("/ ", "/").strip().lower()
+
+
+class ProcessRegistry:
+    def __init__(self, file_path=RUNNING_PROCESSES_FILE, logger=None):
+        self.file_path = file_path
+        self.logger = logger
+        self.seq = 0
+        self._processes = {}
+        self._index = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._written_seq = -1
+        self._writer = None
+
+    def replace(self, processes):
+        """Publish the full ``{name: pid}`` running set; return True if it changed."""
+        processes = dict(processes or {})
+        with self._lock:
+            if processes == self._processes:
+                return False
+            self._processes = processes
+            self._index = {
+                normalize_process_name(name): name for name in self._processes
+            }
+            self.seq += 1
+        self._schedule_write()
+        return True
+
+    def snapshot(self):
+        """Return ``(seq, {name: pid})`` as one consistent copy."""
+        with self._lock:
+            return self.seq, dict(self._processes)
+
+    def names(self):
+        with self._lock:
+            return list(self._processes)
+
+    def lookup(self, process_name):
+        """Return ``(stored_name, pid)`` for a loosely spelled name, or None."""
+        with self._lock:
+            stored_name = self._index.get(normalize_process_name(process_name))
+            if stored_name is None:
+                return None
+            return stored_name, self._processes[stored_name]
+
+    def flush(self):
+        """Write the current set synchronously unless it is already on disk."""
+        with self._write_lock:
+            seq, processes = self.snapshot()
+            if seq == self._written_seq:
+                return
+            directory = os.path.dirname(self.file_path)
+            temporary_path = f"{self.file_path}.tmp"
+            try:
+                os.makedirs(directory, exist_ok=True)
+                with open(temporary_path, "w") as handle:
+                    json.dump(processes, handle)
+                os.replace(temporary_path, self.file_path)
+                self._written_seq = seq
+            except Exception as error:
+                if self.logger:
+                    self.logger.error(
+                        f"Failed to write running processes file: {error}"
+                    )
+                try:
+                    os.unlink(temporary_path)
+                except OSError:
+                    pass
+
+    def _schedule_write(self):
+        self._dirty.set()
+        with self._lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(
+                target=self._write_loop, daemon=True, name="process-registry-writer"
+            )
+            self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            self._dirty.wait()
+            self._dirty.clear()
+            self.flush()
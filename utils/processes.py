@@ -5,8 +5,9 @@ from utils.logger import (
     redact_sensitive_log_data,
 )
 from utils.config_loader import CONFIG_MANAGER
-from utils.wait_for_url import wait_for_urls
+from utils.wait_for_url import record_service_readiness, wait_for_urls
 from utils.notifications import notify_event
+from utils.process_registry import ProcessRegistry, normalize_process_name
 from utils.service_health import ServiceHealthMonitor
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
@@ -14,6 +15,8 @@ import shlex, os, time, signal, threading, subprocess, sys, uvicorn, socket, psu
 from json import dump
 
 STARTUP_TERMINAL_PHASES = {"ready", "degraded", "shutting_down"}
+READY_HEALTH_STATUSES = {"healthy", "degraded"}
+HEALTH_PROBE_WORKERS = 8
 
 
 def _immediate_exit_summary(stdout_output: str, stderr_output: str) -> str | None:
@@ -93,16 +96,24 @@ class ProcessHandler:
         self.startup_completed_at = None
         self.startup_expected_services = set()
         self.startup_failures = {}
+        self.startup_critical_path = []
         self.startup_lock = threading.RLock()
         self.startup_complete_event = threading.Event()
         self.startup_state_path = "/healthcheck/startup_state.json"
-        self.service_health_monitor = ServiceHealthMonitor(logger=logger)
+        self.service_health_monitor = ServiceHealthMonitor(
+            logger=logger, pool_size=HEALTH_PROBE_WORKERS
+        )
+        self.status_listeners = []
+        self.health_statuses = {}
+        self.health_statuses_lock = threading.Lock()
+        self.process_registry = ProcessRegistry(logger=logger)
+        self.process_registry.flush()
         self.media_protection_manager = None
         self._write_startup_state()
 
     @staticmethod
     def _normalize_process_name(name):
-        return str(name or "").replace(" ", "").replace("/ ", "/").strip().lower()
+        return normalize_process_name(name)
 
     def _write_startup_state(self):
         with self.startup_lock:
@@ -142,6 +153,10 @@ class ProcessHandler:
             }
         self._write_startup_state()
 
+    def set_startup_critical_path(self, critical_path):
+        with self.startup_lock:
+            self.startup_critical_path = list(critical_path or [])
+
     def is_startup_complete(self):
         return self.startup_complete_event.is_set()
 
@@ -165,6 +180,7 @@ class ProcessHandler:
             failures = dict(self.startup_failures)
             started_at = self.startup_started_at
             completed_at = self.startup_completed_at
+            critical_path = list(self.startup_critical_path)
         services = {name: self.get_service_readiness(name) for name in expected}
         return {
             "phase": phase,
@@ -174,6 +190,7 @@ class ProcessHandler:
             "expected_services": expected,
             "services": services,
             "failures": failures,
+            "critical_path": critical_path,
         }
 
     def _find_process_entry(self, process_name):
@@ -186,18 +203,17 @@ class ProcessHandler:
                 return pid, None
         return None, None
 
-    def get_service_readiness(self, process_name):
+    def get_service_readiness(self, process_name, fresh=False):
         pid, process = self._find_process_entry(process_name)
         if not pid:
             return {"state": "pending", "reason": "Process has not started."}
         if process is not None and process.poll() is not None:
             return {"state": "failed", "reason": "Process exited during startup."}
-        health = self.get_process_health(process_name, pid)
+        health = self.get_process_health(process_name, pid, fresh=fresh)
         health_status = health["status"]
+        ready = health_status in READY_HEALTH_STATUSES
         return {
-            "state": (
-                "ready" if health_status in {"healthy", "degraded"} else "starting"
-            ),
+            "state": "ready" if ready else "starting",
             "reason": health["reason"],
             "health_status": health_status,
             "health_details": health.get("details"),
@@ -319,15 +335,20 @@ class ProcessHandler:
         }
         if self.external_processes:
             running_processes.update(self.external_processes)
-        file_path = "/healthcheck/running_processes.json"
-        directory = os.path.dirname(file_path)
+        if self.process_registry.replace(running_processes):
+            self._emit_status_change(None, "processes")
 
-        try:
-            os.makedirs(directory, exist_ok=True)
-            with open(file_path, "w") as f:
-                dump(running_processes, f)
-        except Exception as e:
-            self.logger.error(f"Failed to write running processes file: {e}")
+    def add_status_listener(self, callback):
+        """Call ``callback(process_name, event)`` on start/stop and health changes."""
+        if callback not in self.status_listeners:
+            self.status_listeners.append(callback)
+
+    def _emit_status_change(self, process_name, event):
+        for callback in list(self.status_listeners):
+            try:
+                callback(process_name, event)
+            except Exception as error:
+                self.logger.debug("Status listener failed for %s: %s", event, error)
 
     def register_external_process(self, process_name, pid):
         if not process_name or not pid:
@@ -559,7 +580,6 @@ class ProcessHandler:
                             process_name,
                             ", ".join(url_list),
                         )
-                    time.sleep(5)
                     result, error = wait_for_urls(
                         wait_urls,
                         process_name,
@@ -1506,7 +1526,11 @@ class ProcessHandler:
                     except Exception as e:
                         self.logger.error("Error stopping %s: %s", name, e)
         self._update_running_processes_file()
+        self.process_registry.flush()
         self.shutdown_threads()
+        monitor = getattr(self, "service_health_monitor", None)
+        if monitor is not None:
+            monitor.close()
         time.sleep(5)
         self.unmount_all()
         uvicorn.Server.should_exit = True
@@ -1542,52 +1566,73 @@ class ProcessHandler:
 
         def monitor():
             monitor_started_at = None
-            while not self.shutting_down:
-                if not self.wait_for_startup_complete(timeout=5):
-                    continue
-                monitor_started_at = monitor_started_at or time.time()
-                cfg = self._get_auto_restart_config()
-                if not cfg.get("enabled", False):
-                    time.sleep(5)
-                    continue
-                default_grace_period = cfg.get("grace_period_seconds", 30)
-                for process_name, process in list(self.process_names.items()):
-                    if self.shutting_down:
-                        break
-                    policy = self._get_service_restart_policy(process_name)
-                    if not policy:
-                        continue
-                    if not policy.get("restart_on_unhealthy", True):
-                        continue
-                    if self._is_restart_disabled(process_name):
-                        continue
-                    if not process or process.poll() is not None:
-                        continue
-                    grace_period = policy.get(
-                        "grace_period_seconds", default_grace_period
-                    )
-                    if not self._is_ready_for_healthcheck(
-                        process_name, grace_period, monitor_started_at
-                    ):
+            in_flight = {}
+            executor = ThreadPoolExecutor(
+                max_workers=HEALTH_PROBE_WORKERS, thread_name_prefix="health-probe"
+            )
+            try:
+                while not self.shutting_down:
+                    if not self.wait_for_startup_complete(timeout=5):
                         continue
-                    if not self._is_healthcheck_due(process_name, policy):
+                    monitor_started_at = monitor_started_at or time.time()
+                    cfg = self._get_auto_restart_config()
+                    if not cfg.get("enabled", False):
+                        time.sleep(5)
                         continue
-                    healthy, reason = self._check_process_health(
-                        process_name, process.pid
-                    )
-                    should_restart = self._record_healthcheck_result(
-                        process_name, healthy, reason, policy
-                    )
-                    self._set_last_healthcheck_time(process_name)
-                    if should_restart and reason:
-                        self._maybe_schedule_restart(process_name, reason)
-                time.sleep(5)
+                    default_grace_period = cfg.get("grace_period_seconds", 30)
+                    in_flight = {
+                        name: future
+                        for name, future in in_flight.items()
+                        if not future.done()
+                    }
+                    for process_name, process in list(self.process_names.items()):
+                        if self.shutting_down:
+                            break
+                        policy = self._get_service_restart_policy(process_name)
+                        if not policy:
+                            continue
+                        if not policy.get("restart_on_unhealthy", True):
+                            continue
+                        if self._is_restart_disabled(process_name):
+                            continue
+                        if not process or process.poll() is not None:
+                            continue
+                        grace_period = policy.get(
+                            "grace_period_seconds", default_grace_period
+                        )
+                        if not self._is_ready_for_healthcheck(
+                            process_name, grace_period, monitor_started_at
+                        ):
+                            continue
+                        if process_name in in_flight:
+                            continue
+                        if not self._is_healthcheck_due(process_name, policy):
+                            continue
+                        in_flight[process_name] = executor.submit(
+                            self._run_healthcheck, process_name, process.pid, policy
+                        )
+                    time.sleep(5)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         self.auto_restart_thread = threading.Thread(
             target=monitor, daemon=True, name="auto-restart-monitor"
         )
         self.auto_restart_thread.start()
 
+    def _run_healthcheck(self, process_name, pid, policy):
+        """Probe one service on the health pool and act on the result."""
+        try:
+            healthy, reason = self._check_process_health(process_name, pid)
+            should_restart = self._record_healthcheck_result(
+                process_name, healthy, reason, policy
+            )
+            self._set_last_healthcheck_time(process_name)
+            if should_restart and reason:
+                self._maybe_schedule_restart(process_name, reason)
+        except Exception as error:
+            self.logger.error("Health check for %s failed: %s", process_name, error)
+
     def _get_auto_restart_config(self):
         cfg = CONFIG_MANAGER.get("dumb", {}).get("auto_restart", {}) or {}
         defaults = {
@@ -1671,8 +1716,10 @@ class ProcessHandler:
     def _record_healthcheck_result(self, process_name, healthy, reason, policy):
         if healthy:
             recovered_restart = False
+            record_service_readiness(self._normalize_process_name(process_name), True)
             with self.auto_restart_lock:
                 state = self._get_restart_state(process_name)
+                previous_state = state.get("readiness_state")
                 state["unhealthy_count"] = 0
                 state["readiness_state"] = "ready"
                 state["ready_at"] = state.get("ready_at") or time.time()
@@ -1682,6 +1729,8 @@ class ProcessHandler:
                     state["last_restart_time"] = time.time()
                     state["last_failure_reason"] = None
                     recovered_restart = True
+            if previous_state != "ready":
+                self._emit_status_change(process_name, "health")
             if recovered_restart:
                 self.logger.warning(
                     "Auto-restart recovery verified healthy for %s.", process_name
@@ -1698,10 +1747,12 @@ class ProcessHandler:
         threshold = policy.get("unhealthy_threshold", 3)
         with self.auto_restart_lock:
             state = self._get_restart_state(process_name)
+            health_changed = state.get("readiness_state") != "unhealthy"
             state["readiness_state"] = "unhealthy"
             state["unhealthy_count"] += 1
             count = state["unhealthy_count"]
-            if count >= threshold:
+            should_restart = count >= threshold
+            if should_restart:
                 state["unhealthy_count"] = 0
                 if state.get("awaiting_recovery"):
                     state["awaiting_recovery"] = False
@@ -1715,8 +1766,9 @@ class ProcessHandler:
                     service_name=process_name,
                     metadata={"unhealthy_threshold": threshold},
                 )
-                return True
-        return False
+        if health_changed:
+            self._emit_status_change(process_name, "health")
+        return should_restart
 
     def _reset_healthcheck_state(self, process_name):
         with self.auto_restart_lock:
@@ -1928,7 +1980,26 @@ class ProcessHandler:
         health = self.get_process_health(process_name, pid)
         return health["status"] != "unhealthy", health["reason"]
 
-    def get_process_health(self, process_name, pid):
+    def get_process_health(self, process_name, pid, fresh=False):
+        """Probe ``process_name`` and publish readiness transitions to waiters.
+
+        A status that differs from this process's previous probe is also
+        reported to status listeners. ``fresh`` skips cached results that are
+        not yet healthy.
+        """
+        health = self._probe_process_health(process_name, pid, fresh)
+        record_service_readiness(
+            self._normalize_process_name(process_name),
+            health["status"] in READY_HEALTH_STATUSES,
+        )
+        with self.health_statuses_lock:
+            previous = self.health_statuses.get(process_name)
+            self.health_statuses[process_name] = health["status"]
+        if previous is not None and previous != health["status"]:
+            self._emit_status_change(process_name, "health")
+        return health
+
+    def _probe_process_health(self, process_name, pid, fresh=False):
         if not pid or not psutil.pid_exists(pid):
             return {
                 "status": "unhealthy",
@@ -1963,10 +2034,19 @@ class ProcessHandler:
                 "details": {"probe": "process"},
             }
 
+        monitor = getattr(self, "service_health_monitor", None)
+        if monitor is None:
+            monitor = ServiceHealthMonitor(
+                logger=getattr(self, "logger", None), pool_size=HEALTH_PROBE_WORKERS
+            )
+            self.service_health_monitor = monitor
         host = self._normalize_host(config.get("host"))
         ports = self._collect_config_ports(config)
         for port in ports:
-            if not self._is_port_open(host, port):
+            started = time.monotonic()
+            port_open = self._is_port_open(host, port)
+            monitor.record_latency(process_name, "port", time.monotonic() - started)
+            if not port_open:
                 return {
                     "status": "unhealthy",
                     "healthy": False,
@@ -1978,16 +2058,13 @@ class ProcessHandler:
                     },
                 }
 
-        monitor = getattr(self, "service_health_monitor", None)
-        if monitor is None:
-            monitor = ServiceHealthMonitor(logger=getattr(self, "logger", None))
-            self.service_health_monitor = monitor
         try:
             application_health = monitor.check(
                 config_key,
                 process_name,
                 config,
                 process_identity=pid,
+                fresh=fresh,
             )
         except Exception as error:
             self.logger.warning(
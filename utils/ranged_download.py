@@ -0,0 +1,353 @@
+"""Segmented HTTP downloads with resume and SHA-256 verification.
+
+A download starts with a probe for the first segment. Servers that answer
+``206 Partial Content`` are fetched in fixed-size segments over several
+connections; servers that ignore ``Range`` fall back to one streamed body.
+Segment progress is recorded next to the partial file so a failed attempt or
+a container restart continues where it stopped instead of at byte 0.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from utils.install_cache import CHUNK_SIZE, _install_cache_config, sha256_file
+
+DEFAULT_CONNECTIONS = 4
+DEFAULT_SEGMENT_MB = 16
+STATE_VERSION = 1
+_CONTENT_RANGE_PATTERN = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+class RangedDownloadError(RuntimeError):
+    pass
+
+
+class DownloadTooLarge(RangedDownloadError):
+    pass
+
+
+class DigestMismatch(RangedDownloadError):
+    pass
+
+
+class SizeMismatch(DigestMismatch):
+    pass
+
+
+class RangeNotHonoured(RangedDownloadError):
+    pass
+
+
+def download_settings() -> tuple[int, int]:
+    """Return ``(connections, segment_bytes)`` from the install-cache config."""
+    config = _install_cache_config()
+    try:
+        connections = int(config.get("download_connections", DEFAULT_CONNECTIONS))
+    except (TypeError, ValueError):
+        connections = DEFAULT_CONNECTIONS
+    try:
+        segment_mb = float(config.get("download_segment_mb", DEFAULT_SEGMENT_MB))
+    except (TypeError, ValueError):
+        segment_mb = DEFAULT_SEGMENT_MB
+    return max(1, min(connections, 16)), max(1, int(segment_mb * 1024 * 1024))
+
+
+def probe_range(segment_bytes: int) -> str:
+    return f"bytes=0-{segment_bytes - 1}"
+
+
+def state_path(part_path: str | Path) -> Path:
+    part = Path(part_path)
+    return part.with_name(f"{part.name}.json")
+
+
+def _content_range(response) -> tuple[int, int, int] | None:
+    match = _CONTENT_RANGE_PATTERN.match(
+        str(response.headers.get("Content-Range") or "").strip()
+    )
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def _validator(response) -> str:
+    etag = str(response.headers.get("ETag") or "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return str(response.headers.get("Last-Modified") or "")
+
+
+class SegmentedDownload:
+    """Download one resource into ``part_path``.
+
+    ``open_range(start, end, validator)`` must return a streamed response for
+    the inclusive byte range, sending ``If-Range: validator`` when one is
+    given. ``identity`` (usually the URL) and the server validator decide
+    whether recorded progress may be reused. Without a validator progress is
+    only resumed when ``expected_sha256`` will catch a changed resource.
+    """
+
+    def __init__(
+        self,
+        open_range: Callable,
+        part_path: str | Path,
+        *,
+        identity: str,
+        expected_sha256: str | None = None,
+        expected_size: int | None = None,
+        max_bytes: int | None = None,
+        connections: int = DEFAULT_CONNECTIONS,
+        segment_bytes: int = DEFAULT_SEGMENT_MB * 1024 * 1024,
+        max_retries: int = 3,
+    ):
+        self.open_range = open_range
+        self.part_path = Path(part_path)
+        self.state_path = state_path(self.part_path)
+        self.identity = identity
+        self.expected_sha256 = (
+            str(expected_sha256 or "").lower().removeprefix("sha256:") or None
+        )
+        self.expected_size = expected_size or None
+        self.max_bytes = max_bytes
+        self.connections = max(1, int(connections))
+        self.segment_bytes = max(1, int(segment_bytes))
+        self.max_retries = max(1, int(max_retries))
+        self.size = 0
+        self.validator = ""
+        self.resumed_bytes = 0
+        self._progress: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def run(self, response) -> str:
+        """Complete the download from the probe ``response``; return its digest.
+
+        ``response`` answers a request for ``probe_range(segment_bytes)``.
+        Transient failures leave the partial file and its progress in place
+        for the next attempt; size and digest failures discard both.
+        """
+        try:
+            if response.status_code != 206 or _content_range(response) is None:
+                return self._stream_single(response)
+            return self._run_segments(response)
+        except (DownloadTooLarge, DigestMismatch, RangeNotHonoured):
+            self.discard()
+            raise
+
+    def discard(self) -> None:
+        for path in (self.part_path, self.state_path):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _check_size(self, size: int) -> None:
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise DownloadTooLarge("Download exceeds the configured size limit.")
+        if self.expected_size and size != self.expected_size:
+            raise SizeMismatch("Download size does not match the expected size.")
+
+    def _verify(self, digest: str) -> str:
+        if self.expected_sha256 and digest != self.expected_sha256:
+            raise DigestMismatch("Download failed its SHA-256 verification.")
+        return digest
+
+    def _stream_single(self, response) -> str:
+        """Fallback for servers that ignore ``Range``: one hashed stream."""
+        self.discard()
+        content_length = response.headers.get("Content-Length")
+        try:
+            if content_length:
+                self._check_size(int(content_length))
+        except (TypeError, ValueError):
+            pass
+        digest = hashlib.sha256()
+        size = 0
+        self.part_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self.part_path, "wb") as handle:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    size += len(chunk)
+                    if self.max_bytes is not None and size > self.max_bytes:
+                        raise DownloadTooLarge(
+                            "Download exceeds the configured size limit."
+                        )
+                    digest.update(chunk)
+                    handle.write(chunk)
+                handle.flush()
+                os.fsync(handle.fileno())
+        finally:
+            response.close()
+        self._check_size(size)
+        self.size = size
+        return self._verify(digest.hexdigest())
+
+    def _run_segments(self, response) -> str:
+        _start, _end, self.size = _content_range(response)
+        try:
+            self._check_size(self.size)
+        except RangedDownloadError:
+            response.close()
+            raise
+        self.validator = _validator(response)
+        self._prepare()
+        segments = range((self.size + self.segment_bytes - 1) // self.segment_bytes)
+        pending = [index for index in segments if not self._complete(index)]
+        if 0 in pending and not self._progress.get(0):
+            pending.remove(0)
+            first = [(0, response)]
+        else:
+            response.close()
+            first = []
+        workers = min(self.connections, len(pending) + len(first)) or 1
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._fetch_segment, index, initial)
+                    for index, initial in first
+                ]
+                futures += [
+                    executor.submit(self._fetch_segment, index, None)
+                    for index in pending
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            self._save_state()
+        digest = self._verify(sha256_file(self.part_path))
+        self.state_path.unlink(missing_ok=True)
+        return digest
+
+    def _prepare(self) -> None:
+        """Reuse matching progress or allocate a fresh sparse partial file."""
+        state = None
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as handle:
+                state = json.load(handle)
+        except (OSError, ValueError):
+            pass
+        reusable = (
+            isinstance(state, dict)
+            and state.get("version") == STATE_VERSION
+            and state.get("identity") == self.identity
+            and state.get("size") == self.size
+            and state.get("segment_bytes") == self.segment_bytes
+            and state.get("validator") == self.validator
+            and (self.validator or self.expected_sha256)
+            and self.part_path.is_file()
+            and self.part_path.stat().st_size == self.size
+        )
+        if reusable:
+            try:
+                self._progress = {
+                    int(index): int(done)
+                    for index, done in dict(state.get("progress") or {}).items()
+                }
+            except (TypeError, ValueError):
+                reusable = False
+        if not reusable:
+            self._progress = {}
+            self.discard()
+            self.part_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.part_path, "wb") as handle:
+                handle.truncate(self.size)
+        self.resumed_bytes = sum(self._progress.values())
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        start = index * self.segment_bytes
+        return start, min(start + self.segment_bytes, self.size) - 1
+
+    def _complete(self, index: int) -> bool:
+        start, end = self._bounds(index)
+        return self._progress.get(index, 0) >= end - start + 1
+
+    def _save_state(self) -> None:
+        with self._lock:
+            payload = {
+                "version": STATE_VERSION,
+                "identity": self.identity,
+                "size": self.size,
+                "segment_bytes": self.segment_bytes,
+                "validator": self.validator,
+                "progress": {
+                    str(index): done for index, done in self._progress.items()
+                },
+            }
+            temporary = self.state_path.with_name(f"{self.state_path.name}.tmp")
+            try:
+                with open(temporary, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle, separators=(",", ":"))
+                os.replace(temporary, self.state_path)
+            except OSError:
+                temporary.unlink(missing_ok=True)
+
+    def _fetch_segment(self, index: int, response=None) -> None:
+        start, end = self._bounds(index)
+        last_error = None
+        for attempt in range(self.max_retries):
+            offset = start + self._progress.get(index, 0)
+            if offset > end:
+                return
+            try:
+                if response is None:
+                    response = self.open_range(offset, end, self.validator)
+                if response is None:
+                    raise OSError("no response")
+                offset = self._write_segment(index, response, offset, end)
+            except RangedDownloadError:
+                raise
+            except Exception as error:
+                last_error = error
+            finally:
+                response = None
+            if offset > end:
+                self._save_state()
+                return
+            self._save_state()
+            if attempt + 1 < self.max_retries:
+                time.sleep(min(2**attempt, 10))
+        raise RangedDownloadError(
+            f"Download segment {index} failed after {self.max_retries} attempts: "
+            f"{last_error or 'connection closed early'}"
+        )
+
+    def _write_segment(self, index: int, response, offset: int, end: int) -> int:
+        start = index * self.segment_bytes
+        try:
+            content_range = _content_range(response)
+            if response.status_code != 206 or content_range is None:
+                raise RangeNotHonoured(
+                    "Server stopped honouring byte ranges; the download restarts."
+                )
+            if content_range[0] != offset or content_range[2] != self.size:
+                raise RangeNotHonoured("Server returned an unexpected byte range.")
+            with open(self.part_path, "r+b") as handle:
+                handle.seek(offset)
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    chunk = chunk[: end + 1 - offset]
+                    handle.write(chunk)
+                    offset += len(chunk)
+                    with self._lock:
+                        self._progress[index] = offset - start
+                    if offset > end:
+                        break
+        finally:
+            response.close()
+        return offset
@@ -14,12 +14,15 @@ import subprocess
 import threading
 import time
 from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any
 
 import requests
 
+PROBE_POOL_SIZE = 8
 MAX_RESPONSE_BYTES = 64 * 1024
 MAX_COMPONENTS = 12
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
 
 HEALTHY_STATES = {
     "available",
@@ -218,6 +221,43 @@ def _combine_payload_status(
     return None
 
 
+class LatencyHistogram:
+    """Cumulative probe latency counts over ``LATENCY_BUCKETS_MS``."""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = None
+
+    def observe(self, latency_ms: float) -> None:
+        index = len(LATENCY_BUCKETS_MS)
+        for position, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                index = position
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+        self.last_ms = latency_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        buckets = []
+        cumulative = 0
+        for bound, count in zip((*LATENCY_BUCKETS_MS, None), self.counts):
+            cumulative += count
+            buckets.append({"le_ms": bound, "count": cumulative})
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "max_ms": round(self.max_ms, 1),
+            "last_ms": round(self.last_ms, 1) if self.last_ms is not None else None,
+            "buckets": buckets,
+        }
+
+
 def _result(
     status: str,
     reason: str | None,
@@ -234,12 +274,60 @@ def _result(
 class ServiceHealthMonitor:
     """Runs and briefly caches safe application-level service probes."""
 
-    def __init__(self, logger=None, cache_ttl_seconds=10, timeout_seconds=2.5):
+    def __init__(
+        self,
+        logger=None,
+        cache_ttl_seconds=10,
+        timeout_seconds=2.5,
+        pool_size=PROBE_POOL_SIZE,
+    ):
         self.logger = logger
         self.cache_ttl_seconds = max(0.0, float(cache_ttl_seconds))
         self.timeout_seconds = max(0.25, float(timeout_seconds))
+        self.pool_size = max(1, int(pool_size))
         self._cache: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
         self._cache_lock = threading.Lock()
+        self._http_session: requests.Session | None = None
+        self._session_lock = threading.Lock()
+        self._latency: dict[tuple[str, str], LatencyHistogram] = {}
+        self._latency_lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        """Return the keep-alive session shared by all probing threads."""
+        with self._session_lock:
+            if self._http_session is None:
+                session = requests.Session()
+                # Every service answers on 127.0.0.1, so a stored cookie from one
+                # would be replayed to the others; probes stay stateless instead.
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._http_session = session
+            return self._http_session
+
+    def close(self) -> None:
+        """Close pooled probe connections; a later probe opens a new session."""
+        with self._session_lock:
+            session, self._http_session = self._http_session, None
+        if session is not None:
+            session.close()
+
+    def record_latency(self, process_name: str, probe: str, seconds: float) -> None:
+        with self._latency_lock:
+            histogram = self._latency.get((process_name, probe))
+            if histogram is None:
+                histogram = self._latency[(process_name, probe)] = LatencyHistogram()
+            histogram.observe(max(0.0, seconds) * 1000)
+
+    def latency_snapshot(self) -> dict[str, Any]:
+        """Return per-service, per-probe latency histograms in milliseconds."""
+        with self._latency_lock:
+            items = sorted(self._latency.items())
+            services: dict[str, dict[str, Any]] = {}
+            for (process_name, probe), histogram in items:
+                services.setdefault(process_name, {})[probe] = histogram.snapshot()
+        return {"bucket_bounds_ms": list(LATENCY_BUCKETS_MS), "services": services}
 
     def check(
         self,
@@ -247,7 +335,13 @@ class ServiceHealthMonitor:
         process_name: str,
         config: dict[str, Any] | None,
         process_identity: Any = None,
+        fresh: bool = False,
     ) -> dict[str, Any] | None:
+        """Return the probe result for a service, cached for ``cache_ttl_seconds``.
+
+        With ``fresh`` only a cached healthy or degraded result is reused, so a
+        caller waiting for readiness never sees a stale "starting" answer.
+        """
         key = str(config_key or "").strip().lower()
         config = config if isinstance(config, dict) else {}
         probe = self._resolve_probe(key, config)
@@ -263,13 +357,18 @@ class ServiceHealthMonitor:
         now = time.monotonic()
         with self._cache_lock:
             cached = self._cache.get(cache_key)
-            if cached and now - cached[0] < self.cache_ttl_seconds:
+            if (
+                cached
+                and now - cached[0] < self.cache_ttl_seconds
+                and (not fresh or cached[1].get("status") in {"healthy", "degraded"})
+            ):
                 return cached[1]
 
         if probe["kind"] == "postgres":
             result = self._probe_postgres(process_name, config)
         else:
             result = self._probe_http(process_name, probe)
+        self.record_latency(process_name, probe["kind"], time.monotonic() - now)
 
         with self._cache_lock:
             self._cache[cache_key] = (now, result)
@@ -415,7 +514,7 @@ class ServiceHealthMonitor:
         }
         url = f"http://127.0.0.1:{probe['port']}{probe['path']}"
         try:
-            with requests.request(
+            with self._session().request(
                 probe["method"],
                 url,
                 auth=probe.get("auth"),
@@ -1,6 +1,8 @@
 import json
 import os
 import shlex
+import threading
+import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -191,3 +193,158 @@ def run_migration_aware_preinstall(
             "the already-installed legacy topology; service preinstall was skipped.",
         )
     return run_grouped_preinstall(targets, install_target, max_workers), None
+
+
+def run_dependency_startup(
+    keys: list[str],
+    dependencies: dict[str, set[str]],
+    start_key: Callable[[str], bool],
+    readiness: Callable[[str], str],
+    *,
+    shutting_down: Callable[[], bool] = lambda: False,
+    ready_timeout: float = 120,
+    poll_interval: float = 0.25,
+    max_poll_interval: float = 2.0,
+    readiness_generation: Callable[[], object] | None = None,
+    wait_for_readiness: Callable[[object, float], bool] | None = None,
+    max_workers: int | None = None,
+) -> tuple[dict[str, str], dict[str, dict]]:
+    """Start ``keys`` as a DAG whose edges fire on upstream readiness.
+
+    A key is launched as soon as every upstream in ``dependencies`` has been
+    released. An upstream is released when ``readiness(key)`` reports
+    ``"ready"`` or ``"failed"``, when its launch fails, or after
+    ``ready_timeout`` seconds (``0`` releases on launch).
+
+    Each key that gates another key gets its own watcher thread, so a slow
+    readiness probe only delays that key's dependents. A watcher re-probes as
+    soon as ``wait_for_readiness(generation, timeout)`` reports a readiness
+    notification newer than ``readiness_generation()``, and otherwise backs
+    off from ``poll_interval`` to ``max_poll_interval``.
+
+    Returns ``(failures, timeline)``; the timeline holds monotonic
+    ``started``/``launched``/``released`` times and how each key was
+    released, for ``startup_critical_path``.
+    """
+    key_set = set(keys)
+    deps = {key: set(dependencies.get(key, set())) & key_set for key in keys}
+    gating = {dep for upstream in deps.values() for dep in upstream}
+    pending = set(keys)
+    launching = {}
+    awaiting = {}
+    released = set()
+    failures = {}
+    timeline = {key: {"depends_on": sorted(deps[key])} for key in keys}
+    wake = threading.Event()
+
+    def release(key: str, reason: str) -> None:
+        released.add(key)
+        timeline[key]["released"] = time.monotonic()
+        timeline[key]["released_by"] = reason
+
+    def watch(key: str, launched_at: float) -> str | None:
+        backoff = poll_interval
+        while not shutting_down():
+            generation = readiness_generation() if readiness_generation else None
+            state = readiness(key)
+            if state in {"ready", "failed"}:
+                return state
+            remaining = launched_at + ready_timeout - time.monotonic()
+            if remaining <= 0:
+                return "timeout"
+            delay = min(backoff, remaining)
+            if wait_for_readiness is None:
+                time.sleep(delay)
+            elif wait_for_readiness(generation, delay):
+                backoff = poll_interval
+                continue
+            backoff = min(max_poll_interval, backoff * 1.5)
+        return None
+
+    with (
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ThreadPoolExecutor(
+            max_workers=max(1, len(gating)), thread_name_prefix="startup-readiness"
+        ) as watchers,
+    ):
+        while pending or launching or awaiting:
+            wake.clear()
+            if shutting_down():
+                for future in launching:
+                    future.cancel()
+                break
+            for key in sorted(pending):
+                if deps[key] <= released:
+                    pending.discard(key)
+                    timeline[key]["started"] = time.monotonic()
+                    future = executor.submit(start_key, key)
+                    launching[future] = key
+                    future.add_done_callback(lambda _future: wake.set())
+            if pending and not launching and not awaiting:
+                raise RuntimeError(
+                    f"Dependency resolution stalled. Remaining: {sorted(pending)}"
+                )
+
+            for future in [future for future in launching if future.done()]:
+                key = launching.pop(future)
+                timeline[key]["launched"] = time.monotonic()
+                try:
+                    if not future.result():
+                        failures[key] = (
+                            "One or more configured processes failed to start."
+                        )
+                except Exception as e:
+                    failures[key] = str(e)
+                if key in failures:
+                    release(key, "failed")
+                elif key not in gating or ready_timeout <= 0:
+                    release(key, "launched")
+                else:
+                    watcher = watchers.submit(watch, key, timeline[key]["launched"])
+                    awaiting[watcher] = key
+                    watcher.add_done_callback(lambda _future: wake.set())
+
+            for watcher in [watcher for watcher in awaiting if watcher.done()]:
+                key = awaiting.pop(watcher)
+                state = watcher.result()
+                if state is not None:
+                    release(key, state)
+            if any(deps[key] <= released for key in pending):
+                continue
+            if launching or awaiting:
+                wake.wait()
+    return failures, timeline
+
+
+def startup_critical_path(timeline: dict[str, dict]) -> list[dict]:
+    """Return the chain of keys that determined when the last key launched.
+
+    Starting from the key that finished last, each step follows the upstream
+    released last, i.e. the one the key actually waited for.
+    """
+    finished = {
+        key: entry.get("released", entry.get("launched"))
+        for key, entry in timeline.items()
+        if "started" in entry
+    }
+    if not finished:
+        return []
+    origin = min(timeline[key]["started"] for key in finished)
+    key = max(finished, key=lambda name: finished[name] or 0)
+    path = []
+    while key is not None:
+        entry = timeline[key]
+        launched = entry.get("launched", entry["started"])
+        path.append(
+            {
+                "key": key,
+                "started_at": round(entry["started"] - origin, 3),
+                "launch_seconds": round(launched - entry["started"], 3),
+                "ready_seconds": round(entry.get("released", launched) - launched, 3),
+                "released_by": entry.get("released_by"),
+            }
+        )
+        upstream = [dep for dep in entry["depends_on"] if "released" in timeline[dep]]
+        key = max(upstream, key=lambda dep: timeline[dep]["released"], default=None)
+    path.reverse()
+    return path
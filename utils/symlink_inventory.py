@@ -0,0 +1,263 @@
+"""Persistent SQLite index of the symlinks under the library roots.
+
+Walking 200k+ symlinks and stat-ing their targets over rclone/FUSE on every
+repair, backup, or preview takes minutes. The inventory remembers each
+directory's mtime and only re-reads directories whose mtime changed (a link
+created, removed, or replaced always bumps its parent directory's mtime), so an
+unchanged tree costs one local ``stat`` per directory. Target existence is
+cached per link with a ``checked_at`` timestamp and re-probed when the link
+target changes or the result is older than ``TARGET_STATUS_MAX_AGE_SECONDS``.
+"Missing" results expire after ``TARGET_MISSING_MAX_AGE_SECONDS`` instead, so a
+mount that was down or still starting is not reported as broken for an hour.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable
+
+DEFAULT_SYMLINK_INVENTORY_PATH = "/config/symlink-inventory.db"
+SYMLINK_INVENTORY_PATH_ENV = "DUMB_SYMLINK_INVENTORY_PATH"
+TARGET_STATUS_MAX_AGE_SECONDS = 3600
+TARGET_MISSING_MAX_AGE_SECONDS = 60
+# Directories modified this recently may still change within the same mtime
+# tick, so their mtime is not trusted and they are re-read on the next scan.
+RACY_MTIME_SECONDS = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS directories (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER
+);
+CREATE INDEX IF NOT EXISTS directories_parent ON directories (parent);
+CREATE TABLE IF NOT EXISTS symlinks (
+    link_path TEXT PRIMARY KEY,
+    directory TEXT NOT NULL,
+    target TEXT NOT NULL,
+    target_exists INTEGER,
+    checked_at REAL
+);
+CREATE INDEX IF NOT EXISTS symlinks_directory ON symlinks (directory);
+"""
+
+
+def normalize_root(root: str) -> str:
+    return os.path.normpath(root) if root else root
+
+
+def _subtree_bounds(path: str) -> tuple[str, str]:
+    # Every descendant path sorts between "<path>/" and "<path>0" because "0"
+    # is the character after "/".
+    prefix = path.rstrip("/")
+    return f"{prefix}/", f"{prefix}0"
+
+
+class SymlinkInventory:
+    def __init__(self, path: str | None = None, logger=None):
+        self.path = path or ":memory:"
+        self.logger = logger
+        self._lock = threading.RLock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False
+        )
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def refresh(self, roots: list[str]) -> dict:
+        """Bring the index up to date for ``roots``; return scan statistics."""
+        stats = {"missing_roots": [], "directories": 0, "rescanned_directories": 0}
+        with self._lock:
+            for root in roots:
+                root = normalize_root(root)
+                with self._connection:
+                    if not os.path.exists(root):
+                        stats["missing_roots"].append(root)
+                        self._forget_subtree(root)
+                        continue
+                    self._refresh_root(root, stats)
+        return stats
+
+    def links(self, roots: list[str]) -> list[tuple[str, str]]:
+        """Return ``(link_path, target)`` for every indexed link under ``roots``."""
+        found: dict[str, str] = {}
+        with self._lock:
+            for root in roots:
+                lower, upper = _subtree_bounds(normalize_root(root))
+                for link_path, target in self._connection.execute(
+                    "SELECT link_path, target FROM symlinks "
+                    "WHERE link_path >= ? AND link_path < ? ORDER BY link_path",
+                    (lower, upper),
+                ):
+                    found.setdefault(link_path, target)
+        return sorted(found.items())
+
+    def lookup(self, link_path: str) -> str | None:
+        """Return the indexed target of ``link_path``, or None if not indexed."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT target FROM symlinks WHERE link_path = ?", (link_path,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def target_exists(
+        self,
+        link_path: str,
+        target: str,
+        probe: Callable[[str, str], bool],
+        max_age: float = TARGET_STATUS_MAX_AGE_SECONDS,
+        missing_max_age: float = TARGET_MISSING_MAX_AGE_SECONDS,
+    ) -> bool:
+        """Return whether ``target`` exists, probing only when the cache is stale."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT target, target_exists, checked_at FROM symlinks "
+                "WHERE link_path = ?",
+                (link_path,),
+            ).fetchone()
+        if (
+            row is not None
+            and row[0] == target
+            and row[1] is not None
+            and row[2] is not None
+            and now - row[2] < (max_age if row[1] else missing_max_age)
+        ):
+            return bool(row[1])
+        exists = bool(probe(link_path, target))
+        if row is not None and row[0] == target:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "UPDATE symlinks SET target_exists = ?, checked_at = ? "
+                    "WHERE link_path = ? AND target = ?",
+                    (int(exists), now, link_path, target),
+                )
+        return exists
+
+    def _refresh_root(self, root: str, stats: dict) -> None:
+        pending = [(root, None)]
+        while pending:
+            directory, parent = pending.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                self._forget_subtree(directory)
+                continue
+            stats["directories"] += 1
+            row = self._connection.execute(
+                "SELECT mtime_ns FROM directories WHERE path = ?", (directory,)
+            ).fetchone()
+            if row is not None and row[0] == mtime_ns:
+                pending.extend(
+                    (child, directory)
+                    for (child,) in self._connection.execute(
+                        "SELECT path FROM directories WHERE parent = ?", (directory,)
+                    )
+                )
+                continue
+            stats["rescanned_directories"] += 1
+            pending.extend(
+                (child, directory)
+                for child in self._rescan_directory(directory, parent, mtime_ns)
+            )
+
+    def _rescan_directory(
+        self, directory: str, parent: str | None, mtime_ns: int
+    ) -> list[str]:
+        links: dict[str, str] = {}
+        children: list[str] = []
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    if entry.is_symlink():
+                        links[entry.path] = os.readlink(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        children.append(entry.path)
+                except OSError:
+                    continue
+
+        known_children = {
+            child
+            for (child,) in self._connection.execute(
+                "SELECT path FROM directories WHERE parent = ?", (directory,)
+            )
+        }
+        for removed in known_children.difference(children):
+            self._forget_subtree(removed)
+
+        known_links = dict(
+            self._connection.execute(
+                "SELECT link_path, target FROM symlinks WHERE directory = ?",
+                (directory,),
+            )
+        )
+        self._connection.executemany(
+            "DELETE FROM symlinks WHERE link_path = ?",
+            [
+                (link_path,)
+                for link_path, target in known_links.items()
+                if links.get(link_path) != target
+            ],
+        )
+        self._connection.executemany(
+            "INSERT INTO symlinks (link_path, directory, target) VALUES (?, ?, ?)",
+            [
+                (link_path, directory, target)
+                for link_path, target in links.items()
+                if known_links.get(link_path) != target
+            ],
+        )
+
+        trusted = time.time() - mtime_ns / 1e9 >= RACY_MTIME_SECONDS
+        self._connection.execute(
+            "INSERT INTO directories (path, parent, mtime_ns) VALUES (?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET parent = excluded.parent, "
+            "mtime_ns = excluded.mtime_ns",
+            (directory, parent, mtime_ns if trusted else None),
+        )
+        return sorted(children, reverse=True)
+
+    def _forget_subtree(self, path: str) -> None:
+        lower, upper = _subtree_bounds(path)
+        self._connection.execute(
+            "DELETE FROM directories WHERE path = ? OR (path >= ? AND path < ?)",
+            (path, lower, upper),
+        )
+        self._connection.execute(
+            "DELETE FROM symlinks WHERE link_path >= ? AND link_path < ?",
+            (lower, upper),
+        )
+
+
+_inventories: dict[str, SymlinkInventory] = {}
+_inventories_lock = threading.Lock()
+
+
+def open_symlink_inventory(logger=None) -> SymlinkInventory:
+    """Return the shared inventory, falling back to an in-memory index."""
+    path = os.environ.get(SYMLINK_INVENTORY_PATH_ENV) or DEFAULT_SYMLINK_INVENTORY_PATH
+    with _inventories_lock:
+        inventory = _inventories.get(path)
+        if inventory is None:
+            try:
+                inventory = SymlinkInventory(path, logger=logger)
+            except (OSError, sqlite3.Error) as error:
+                if logger:
+                    logger.warning(
+                        "Symlink inventory unavailable at %s (%s); using a "
+                        "temporary in-memory index.",
+                        path,
+                        error,
+                    )
+                inventory = SymlinkInventory(logger=logger)
+            _inventories[path] = inventory
+        return inventory
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from utils.config_loader import CONFIG_MANAGER
 from utils.global_logger import logger
+from utils.symlink_inventory import SymlinkInventory, open_symlink_inventory
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable
@@ -97,24 +98,35 @@ def preset_rewrite_rules(presets: list[str] | None) -> list[RewriteRule]:
     return result
 
 
-def _collect_symlink_paths(roots: list[str]) -> tuple[list[str], list[str]]:
-    paths: list[str] = []
-    missing_roots: list[str] = []
-    for root in roots:
-        if not os.path.exists(root):
-            missing_roots.append(root)
-            continue
-        pending = [root]
-        while pending:
-            current_root = pending.pop()
-            with os.scandir(current_root) as iterator:
-                entries = sorted(iterator, key=lambda item: item.name, reverse=True)
-            for entry in entries:
-                if entry.is_symlink():
-                    paths.append(entry.path)
-                elif entry.is_dir(follow_symlinks=False):
-                    pending.append(entry.path)
-    return paths, missing_roots
+def _cached_target_exists(link_path: str, target: str) -> bool:
+    return open_symlink_inventory(logger).target_exists(
+        link_path, target, _target_exists
+    )
+
+
+def _collect_symlinks(
+    roots: list[str], inventory: SymlinkInventory | None = None
+) -> tuple[list[tuple[str, str]], list[str]]:
+    """Return ``(link_path, target)`` pairs under ``roots``.
+
+    Without ``inventory`` the roots are walked into a throwaway in-memory
+    index, leaving the persistent inventory untouched.
+    """
+    if inventory is None:
+        inventory = SymlinkInventory(logger=logger)
+        try:
+            return _collect_symlinks(roots, inventory)
+        finally:
+            inventory.close()
+    stats = inventory.refresh(roots)
+    return inventory.links(roots), stats["missing_roots"]
+
+
+def _collect_symlink_paths(
+    roots: list[str], inventory: SymlinkInventory | None = None
+) -> tuple[list[str], list[str]]:
+    links, missing_roots = _collect_symlinks(roots, inventory)
+    return [link_path for link_path, _target in links], missing_roots
 
 
 def _collect_root_migration_moves(
@@ -179,9 +191,10 @@ def repair_symlinks(
             "At least one rewrite rule, preset, or root migration is required."
         )
 
-    symlink_paths, missing_roots = _collect_symlink_paths(resolved_roots)
+    inventory = open_symlink_inventory(logger)
+    symlinks, missing_roots = _collect_symlinks(resolved_roots, inventory)
     root_moves, missing_migration_roots = _collect_root_migration_moves(migrations)
-    total_items = len(symlink_paths) + len(root_moves)
+    total_items = len(symlinks) + len(root_moves)
     report: dict[str, Any] = {
         "dry_run": dry_run,
         "roots": resolved_roots,
@@ -191,7 +204,7 @@ def repair_symlinks(
             for migration in migrations
         ],
         "missing_migration_roots": missing_migration_roots,
-        "scanned_symlinks": len(symlink_paths),
+        "scanned_symlinks": len(symlinks),
         "rules": [
             {"from_prefix": rule.from_prefix, "to_prefix": rule.to_prefix}
             for rule in rules
@@ -226,14 +239,15 @@ def repair_symlinks(
 
     changes_for_backup: list[dict[str, str]] = []
     processed_items = 0
-    for link_path in symlink_paths:
+    for link_path, old_target in symlinks:
         try:
-            old_target = os.readlink(link_path)
             new_target, matched_rule = _rewrite_target(old_target, rules)
             if not matched_rule or old_target == new_target:
                 report["skipped_unchanged"] += 1
                 continue
-            if not include_broken and not _target_exists(link_path, old_target):
+            if not include_broken and not inventory.target_exists(
+                link_path, old_target, _target_exists
+            ):
                 report["skipped_nonexistent_target"] += 1
                 continue
 
@@ -255,6 +269,8 @@ def repair_symlinks(
                 }
             )
             if not dry_run:
+                if os.readlink(link_path) != old_target:
+                    raise RuntimeError("Symlink changed since the inventory scan.")
                 os.unlink(link_path)
                 os.symlink(new_target, link_path)
             report["changed"] += 1
@@ -405,8 +421,11 @@ def backup_symlink_manifest(
         raise ValueError("backup_path is required.")
 
     resolved_roots = roots or default_symlink_roots()
-    symlink_paths, missing_roots = _collect_symlink_paths(resolved_roots)
-    total_symlinks = len(symlink_paths)
+    # A plain catalog (no target checks) is an exact snapshot and does not
+    # need the persistent inventory.
+    inventory = open_symlink_inventory(logger) if check_targets else None
+    symlinks, missing_roots = _collect_symlinks(resolved_roots, inventory)
+    total_symlinks = len(symlinks)
 
     if progress_callback:
         try:
@@ -426,10 +445,13 @@ def backup_symlink_manifest(
     skipped_broken = 0
 
     processed_symlinks = 0
-    for link_path in symlink_paths:
+    for link_path, target in symlinks:
         try:
-            target = os.readlink(link_path)
-            target_exists = _target_exists(link_path, target) if check_targets else None
+            target_exists = (
+                inventory.target_exists(link_path, target, _target_exists)
+                if check_targets
+                else None
+            )
             if check_targets and not include_broken and not target_exists:
                 skipped_broken += 1
                 continue
@@ -476,7 +498,7 @@ def backup_symlink_manifest(
         "backup_manifest": destination,
         "roots": resolved_roots,
         "missing_roots": missing_roots,
-        "scanned_symlinks": len(symlink_paths),
+        "scanned_symlinks": len(symlinks),
         "recorded_entries": len(entries),
         "skipped_broken": skipped_broken,
         "errors": errors,
@@ -506,6 +528,43 @@ def backup_symlink_manifest(
     return report
 
 
+def _refresh_manifest_roots(
+    manifest: dict[str, Any],
+) -> tuple[SymlinkInventory | None, tuple[str, ...]]:
+    """Refresh the inventory for a manifest's roots; return it and indexed prefixes."""
+    roots = [
+        root.strip()
+        for root in manifest.get("roots") or []
+        if isinstance(root, str) and root.strip()
+    ]
+    if not roots:
+        return None, ()
+    inventory = open_symlink_inventory(logger)
+    missing = set(inventory.refresh(roots)["missing_roots"])
+    return inventory, tuple(
+        f"{os.path.normpath(root).rstrip('/')}/"
+        for root in roots
+        if os.path.normpath(root) not in missing
+    )
+
+
+def _current_link_state(
+    link_path: str,
+    inventory: SymlinkInventory | None,
+    indexed_prefixes: tuple[str, ...],
+) -> tuple[bool, str | None]:
+    """Return ``(path_exists, symlink_target)`` using the index when it covers the path."""
+    if inventory is not None and link_path.startswith(indexed_prefixes):
+        indexed_target = inventory.lookup(link_path)
+        if indexed_target is not None:
+            return True, indexed_target
+    if not os.path.lexists(link_path):
+        return False, None
+    if os.path.islink(link_path):
+        return True, os.readlink(link_path)
+    return True, None
+
+
 def restore_symlink_manifest(
     manifest_path: str,
     dry_run: bool = True,
@@ -565,7 +624,7 @@ def restore_symlink_manifest(
             continue
 
         try:
-            if not restore_broken and not _target_exists(link_path, target):
+            if not restore_broken and not _cached_target_exists(link_path, target):
                 report["skipped_nonexistent_target"] += 1
                 continue
 
@@ -674,6 +733,7 @@ def preview_symlink_manifest_restore(
     }
 
     normalized_sample_limit = max(0, int(sample_limit))
+    inventory, indexed_prefixes = _refresh_manifest_roots(manifest)
     for entry in entries:
         link_path = (
             (entry.get("link_path") or "").strip() if isinstance(entry, dict) else ""
@@ -684,8 +744,7 @@ def preview_symlink_manifest_restore(
             continue
 
         try:
-            target_exists = _target_exists(link_path, target)
-            if not restore_broken and not target_exists:
+            if not restore_broken and not _cached_target_exists(link_path, target):
                 report["projected_skipped_nonexistent_target"] += 1
                 if len(report["sample_changes"]) < normalized_sample_limit:
                     report["sample_changes"].append(
@@ -697,22 +756,21 @@ def preview_symlink_manifest_restore(
                     )
                 continue
 
-            if os.path.lexists(link_path):
-                if os.path.islink(link_path):
-                    current_target = os.readlink(link_path)
-                    if current_target == target:
-                        report["projected_skipped_unchanged"] += 1
-                        if len(report["sample_changes"]) < normalized_sample_limit:
-                            report["sample_changes"].append(
-                                {
-                                    "action": "skip_unchanged",
-                                    "link_path": link_path,
-                                    "target": target,
-                                }
-                            )
-                        continue
-                else:
-                    current_target = None
+            link_exists, current_target = _current_link_state(
+                link_path, inventory, indexed_prefixes
+            )
+            if link_exists:
+                if current_target == target:
+                    report["projected_skipped_unchanged"] += 1
+                    if len(report["sample_changes"]) < normalized_sample_limit:
+                        report["sample_changes"].append(
+                            {
+                                "action": "skip_unchanged",
+                                "link_path": link_path,
+                                "target": target,
+                            }
+                        )
+                    continue
 
                 if not overwrite_existing:
                     report["projected_skipped_existing"] += 1
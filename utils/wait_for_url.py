@@ -1,5 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
-import requests, time
+import requests, threading, time
+
+WAIT_DEADLINE_SECONDS = 600
+_INITIAL_BACKOFF_SECONDS = 0.25
+_MAX_BACKOFF_SECONDS = 2.0
+_MAX_PROBE_WORKERS = 8
+_readiness_changed = threading.Condition()
+_readiness_generation = 0
+_ready_services = set()
+
+
+def notify_readiness_changed():
+    """Wake every pending ``wait_for_urls`` so it probes again immediately."""
+    global _readiness_generation
+    with _readiness_changed:
+        _readiness_generation += 1
+        _readiness_changed.notify_all()
+
+
+def record_service_readiness(process_name, ready):
+    """Notify waiters when ``process_name`` first becomes ready."""
+    with _readiness_changed:
+        if not ready:
+            _ready_services.discard(process_name)
+            return
+        if process_name in _ready_services:
+            return
+        _ready_services.add(process_name)
+    notify_readiness_changed()
+
+
+def readiness_generation():
+    """Return a counter that advances on every readiness notification."""
+    with _readiness_changed:
+        return _readiness_generation
+
+
+def wait_for_readiness_change(generation, timeout):
+    """Sleep up to ``timeout``; return True when woken by a notification."""
+    with _readiness_changed:
+        return _readiness_changed.wait_for(
+            lambda: _readiness_generation != generation, timeout
+        )
 
 
 def _looks_like_webdav_wait(wait_url):
@@ -83,81 +126,116 @@ def _response_is_ready(response, method, wait_entry=None, logger=None, wait_url=
     return True
 
 
+def _probe_wait_entry(wait_entry, logger):
+    wait_url = wait_entry["url"]
+    auth = wait_entry.get("auth")
+    method, headers = _resolve_probe(wait_entry)
+    timeout = _resolve_timeout(wait_entry)
+    try:
+        if auth:
+            response = requests.request(
+                method,
+                wait_url,
+                auth=(auth["user"], auth["password"]),
+                headers=headers,
+                timeout=timeout,
+            )
+        else:
+            response = requests.request(
+                method, wait_url, headers=headers, timeout=timeout
+            )
+    except requests.RequestException as e:
+        logger.debug("Waiting for %s via %s: %s", wait_url, method, e)
+        return False
+
+    if not _response_is_ready(response, method, wait_entry, logger, wait_url):
+        logger.debug(
+            "Received status code %s from %s %s while waiting for %s.",
+            response.status_code,
+            method,
+            wait_url,
+            wait_url,
+        )
+        return False
+
+    expected_json_path = wait_entry.get("expected_json_path")
+    if expected_json_path:
+        logger.info(
+            "%s is accessible with %s via %s and contains JSON path %s.",
+            wait_url,
+            response.status_code,
+            method,
+            expected_json_path,
+        )
+    else:
+        logger.info(
+            "%s is accessible with %s via %s.",
+            wait_url,
+            response.status_code,
+            method,
+        )
+    return True
+
+
 def wait_for_urls(wait_entries, process_name, logger, shutdown_requested):
-    start_time = time.time()
+    """Block until every wait entry is reachable or the shared deadline passes.
+
+    Pending entries are probed concurrently each round. Between rounds the
+    wait backs off from 0.25s to at most 2s and is cut short by
+    ``notify_readiness_changed``.
+    """
+    deadline = time.time() + WAIT_DEADLINE_SECONDS
     if isinstance(wait_entries, str):
         wait_entries = [{"url": wait_entries}]
     elif isinstance(wait_entries, dict):
         wait_entries = [wait_entries]
 
-    for wait_entry in wait_entries:
-        if not isinstance(wait_entry, dict):
-            continue
-        wait_url = wait_entry.get("url")
-        if not wait_url:
-            continue
-        auth = wait_entry.get("auth")
-        method, headers = _resolve_probe(wait_entry)
-        timeout = _resolve_timeout(wait_entry)
-
+    pending = [
+        wait_entry
+        for wait_entry in wait_entries
+        if isinstance(wait_entry, dict) and wait_entry.get("url")
+    ]
+    if not pending:
+        return True, None
+    for wait_entry in pending:
         logger.info(
             "Waiting to start %s until %s is accessible.",
             process_name,
-            wait_url,
+            wait_entry["url"],
         )
 
-        sleep_s = 5
-        while time.time() - start_time < 600:
+    backoff = _INITIAL_BACKOFF_SECONDS
+    with ThreadPoolExecutor(
+        max_workers=min(len(pending), _MAX_PROBE_WORKERS),
+        thread_name_prefix="wait-for-url",
+    ) as executor:
+        while True:
             if shutdown_requested():
-                logger.info("Shutdown requested; skipping wait for %s.", wait_url)
+                logger.info(
+                    "Shutdown requested; skipping wait for %s.",
+                    ", ".join(wait_entry["url"] for wait_entry in pending),
+                )
                 return False, "Shutdown requested"
-            try:
-                if auth:
-                    response = requests.request(
-                        method,
-                        wait_url,
-                        auth=(auth["user"], auth["password"]),
-                        headers=headers,
-                        timeout=timeout,
-                    )
-                else:
-                    response = requests.request(
-                        method, wait_url, headers=headers, timeout=timeout
-                    )
-
-                if _response_is_ready(response, method, wait_entry, logger, wait_url):
-                    expected_json_path = wait_entry.get("expected_json_path")
-                    if expected_json_path:
-                        logger.info(
-                            "%s is accessible with %s via %s and contains JSON path %s.",
-                            wait_url,
-                            response.status_code,
-                            method,
-                            expected_json_path,
-                        )
-                    else:
-                        logger.info(
-                            "%s is accessible with %s via %s.",
-                            wait_url,
-                            response.status_code,
-                            method,
-                        )
-                    break
-
-                logger.debug(
-                    "Received status code %s from %s %s while waiting for %s.",
-                    response.status_code,
-                    method,
-                    wait_url,
-                    wait_url,
+            generation = readiness_generation()
+            ready = list(
+                executor.map(
+                    lambda wait_entry: _probe_wait_entry(wait_entry, logger), pending
                 )
-            except requests.RequestException as e:
-                logger.debug("Waiting for %s via %s: %s", wait_url, method, e)
-            time.sleep(sleep_s)
-            sleep_s = min(60, int(sleep_s * 1.5))
-        else:
-            raise RuntimeError(
-                f"Timeout: {wait_url} is not accessible after 600 seconds."
             )
-
-    return True, None
+            pending = [
+                wait_entry
+                for wait_entry, is_ready in zip(pending, ready)
+                if not is_ready
+            ]
+            if not pending:
+                return True, None
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise RuntimeError(
+                    f"Timeout: {pending[0]['url']} is not accessible after "
+                    f"{WAIT_DEADLINE_SECONDS} seconds."
+                )
+            if wait_for_readiness_change(generation, min(backoff, remaining)):
+                backoff = _INITIAL_BACKOFF_SECONDS
+            else:
+                backoff = min(_MAX_BACKOFF_SECONDS, backoff * 1.5)